@@ -1,47 +1,65 @@
 """High-level helpers for Soniox transcription workflows."""
 
-from .api import (
-    DEFAULT_BASE_URL,
-    DEFAULT_POLL_INTERVAL,
-    SonioxClient,
-    SonioxError,
-    require_api_key,
-)
-from .transcriber import (
-    transcribe_audio,
-    transcribe_audio_file,
-    transcribe_audio_url,
-    transcribe_to_file,
-)
-from .realtime import (
-    DEFAULT_REALTIME_MODEL,
-    RealTimeDependencyError,
-    RealTimeResult,
-    RealTimeUpdate,
-    SONIOX_REALTIME_URL,
-    SUPPORTED_REALTIME_MODELS,
-    build_realtime_config,
-    render_tokens as render_realtime_tokens,
-    run_realtime_session,
-)
-from .subtitles import (
-    SubtitleConfig,
-    SubtitleEntry,
-    extract_tokens,
-    render_segments,
-    srt,
-    tokens_to_subtitle_segments,
-    write_srt_file,
-)
-from .translation import (
-    LLM_API_KEY_ENV,
-    LLM_BASE_URL_ENV,
-    LLM_MODEL_ENV,
-    DEFAULT_MODEL_ENV,
-    translate_entries,
-    translate_entries_with_review,
-    TranslationStats,
-)
+from importlib import import_module
+from typing import Any, Dict, Tuple
+
+# Public names resolve on first access (PEP 562), so importing the package
+# does not pull in requests, openai or websockets until they are needed.
+_LAZY_EXPORTS: Dict[str, Tuple[str, str]] = {
+    "DEFAULT_BASE_URL": ("api", "DEFAULT_BASE_URL"),
+    "DEFAULT_POLL_INTERVAL": ("api", "DEFAULT_POLL_INTERVAL"),
+    "SonioxClient": ("api", "SonioxClient"),
+    "SonioxError": ("api", "SonioxError"),
+    "require_api_key": ("api", "require_api_key"),
+    "transcribe_audio": ("transcriber", "transcribe_audio"),
+    "transcribe_audio_file": ("transcriber", "transcribe_audio_file"),
+    "transcribe_audio_url": ("transcriber", "transcribe_audio_url"),
+    "transcribe_many": ("transcriber", "transcribe_many"),
+    "transcribe_many_to_files": ("transcriber", "transcribe_many_to_files"),
+    "transcribe_to_file": ("transcriber", "transcribe_to_file"),
+    "DEFAULT_REALTIME_MODEL": ("realtime", "DEFAULT_REALTIME_MODEL"),
+    "RealTimeDependencyError": ("realtime", "RealTimeDependencyError"),
+    "RealTimeResult": ("realtime", "RealTimeResult"),
+    "RealTimeUpdate": ("realtime", "RealTimeUpdate"),
+    "SONIOX_REALTIME_URL": ("realtime", "SONIOX_REALTIME_URL"),
+    "SUPPORTED_REALTIME_MODELS": ("realtime", "SUPPORTED_REALTIME_MODELS"),
+    "arun_realtime_session": ("realtime", "arun_realtime_session"),
+    "build_realtime_config": ("realtime", "build_realtime_config"),
+    "render_realtime_tokens": ("realtime", "render_tokens"),
+    "run_realtime_session": ("realtime", "run_realtime_session"),
+    "SubtitleConfig": ("subtitles", "SubtitleConfig"),
+    "SubtitleEntry": ("subtitles", "SubtitleEntry"),
+    "extract_tokens": ("subtitles", "extract_tokens"),
+    "iter_render_segments": ("subtitles", "iter_render_segments"),
+    "load_tokens": ("subtitles", "load_tokens"),
+    "render_segments": ("subtitles", "render_segments"),
+    "srt": ("subtitles", "srt"),
+    "tokens_to_subtitle_segments": ("subtitles", "tokens_to_subtitle_segments"),
+    "write_srt_file": ("subtitles", "write_srt_file"),
+    "LLM_API_KEY_ENV": ("translation", "LLM_API_KEY_ENV"),
+    "LLM_BASE_URL_ENV": ("translation", "LLM_BASE_URL_ENV"),
+    "LLM_MODEL_ENV": ("translation", "LLM_MODEL_ENV"),
+    "DEFAULT_MODEL_ENV": ("translation", "DEFAULT_MODEL_ENV"),
+    "atranslate_entries": ("translation", "atranslate_entries"),
+    "translate_entries": ("translation", "translate_entries"),
+    "translate_entries_with_review": ("translation", "translate_entries_with_review"),
+    "TranslationStats": ("translation", "TranslationStats"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name, attribute = _LAZY_EXPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(f".{module_name}", __name__), attribute)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list:
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
+
 
 __all__ = [
     "DEFAULT_BASE_URL",
@@ -54,10 +72,14 @@ __all__ = [
     "SubtitleEntry",
     "require_api_key",
     "extract_tokens",
+    "iter_render_segments",
+    "load_tokens",
     "render_realtime_tokens",
     "render_segments",
     "srt",
     "run_realtime_session",
+    "arun_realtime_session",
+    "atranslate_entries",
     "translate_entries",
     "translate_entries_with_review",
     "TranslationStats",
@@ -65,6 +87,8 @@ __all__ = [
     "transcribe_audio",
     "transcribe_audio_file",
     "transcribe_audio_url",
+    "transcribe_many",
+    "transcribe_many_to_files",
     "transcribe_to_file",
     "tokens_to_subtitle_segments",
     "RealTimeDependencyError",
@@ -0,0 +1,34 @@
+"""File helpers shared by the transcript and LLM response caches."""
+
+from __future__ import annotations
+
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from . import _json
+
+
+def read_cached_json(path: Path, ttl: Optional[float]) -> Optional[Dict[str, Any]]:
+    """Decode ``path``; ``None`` if it is missing, invalid or older than ``ttl`` seconds."""
+    try:
+        if ttl is not None and time.time() - path.stat().st_mtime > ttl:
+            return None
+        return _json.loads(path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def write_atomic(path: Path, data: bytes) -> None:
+    """Write ``data`` to ``path`` via a temporary file so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False
+    ) as handle:
+        handle.write(data)
+    os.replace(handle.name, path)
+
+
+__all__ = ["read_cached_json", "write_atomic"]
@@ -0,0 +1,60 @@
+"""JSON helpers that use orjson when it is installed."""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+from typing import Any
+
+try:  # Optional dependency for faster JSON encoding and decoding
+    import orjson
+except ModuleNotFoundError:  # pragma: no cover - stdlib json is used instead
+    orjson = None
+
+# Files at least this large are parsed straight from a read-only memory map.
+MMAP_MIN_BYTES = 10 * 1024 * 1024
+
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers can catch
+# this single type regardless of which backend is active.
+JSONDecodeError = json.JSONDecodeError
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """Decode JSON from text or UTF-8 bytes."""
+    if orjson is not None:
+        return orjson.loads(data)
+    if isinstance(data, memoryview):
+        data = data.tobytes()
+    return json.loads(data)
+
+
+def load_file(path: str | os.PathLike) -> Any:
+    """Decode a JSON file.
+
+    With orjson, large files are parsed from a memory map so the document is
+    never copied into a separate bytes object.
+    """
+    with open(path, "rb") as handle:
+        if orjson is not None and os.fstat(handle.fileno()).st_size >= MMAP_MIN_BYTES:
+            with mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        return loads(handle.read())
+
+
+def dumps(obj: Any) -> str:
+    """Encode ``obj`` as compact JSON text."""
+    if orjson is not None:
+        return orjson.dumps(obj).decode("utf-8")
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def dumps_indented(obj: Any) -> bytes:
+    """Encode ``obj`` as UTF-8 JSON indented by two spaces."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+__all__ = ["JSONDecodeError", "MMAP_MIN_BYTES", "dumps", "dumps_indented", "load_file", "loads"]
@@ -0,0 +1,171 @@
+"""Response cache for deterministic chat completion requests."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Optional, Tuple
+
+from ._files import read_cached_json, write_atomic
+
+LLM_CACHE_ENV = "SONIOXSRT_LLM_CACHE"
+LLM_CACHE_TTL_ENV = "SONIOXSRT_LLM_CACHE_TTL"
+DEFAULT_LLM_CACHE_DIR = Path.home() / ".cache" / "sonioxsrt" / "llm"
+DEFAULT_LLM_CACHE_TTL = 24 * 60 * 60.0
+
+_DISABLED_VALUES = {"", "0", "false", "no", "off"}
+_DEFAULT_DIR_VALUES = {"1", "true", "yes", "on"}
+
+
+class LLMCache:
+    """Store completion results in memory and, optionally, one JSON file per key.
+
+    Entries older than ``ttl`` seconds are ignored (``None`` keeps them forever).
+    """
+
+    def __init__(
+        self,
+        directory: Optional[Path | str] = None,
+        ttl: Optional[float] = DEFAULT_LLM_CACHE_TTL,
+    ) -> None:
+        self.directory = Path(directory).expanduser() if directory is not None else None
+        self.ttl = ttl
+        self._memory: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model: Any, messages: Any, temperature: Any) -> str:
+        payload = json.dumps(
+            {"model": model, "messages": messages, "temperature": temperature},
+            sort_keys=True,
+            ensure_ascii=False,
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._memory.get(key)
+        if entry is not None:
+            stored_at, cached = entry
+            if self.ttl is None or time.time() - stored_at <= self.ttl:
+                return cached
+        if self.directory is None:
+            return None
+        path = self.directory / f"{key}.json"
+        cached = read_cached_json(path, self.ttl)
+        if cached is not None:
+            try:
+                stored_at = path.stat().st_mtime
+            except OSError:  # pragma: no cover - removed after the read
+                stored_at = time.time()
+            with self._lock:
+                self._memory[key] = (stored_at, cached)
+        return cached
+
+    def set(self, key: str, value: Dict[str, Any]) -> None:
+        with self._lock:
+            self._memory[key] = (time.time(), value)
+        if self.directory is not None:
+            try:
+                write_atomic(
+                    self.directory / f"{key}.json",
+                    json.dumps(value, ensure_ascii=False).encode("utf-8"),
+                )
+            except OSError:  # pragma: no cover - caching is best effort
+                pass
+
+
+class CachingCompletions:
+    """Wrap a ``chat.completions`` object and serve repeated requests from a cache.
+
+    Cached responses expose the same ``choices[0].message.content`` shape with
+    ``usage`` set to ``None`` (no tokens were spent) and ``cached`` set to True.
+    Streamed misses are drained into that shape too, so they can be stored.
+    """
+
+    def __init__(self, completions_api: Any, cache: LLMCache) -> None:
+        self._completions_api = completions_api
+        self.cache = cache
+
+    def create(self, **kwargs: Any) -> Any:
+        key = LLMCache.key(
+            kwargs.get("model"), kwargs.get("messages"), kwargs.get("temperature", 0)
+        )
+        cached = self.cache.get(key)
+        if cached is not None:
+            message = SimpleNamespace(content=cached.get("content"))
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=message)], usage=None, cached=True
+            )
+
+        response = self._completions_api.create(**kwargs)
+        if kwargs.get("stream") and not hasattr(response, "choices"):
+            # Deferred: translation imports this module.
+            from .translation import _collect_stream
+
+            response = _collect_stream(response)
+        try:
+            content = response.choices[0].message.content
+        except (AttributeError, IndexError):
+            return response
+        if content:
+            self.cache.set(key, {"content": content})
+        return response
+
+
+def _cache_setting(env_var: str, default_dir: Path) -> Tuple[bool, Optional[Path]]:
+    """Read a cache switch from ``env_var`` as ``(enabled, directory)``.
+
+    ``1``/``true``/``yes``/``on`` use ``default_dir``, ``memory`` keeps
+    results for the current process only, and any other value is treated as
+    the cache directory.
+    """
+    value = os.environ.get(env_var, "").strip()
+    lowered = value.lower()
+    if lowered in _DISABLED_VALUES:
+        return False, None
+    if lowered == "memory":
+        return True, None
+    if lowered in _DEFAULT_DIR_VALUES:
+        return True, default_dir
+    return True, Path(value)
+
+
+def _ttl_from_env() -> Optional[float]:
+    value = os.environ.get(LLM_CACHE_TTL_ENV, "").strip().lower()
+    if not value:
+        return DEFAULT_LLM_CACHE_TTL
+    if value in {"none", "never", "0"}:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return DEFAULT_LLM_CACHE_TTL
+
+
+def cache_from_env() -> Optional[LLMCache]:
+    """Build the cache selected by ``SONIOXSRT_LLM_CACHE``, if any.
+
+    ``SONIOXSRT_LLM_CACHE_TTL`` sets the entry lifetime in seconds (default one
+    day); ``0``/``none``/``never`` keep entries forever.
+    """
+    enabled, directory = _cache_setting(LLM_CACHE_ENV, DEFAULT_LLM_CACHE_DIR)
+    if not enabled:
+        return None
+    return LLMCache(directory, ttl=_ttl_from_env())
+
+
+__all__ = [
+    "CachingCompletions",
+    "DEFAULT_LLM_CACHE_DIR",
+    "DEFAULT_LLM_CACHE_TTL",
+    "LLMCache",
+    "LLM_CACHE_ENV",
+    "LLM_CACHE_TTL_ENV",
+    "cache_from_env",
+]
@@ -0,0 +1,82 @@
+"""Retry helpers with exponential backoff and jitter for transient failures."""
+
+from __future__ import annotations
+
+import logging
+import random
+import time
+from typing import Callable, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_RETRY_ATTEMPTS = 5
+DEFAULT_RETRY_INITIAL = 0.5
+DEFAULT_RETRY_MAX_DELAY = 30.0
+
+LOGGER = logging.getLogger(__name__)
+
+
+def backoff_delays(
+    attempts: int = DEFAULT_RETRY_ATTEMPTS,
+    *,
+    initial: float = DEFAULT_RETRY_INITIAL,
+    max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+) -> Iterator[float]:
+    """Yield ``attempts - 1`` randomised waits for the retries after a first try.
+
+    Each wait is drawn uniformly from ``[0, min(max_delay, initial * 2**n)]``
+    ("full jitter"), so clients that failed together do not retry together.
+    """
+    for retry in range(max(0, attempts - 1)):
+        yield random.uniform(0, min(max_delay, initial * 2**retry))
+
+
+def retry_call(
+    func: Callable[[], T],
+    *,
+    should_retry: Callable[[BaseException], bool],
+    attempts: int = DEFAULT_RETRY_ATTEMPTS,
+    initial: float = DEFAULT_RETRY_INITIAL,
+    max_delay: float = DEFAULT_RETRY_MAX_DELAY,
+    delay_hint: Optional[Callable[[BaseException], Optional[float]]] = None,
+    description: str = "request",
+) -> T:
+    """Call ``func`` until it succeeds, retrying exceptions ``should_retry`` accepts.
+
+    ``delay_hint`` may return a server-provided wait (e.g. ``Retry-After``)
+    that replaces the computed backoff for that retry. The last exception is
+    re-raised once ``attempts`` calls have failed.
+    """
+    delays = backoff_delays(attempts, initial=initial, max_delay=max_delay)
+    attempt = 1
+    while True:
+        try:
+            return func()
+        except Exception as exc:
+            if not should_retry(exc):
+                raise
+            delay = next(delays, None)
+            if delay is None:
+                raise
+            hinted = delay_hint(exc) if delay_hint is not None else None
+            if hinted is not None:
+                delay = hinted
+            LOGGER.warning(
+                "%s failed (%s); retrying in %.1fs (%d/%d)",
+                description,
+                exc.__class__.__name__,
+                delay,
+                attempt,
+                attempts - 1,
+            )
+            time.sleep(delay)
+            attempt += 1
+
+
+__all__ = [
+    "DEFAULT_RETRY_ATTEMPTS",
+    "DEFAULT_RETRY_INITIAL",
+    "DEFAULT_RETRY_MAX_DELAY",
+    "backoff_delays",
+    "retry_call",
+]
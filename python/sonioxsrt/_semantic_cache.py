@@ -0,0 +1,248 @@
+"""Similarity cache for chat completion requests that differ only slightly."""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import math
+import re
+import threading
+from operator import mul
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from ._files import read_cached_json, write_atomic
+from ._llm_cache import _cache_setting
+
+SEMANTIC_CACHE_ENV = "SONIOXSRT_SEMANTIC_CACHE"
+DEFAULT_SEMANTIC_CACHE_DIR = Path.home() / ".cache" / "sonioxsrt" / "semantic"
+DEFAULT_SIMILARITY_THRESHOLD = 0.97
+DEFAULT_EMBEDDING_MODEL = "text-embedding-3-small"
+
+_NUMBERED_LINE = re.compile(r"(\d+)\s")
+
+LOGGER = logging.getLogger(__name__)
+
+Embedder = Callable[[str], Sequence[float]]
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    norm = math.sqrt(sum(map(mul, vector, vector)))
+    if not norm:
+        return [0.0] * len(vector)
+    return [value / norm for value in vector]
+
+
+def _split_request(kwargs: Dict[str, Any]) -> Tuple[str, str]:
+    """Return ``(bucket, text)`` for a request.
+
+    Only the numbered subtitle lines of the last message are compared by
+    similarity. Everything else, including which line numbers are present,
+    must match exactly and forms the bucket key, so a hit always answers the
+    same lines under the same instructions.
+    """
+    messages = kwargs.get("messages") or []
+    content = str(messages[-1].get("content") or "") if messages else ""
+    numbered: List[str] = []
+    indices: List[str] = []
+    other: List[str] = []
+    for line in content.splitlines():
+        match = _NUMBERED_LINE.match(line)
+        if match:
+            indices.append(match.group(1))
+            numbered.append(line)
+        else:
+            other.append(line)
+    payload = json.dumps(
+        {
+            "model": kwargs.get("model"),
+            "temperature": kwargs.get("temperature", 0),
+            "messages": messages[:-1],
+            "instructions": other,
+            "indices": indices,
+        },
+        sort_keys=True,
+        ensure_ascii=False,
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest(), "\n".join(numbered)
+
+
+class SemanticLLMCache:
+    """Serve stored responses for requests whose subtitle text is near-identical.
+
+    Embeddings are compared by cosine similarity within a bucket of otherwise
+    identical requests; a stored response is reused when the best match
+    reaches ``threshold``.
+    """
+
+    def __init__(
+        self,
+        embed: Embedder,
+        *,
+        threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        directory: Optional[Path | str] = None,
+    ) -> None:
+        self.embed = embed
+        self.threshold = threshold
+        self.directory = Path(directory).expanduser() if directory is not None else None
+        self._buckets: Dict[str, List[Tuple[List[float], str]]] = {}
+        self._lock = threading.Lock()
+
+    def _bucket(self, bucket: str) -> List[Tuple[List[float], str]]:
+        with self._lock:
+            items = self._buckets.get(bucket)
+            if items is None:
+                items = []
+                if self.directory is not None:
+                    stored = read_cached_json(self.directory / f"{bucket}.json", None)
+                    for item in (stored or {}).get("items", []):
+                        items.append((item["embedding"], item["content"]))
+                self._buckets[bucket] = items
+            return items
+
+    def lookup(self, bucket: str, vector: List[float]) -> Optional[str]:
+        best_score = self.threshold
+        best: Optional[str] = None
+        for stored, content in self._bucket(bucket):
+            if len(stored) != len(vector):
+                continue
+            score = sum(map(mul, stored, vector))
+            if score >= best_score:
+                best_score, best = score, content
+        return best
+
+    def add(self, bucket: str, vector: List[float], content: str) -> None:
+        items = self._bucket(bucket)
+        with self._lock:
+            items.append((vector, content))
+            snapshot = [{"embedding": stored, "content": text} for stored, text in items]
+        if self.directory is not None:
+            try:
+                write_atomic(
+                    self.directory / f"{bucket}.json",
+                    json.dumps({"items": snapshot}).encode("utf-8"),
+                )
+            except OSError:  # pragma: no cover - caching is best effort
+                pass
+
+
+class SemanticCachingCompletions:
+    """Wrap a ``chat.completions`` object with a :class:`SemanticLLMCache`.
+
+    Hits have the same shape as :class:`~sonioxsrt._llm_cache.CachingCompletions`
+    hits: ``usage`` is ``None`` and ``cached`` is True. Streaming requests are
+    passed through untouched.
+
+    The cache turns itself off after the first failed embedding (e.g. an
+    endpoint without an embeddings route) and requests go straight to
+    ``completions_api`` from then on. A request's embedding is kept until its
+    completion succeeds, so retries of the same request do not embed again.
+    """
+
+    def __init__(self, completions_api: Any, cache: SemanticLLMCache) -> None:
+        self._completions_api = completions_api
+        self.cache = cache
+        self.enabled = True
+        self._pending: Dict[str, List[float]] = {}
+        self._lock = threading.Lock()
+
+    def _vector(self, text: str) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._pending.get(text)
+        if vector is not None:
+            return vector
+        try:
+            vector = _normalize(self.cache.embed(text))
+        except Exception as exc:
+            if self.enabled:
+                self.enabled = False
+                LOGGER.warning("Embedding failed (%s); semantic cache disabled", exc)
+            return None
+        with self._lock:
+            self._pending[text] = vector
+        return vector
+
+    def create(self, **kwargs: Any) -> Any:
+        if not self.enabled or kwargs.get("stream"):
+            return self._completions_api.create(**kwargs)
+        bucket, text = _split_request(kwargs)
+        if not text:
+            return self._completions_api.create(**kwargs)
+
+        vector = self._vector(text)
+        if vector is None:
+            return self._completions_api.create(**kwargs)
+        cached = self.cache.lookup(bucket, vector)
+        if cached is not None:
+            with self._lock:
+                self._pending.pop(text, None)
+            message = SimpleNamespace(content=cached)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=message)], usage=None, cached=True
+            )
+
+        response = self._completions_api.create(**kwargs)
+        with self._lock:
+            self._pending.pop(text, None)
+        try:
+            content = response.choices[0].message.content
+        except (AttributeError, IndexError):
+            return response
+        if content:
+            self.cache.add(bucket, vector, content)
+        return response
+
+
+def openai_embedder(
+    client: Any,
+    model: str = DEFAULT_EMBEDDING_MODEL,
+    *,
+    on_usage: Optional[Callable[[Any], None]] = None,
+) -> Optional[Embedder]:
+    """Return an embedding function backed by ``client.embeddings``, if it has one.
+
+    ``on_usage`` receives the ``usage`` block of every embeddings response.
+    """
+    embeddings = getattr(client, "embeddings", None)
+    if embeddings is None or not hasattr(embeddings, "create"):
+        return None
+
+    def embed(text: str) -> Sequence[float]:
+        response = embeddings.create(model=model, input=text)
+        if on_usage is not None:
+            on_usage(getattr(response, "usage", None))
+        return response.data[0].embedding
+
+    return embed
+
+
+def semantic_cache_from_env(
+    client: Any, *, on_usage: Optional[Callable[[Any], None]] = None
+) -> Optional[SemanticLLMCache]:
+    """Build the cache selected by ``SONIOXSRT_SEMANTIC_CACHE``, if any.
+
+    Accepts the same values as ``SONIOXSRT_LLM_CACHE``. The cache stays off
+    when ``client`` cannot compute embeddings; ``on_usage`` is passed to
+    :func:`openai_embedder`.
+    """
+    enabled, directory = _cache_setting(SEMANTIC_CACHE_ENV, DEFAULT_SEMANTIC_CACHE_DIR)
+    if not enabled:
+        return None
+    embed = openai_embedder(client, on_usage=on_usage)
+    if embed is None:
+        return None
+    return SemanticLLMCache(embed, directory=directory)
+
+
+__all__ = [
+    "DEFAULT_EMBEDDING_MODEL",
+    "DEFAULT_SEMANTIC_CACHE_DIR",
+    "DEFAULT_SIMILARITY_THRESHOLD",
+    "SEMANTIC_CACHE_ENV",
+    "SemanticCachingCompletions",
+    "SemanticLLMCache",
+    "openai_embedder",
+    "semantic_cache_from_env",
+]
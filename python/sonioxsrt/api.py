@@ -2,53 +2,167 @@
 
 from __future__ import annotations
 
+import gzip
+import hashlib
+import io
+import logging
 import os
+import random
 import time
-from dataclasses import dataclass, field
+import uuid
+from contextlib import contextmanager
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterable, Optional, Sequence
+from typing import (
+    Any,
+    BinaryIO,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+)
+from . import _json
+from ._files import read_cached_json, write_atomic
+from ._retry import backoff_delays
 
 try:  # Optional dependency for loading environment variables from .env files
     from dotenv import load_dotenv
 except ModuleNotFoundError:  # pragma: no cover - handled at runtime if dependency missing
     load_dotenv = None
 
+try:  # Optional dependency for streaming multipart uploads
+    from requests_toolbelt import MultipartEncoder
+except ModuleNotFoundError:  # pragma: no cover - falls back to _MultipartFileStream
+    MultipartEncoder = None
+
+try:  # Optional dependency for incremental transcript parsing
+    import ijson
+except ModuleNotFoundError:  # pragma: no cover - required only for streaming
+    ijson = None
+
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ModuleNotFoundError as exc:  # pragma: no cover
     raise SystemExit(
         "Missing dependency: requests\nInstall it with 'pip install requests' and retry."
     ) from exc
 
 
+LOGGER = logging.getLogger(__name__)
+
 DEFAULT_BASE_URL = "https://api.soniox.com"
 DEFAULT_POLL_INTERVAL = 1.0
+DEFAULT_MAX_POLL_INTERVAL = 30.0
+DEFAULT_POLL_BACKOFF = 2.0
+DEFAULT_POLL_JITTER = 0.5
+DEFAULT_MAX_CONCURRENCY = 8
+STREAM_CHUNK_SIZE = 64 * 1024
+POOL_CONNECTIONS = 32
+POOL_MAXSIZE = 64
+HTTPX_TIMEOUT_SECONDS = 30.0
+HTTPX_CONNECT_TIMEOUT_SECONDS = 5.0
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+GZIP_MIN_REQUEST_BYTES = 4096
+_IDEMPOTENT_METHODS = frozenset({"GET", "DELETE"})
+DEFAULT_TRANSCRIPT_CACHE_DIR = Path.home() / ".cache" / "sonioxsrt" / "transcripts"
 
 
 class SonioxError(Exception):
     """Raised when the Soniox API returns an unexpected status or payload."""
 
 
-def _load_env_file(path: Path) -> None:
-    if load_dotenv is not None:
-        load_dotenv(dotenv_path=path, override=False)
-        return
+def _poll_status(response: Any) -> Optional[str]:
+    """Return the job status from a poll response, raising on failures."""
+    if response.status_code != 200:
+        raise SonioxError(f"Polling failed: {response.text}")
+    payload = response.json()
+    status = payload.get("status")
+    if status == "error":
+        message = payload.get("error_message") or "unknown error"
+        raise SonioxError(f"Transcription failed: {message}")
+    return status
+
+
+async def _get_with_retries_async(http_client: Any, url: str, headers: Dict[str, str]) -> Any:
+    """GET ``url`` on an ``httpx.AsyncClient``, retrying like :class:`_HttpxSession`.
+
+    Returns ``None`` when every attempt timed out, so pollers can start over.
+    """
+    import asyncio
+
+    import httpx
+
+    delays = backoff_delays()
+    while True:
+        try:
+            response = await http_client.get(url, headers=headers)
+        except httpx.TransportError as exc:
+            delay = next(delays, None)
+            if delay is None:
+                if isinstance(exc, httpx.TimeoutException):
+                    return None
+                raise
+            await asyncio.sleep(delay)
+            continue
+        if response.status_code in RETRY_STATUS_CODES:
+            delay = next(delays, None)
+            if delay is not None:
+                await asyncio.sleep(delay)
+                continue
+        return response
+
+
+def _jittered(delay: float, jitter: float) -> float:
+    if not jitter:
+        return delay
+    return delay * (1.0 + jitter * (2.0 * random.random() - 1.0))
+
+
+@lru_cache(maxsize=16)
+def _parse_env_file(path: Path, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """Parse ``KEY=value`` lines once per file version (``mtime_ns`` keys the cache)."""
     try:
         content = path.read_text(encoding="utf-8")
     except OSError:  # pragma: no cover
-        return
+        return ()
+    pairs = []
     for raw_line in content.splitlines():
         line = raw_line.strip()
         if not line or line.startswith("#"):
             continue
-        if "=" not in line:
+        key, sep, value = line.partition("=")
+        if not sep:
             continue
-        key, value = line.split("=", 1)
-        key = key.strip()
-        value = value.strip().strip('"').strip("'")
+        pairs.append((key.strip(), value.strip().strip('"').strip("'")))
+    return tuple(pairs)
+
+
+def _load_env_file(path: Path) -> None:
+    if load_dotenv is not None:
+        load_dotenv(dotenv_path=path, override=False)
+        return
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except OSError:  # pragma: no cover
+        return
+    for key, value in _parse_env_file(path, mtime_ns):
         os.environ.setdefault(key, value)
 
 
+@lru_cache(maxsize=1)
+def _package_env_paths() -> Tuple[Path, ...]:
+    package_root = Path(__file__).resolve().parents[1]
+    return (
+        (package_root / ".env").resolve(),
+        (package_root.parent / ".env").resolve(),
+    )
+
+
 def _candidate_env_paths(extra_paths: Optional[Sequence[Path]]) -> Iterable[Path]:
     seen: set[Path] = set()
     if extra_paths:
@@ -58,20 +172,17 @@ def _candidate_env_paths(extra_paths: Optional[Sequence[Path]]) -> Iterable[Path
                 seen.add(resolved)
                 yield resolved
 
-    cwd_env = Path.cwd() / ".env"
-    if cwd_env.resolve() not in seen:
-        seen.add(cwd_env.resolve())
+    # The working directory may change between calls, so only the package
+    # locations below are resolved once per process.
+    cwd_env = (Path.cwd() / ".env").resolve()
+    if cwd_env not in seen:
+        seen.add(cwd_env)
         yield cwd_env
 
-    package_root = Path(__file__).resolve().parents[1]
-    for candidate in (
-        package_root / ".env",
-        package_root.parent / ".env",
-    ):
-        resolved = candidate.resolve()
+    for resolved in _package_env_paths():
         if resolved not in seen:
             seen.add(resolved)
-            yield candidate
+            yield resolved
 
 
 def require_api_key(
@@ -97,16 +208,215 @@ def require_api_key(
     return api_key
 
 
-@dataclass
+class _MultipartFileStream:
+    """File-like multipart/form-data body that reads the upload lazily.
+
+    Exposes ``len`` and ``read`` so requests sends it with a Content-Length
+    header and streams it in blocks instead of encoding it in memory.
+    """
+
+    def __init__(
+        self,
+        field_name: str,
+        filename: str,
+        fileobj: BinaryIO,
+        content_type: str = "application/octet-stream",
+    ) -> None:
+        boundary = uuid.uuid4().hex
+        self.content_type = f"multipart/form-data; boundary={boundary}"
+        safe_name = filename.replace('"', "%22")
+        head = (
+            f"--{boundary}\r\n"
+            f'Content-Disposition: form-data; name="{field_name}"; filename="{safe_name}"\r\n'
+            f"Content-Type: {content_type}\r\n\r\n"
+        ).encode("utf-8")
+        tail = f"\r\n--{boundary}--\r\n".encode("ascii")
+        file_size = os.fstat(fileobj.fileno()).st_size - fileobj.tell()
+        self.len = len(head) + file_size + len(tail)
+        self._parts: List[BinaryIO] = [io.BytesIO(head), fileobj, io.BytesIO(tail)]
+
+    def __len__(self) -> int:
+        return self.len
+
+    def read(self, size: int = -1) -> bytes:
+        chunks: List[bytes] = []
+        while self._parts and size != 0:
+            data = self._parts[0].read(size)
+            if not data:
+                self._parts.pop(0)
+                continue
+            chunks.append(data)
+            if size > 0:
+                size -= len(data)
+        return b"".join(chunks)
+
+
+class _ChunkReader:
+    """Minimal file-like view over an iterator of byte chunks."""
+
+    def __init__(self, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+
+    def read(self, size: int = -1) -> bytes:
+        if size == 0:  # ijson probes read(0) to detect bytes vs. text
+            return b""
+        return next(self._chunks, b"")
+
+
+def _multipart_file_body(filename: str, fileobj: BinaryIO) -> Any:
+    if MultipartEncoder is not None:
+        return MultipartEncoder(
+            fields={"file": (filename, fileobj, "application/octet-stream")}
+        )
+    return _MultipartFileStream("file", filename, fileobj)
+
+
+def _build_session() -> requests.Session:
+    """Create a session with a larger keep-alive pool and retries on 429/5xx."""
+    # Only idempotent methods are retried: replaying a POST could upload the
+    # same file twice or start a duplicate transcription job.
+    retry = Retry(
+        total=5,
+        backoff_factor=0.5,
+        status_forcelist=RETRY_STATUS_CODES,
+        allowed_methods=_IDEMPOTENT_METHODS,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=POOL_CONNECTIONS,
+        pool_maxsize=POOL_MAXSIZE,
+        pool_block=False,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+class _HttpxSession:
+    """Adapts an HTTP/2 ``httpx.Client`` to the subset of the requests API we use.
+
+    Streaming upload bodies are forwarded as chunk iterators and httpx
+    timeouts are re-raised as ``requests.Timeout`` so client methods stay
+    backend-agnostic.
+    """
+
+    def __init__(self) -> None:
+        try:
+            import httpx
+        except ModuleNotFoundError as exc:
+            raise SystemExit(
+                "Missing dependency: httpx\nInstall it with 'pip install httpx[http2]' and retry."
+            ) from exc
+        self._httpx = httpx
+        options: Dict[str, Any] = {
+            "timeout": httpx.Timeout(
+                HTTPX_TIMEOUT_SECONDS, connect=HTTPX_CONNECT_TIMEOUT_SECONDS
+            ),
+            "limits": httpx.Limits(
+                max_connections=POOL_CONNECTIONS, max_keepalive_connections=16
+            ),
+        }
+        try:
+            self._client = httpx.Client(http2=True, **options)
+        except ImportError:  # HTTP/2 needs the optional 'h2' package.
+            self._client = httpx.Client(**options)
+        self.headers = self._client.headers
+
+    def _request(self, method: str, url: str, **kwargs: Any) -> Any:
+        if kwargs.get("timeout", ...) is None:
+            kwargs.pop("timeout")  # Keep the client default instead of no limit.
+        body = kwargs.pop("data", None)
+        if body is not None:
+            if hasattr(body, "read"):
+                headers = dict(kwargs.pop("headers", None) or {})
+                headers.setdefault("Content-Length", str(len(body)))
+                kwargs["headers"] = headers
+                kwargs["content"] = iter(lambda: body.read(64 * 1024), b"")
+            else:
+                kwargs["content"] = body
+        stream = kwargs.pop("stream", False)
+        # Mirror the requests backend: only idempotent methods are retried.
+        delays = backoff_delays() if method in _IDEMPOTENT_METHODS else iter(())
+        while True:
+            try:
+                if stream:
+                    request = self._client.build_request(method, url, **kwargs)
+                    response = self._client.send(request, stream=True)
+                else:
+                    response = self._client.request(method, url, **kwargs)
+            except self._httpx.TransportError as exc:
+                delay = next(delays, None)
+                if delay is None:
+                    if isinstance(exc, self._httpx.TimeoutException):
+                        raise requests.Timeout(str(exc)) from exc
+                    raise
+                time.sleep(delay)
+                continue
+            if response.status_code in RETRY_STATUS_CODES:
+                delay = next(delays, None)
+                if delay is not None:
+                    response.close()
+                    time.sleep(delay)
+                    continue
+            return response
+
+    def get(self, url: str, **kwargs: Any) -> Any:
+        return self._request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> Any:
+        return self._request("POST", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> Any:
+        return self._request("DELETE", url, **kwargs)
+
+    def close(self) -> None:
+        self._client.close()
+
+
+_SESSION_FACTORIES = {
+    "requests": _build_session,
+    "httpx": _HttpxSession,
+}
+
+
 class SonioxClient:
-    """Lightweight Soniox API client wrapping a requests session."""
+    """Lightweight Soniox API client wrapping a requests session.
 
-    api_key: str
-    base_url: str = DEFAULT_BASE_URL
-    session: requests.Session = field(default_factory=requests.Session)
+    Pass ``backend="httpx"`` to use an HTTP/2 ``httpx.Client`` instead, which
+    multiplexes calls over one connection when the ``h2`` package is present.
+    With ``compress_requests`` set, JSON bodies of at least
+    ``GZIP_MIN_REQUEST_BYTES`` are sent gzip-compressed.
+    """
 
-    def __post_init__(self) -> None:
-        self.session.headers.update({"Authorization": f"Bearer {self.api_key}"})
+    # Spelled out rather than dataclass(slots=True), which needs Python 3.10.
+    __slots__ = ("api_key", "base_url", "session", "backend", "compress_requests")
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = DEFAULT_BASE_URL,
+        session: Any = None,
+        backend: str = "requests",
+        compress_requests: bool = False,
+    ) -> None:
+        self.api_key = api_key
+        self.base_url = base_url
+        self.backend = backend
+        self.compress_requests = compress_requests
+        if session is None:
+            try:
+                factory = _SESSION_FACTORIES[backend]
+            except KeyError:
+                raise ValueError(
+                    f"Unknown HTTP backend {backend!r}; use 'requests' or 'httpx'."
+                ) from None
+            session = factory()
+        self.session = session
+        self.session.headers.update(
+            {"Authorization": f"Bearer {self.api_key}", "Connection": "keep-alive"}
+        )
 
     # --- Resource management -------------------------------------------------
     def close(self) -> None:
@@ -115,9 +425,13 @@ class SonioxClient:
 
     # --- File handling -------------------------------------------------------
     def upload_file(self, audio_path: str) -> str:
-        with open(audio_path, "rb") as audio_file:
+        path = Path(audio_path)
+        with path.open("rb") as audio_file:
+            body = _multipart_file_body(path.name, audio_file)
             response = self.session.post(
-                f"{self.base_url}/v1/files", files={"file": audio_file}
+                f"{self.base_url}/v1/files",
+                data=body,
+                headers={"Content-Type": body.content_type},
             )
         if response.status_code not in (200, 201, 202):
             raise SonioxError(f"File upload failed: {response.text}")
@@ -134,6 +448,20 @@ class SonioxClient:
                 f"Failed to delete file {file_id}: {response.text}"
             )
 
+    def _post_json(self, url: str, payload: Dict[str, Any]) -> Any:
+        if self.compress_requests:
+            body = _json.dumps(payload).encode("utf-8")
+            if len(body) >= GZIP_MIN_REQUEST_BYTES:
+                return self.session.post(
+                    url,
+                    data=gzip.compress(body, compresslevel=6),
+                    headers={
+                        "Content-Type": "application/json",
+                        "Content-Encoding": "gzip",
+                    },
+                )
+        return self.session.post(url, json=payload)
+
     # --- Transcription handling ---------------------------------------------
     def create_transcription(
         self,
@@ -153,9 +481,7 @@ class SonioxClient:
         if extra_options:
             payload.update(extra_options)
 
-        response = self.session.post(
-            f"{self.base_url}/v1/transcriptions", json=payload
-        )
+        response = self._post_json(f"{self.base_url}/v1/transcriptions", payload)
         if response.status_code not in (200, 201, 202):
             raise SonioxError(f"Create transcription failed: {response.text}")
         transcription_id = response.json().get("id")
@@ -170,28 +496,211 @@ class SonioxClient:
         transcription_id: str,
         *,
         poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        long_poll_seconds: float = 0.0,
+        backoff_factor: float = DEFAULT_POLL_BACKOFF,
+        jitter: float = DEFAULT_POLL_JITTER,
     ) -> None:
+        """Block until the transcription finishes, backing off between polls.
+
+        The delay starts at ``poll_interval`` and grows by ``backoff_factor``
+        after every non-terminal response up to ``max_interval``; it resets
+        whenever the reported status changes. Each sleep is scaled by a random
+        factor within ``1 ± jitter`` so concurrent waiters do not poll in
+        lockstep. When ``long_poll_seconds`` is positive the server is asked
+        to hold the request open until the state changes.
+        """
         status_url = f"{self.base_url}/v1/transcriptions/{transcription_id}"
+        params: Optional[Dict[str, Any]] = None
+        timeout: Optional[float] = None
+        if long_poll_seconds > 0:
+            params = {"wait": long_poll_seconds}
+            timeout = long_poll_seconds + 5
+        interval = poll_interval
+        last_status: Optional[str] = None
         while True:
-            response = self.session.get(status_url)
-            if response.status_code != 200:
-                raise SonioxError(f"Polling failed: {response.text}")
-            payload = response.json()
-            status = payload.get("status")
+            try:
+                response = self.session.get(status_url, params=params, timeout=timeout)
+            except requests.Timeout:
+                continue
+            status = _poll_status(response)
             if status == "completed":
                 return
-            if status == "error":
-                message = payload.get("error_message") or "unknown error"
-                raise SonioxError(f"Transcription failed: {message}")
-            time.sleep(poll_interval)
+            if status != last_status:
+                last_status = status
+                interval = poll_interval
+            time.sleep(_jittered(interval, jitter))
+            interval = min(interval * backoff_factor, max(max_interval, poll_interval))
+
+    async def wait_for_completion_async(
+        self,
+        transcription_id: str,
+        *,
+        http_client: Any,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        backoff_factor: float = DEFAULT_POLL_BACKOFF,
+        jitter: float = DEFAULT_POLL_JITTER,
+    ) -> None:
+        """Async counterpart of :meth:`wait_for_completion` on an ``httpx.AsyncClient``.
+
+        Transport errors and retryable statuses are retried with backoff like
+        the httpx backend does; a poll that keeps timing out is started over,
+        as in the sync loop, instead of failing the wait.
+        """
+        import asyncio
+
+        status_url = f"{self.base_url}/v1/transcriptions/{transcription_id}"
+        headers = {"Authorization": f"Bearer {self.api_key}"}
+        interval = poll_interval
+        last_status: Optional[str] = None
+        while True:
+            response = await _get_with_retries_async(http_client, status_url, headers)
+            if response is None:
+                continue
+            status = _poll_status(response)
+            if status == "completed":
+                return
+            if status != last_status:
+                last_status = status
+                interval = poll_interval
+            await asyncio.sleep(_jittered(interval, jitter))
+            interval = min(interval * backoff_factor, max(max_interval, poll_interval))
+
+    def wait_for_all(
+        self,
+        transcription_ids: Sequence[str],
+        *,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        max_interval: float = DEFAULT_MAX_POLL_INTERVAL,
+        backoff_factor: float = DEFAULT_POLL_BACKOFF,
+        jitter: float = DEFAULT_POLL_JITTER,
+        http_client: Any = None,
+    ) -> None:
+        """Wait for several transcriptions at once from a single event loop.
+
+        All status polls share one ``httpx.AsyncClient`` (HTTP/2 when ``h2`` is
+        installed), so waiting on N jobs costs one thread and connection
+        instead of N. Pass ``http_client`` to poll through your own
+        ``httpx.AsyncClient``; it is left open. Requires ``httpx``.
+        """
+        import asyncio
+
+        try:
+            import httpx
+        except ModuleNotFoundError as exc:
+            raise SystemExit(
+                "Missing dependency: httpx\nInstall it with 'pip install httpx[http2]' and retry."
+            ) from exc
+
+        async def wait_on(http_client: Any) -> None:
+            await asyncio.gather(
+                *(
+                    self.wait_for_completion_async(
+                        transcription_id,
+                        http_client=http_client,
+                        poll_interval=poll_interval,
+                        max_interval=max_interval,
+                        backoff_factor=backoff_factor,
+                        jitter=jitter,
+                    )
+                    for transcription_id in transcription_ids
+                )
+            )
+
+        async def wait_all() -> None:
+            if http_client is not None:
+                await wait_on(http_client)
+                return
+            options: Dict[str, Any] = {
+                "timeout": httpx.Timeout(
+                    HTTPX_TIMEOUT_SECONDS, connect=HTTPX_CONNECT_TIMEOUT_SECONDS
+                ),
+                "limits": httpx.Limits(
+                    max_connections=POOL_CONNECTIONS, max_keepalive_connections=16
+                ),
+            }
+            try:
+                owned_client = httpx.AsyncClient(http2=True, **options)
+            except ImportError:  # HTTP/2 needs the optional 'h2' package.
+                owned_client = httpx.AsyncClient(**options)
+            async with owned_client:
+                await wait_on(owned_client)
+
+        if transcription_ids:
+            asyncio.run(wait_all())
+
+    def default_cache_dir(self) -> Path:
+        """Transcript cache directory for this client's API endpoint."""
+        digest = hashlib.sha256(self.base_url.encode("utf-8")).hexdigest()[:16]
+        return DEFAULT_TRANSCRIPT_CACHE_DIR / digest
+
+    def fetch_transcript(
+        self,
+        transcription_id: str,
+        *,
+        cache_dir: Optional[Path | str] = None,
+        cache_ttl: Optional[float] = None,
+        use_cache: bool = False,
+    ) -> Dict[str, Any]:
+        """Fetch a transcript, optionally reusing a copy cached on disk.
+
+        With ``cache_dir`` set, transcripts are stored as ``<id>.json`` in that
+        directory and served from there while younger than ``cache_ttl``
+        seconds (forever when ``cache_ttl`` is None). ``use_cache`` without a
+        ``cache_dir`` picks a directory under ``DEFAULT_TRANSCRIPT_CACHE_DIR``
+        that is specific to ``base_url``.
+        """
+        if cache_dir is None and use_cache:
+            cache_dir = self.default_cache_dir()
+        cache_path: Optional[Path] = None
+        if cache_dir is not None:
+            cache_path = Path(cache_dir) / f"{transcription_id}.json"
+            cached = read_cached_json(cache_path, cache_ttl)
+            if cached is not None:
+                return cached
 
-    def fetch_transcript(self, transcription_id: str) -> Dict[str, Any]:
         response = self.session.get(
             f"{self.base_url}/v1/transcriptions/{transcription_id}/transcript"
         )
         if response.status_code != 200:
             raise SonioxError(f"Fetching transcript failed: {response.text}")
-        return response.json()
+        content = response.content
+        payload = _json.loads(content)
+        if cache_path is not None:
+            try:
+                write_atomic(cache_path, content)
+            except OSError:  # pragma: no cover - caching is best effort
+                pass
+        return payload
+
+    @contextmanager
+    def stream_transcript_tokens(
+        self, transcription_id: str
+    ) -> Iterator[Iterator[Dict[str, Any]]]:
+        """Yield an iterator over transcript tokens parsed while downloading.
+
+        Unlike ``fetch_transcript`` the payload is never held in memory as a
+        whole, which matters for multi-hour transcripts. Requires ``ijson``.
+        """
+        if ijson is None:
+            raise SystemExit(
+                "Missing dependency: ijson\nInstall it with 'pip install ijson' and retry."
+            )
+        response = self.session.get(
+            f"{self.base_url}/v1/transcriptions/{transcription_id}/transcript",
+            stream=True,
+        )
+        try:
+            if response.status_code != 200:
+                raise SonioxError(f"Fetching transcript failed: {response.text}")
+            if hasattr(response, "iter_content"):
+                chunks = response.iter_content(chunk_size=STREAM_CHUNK_SIZE)
+            else:  # httpx responses
+                chunks = response.iter_bytes(STREAM_CHUNK_SIZE)
+            yield ijson.items(_ChunkReader(iter(chunks)), "tokens.item", use_float=True)
+        finally:
+            response.close()
 
     def delete_transcription(self, transcription_id: str) -> None:
         response = self.session.delete(
@@ -202,9 +711,41 @@ class SonioxClient:
                 f"Failed to delete transcription {transcription_id}: {response.text}"
             )
 
+    # --- Batch helpers -------------------------------------------------------
+    def transcribe_many(
+        self,
+        audio_paths: Sequence[str | Path],
+        *,
+        model: str = "stt-async-preview",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        extra_options: Optional[Dict[str, Any]] = None,
+        poll_interval: float = DEFAULT_POLL_INTERVAL,
+        keep_remote: bool = False,
+    ) -> List[Dict[str, Any]]:
+        """Transcribe several local files concurrently over this client's session.
+
+        See :func:`sonioxsrt.transcriber.transcribe_many`.
+        """
+        # Deferred: transcriber builds on this module.
+        from .transcriber import transcribe_many
+
+        return transcribe_many(
+            audio_paths,
+            model=model,
+            extra_options=extra_options,
+            poll_interval=poll_interval,
+            keep_remote=keep_remote,
+            client=self,
+            max_concurrency=max_concurrency,
+        )
+
 
 __all__ = [
     "DEFAULT_BASE_URL",
+    "DEFAULT_MAX_POLL_INTERVAL",
+    "DEFAULT_TRANSCRIPT_CACHE_DIR",
+    "DEFAULT_POLL_BACKOFF",
+    "DEFAULT_POLL_JITTER",
     "DEFAULT_POLL_INTERVAL",
     "SonioxClient",
     "SonioxError",
@@ -3,16 +3,23 @@
 from __future__ import annotations
 
 import argparse
-import json
+import hashlib
 import logging
+import marshal
 import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import replace
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Sequence
+from typing import List, Optional, Sequence
 
+from .. import _json
+from .._files import write_atomic
 from ..subtitles import (
     SubtitleConfig,
-    extract_tokens,
+    iter_render_segments,
+    load_tokens,
     render_segments,
     tokens_to_subtitle_segments,
     write_srt_file,
@@ -22,12 +29,32 @@ from ..translation import (
     LLM_BASE_URL_ENV,
     LLM_MODEL_ENV,
     DEFAULT_MODEL_ENV,
+    DEFAULT_TRANSLATION_CONCURRENCY,
     translate_entries,
     translate_entries_with_review,
     TranslationStats,
 )
 
 DEFAULT_CONFIG = SubtitleConfig()
+# Parsed tokens are cached by a hash of the transcript bytes, in a directory
+# of the user's own rather than next to the input.
+DEFAULT_TOKEN_CACHE_DIR = Path.home() / ".cache" / "sonioxsrt" / "tokens"
+TOKEN_CACHE_SUFFIX = ".marshal"
+DEFAULT_OUTPUT = "subtitles.srt"
+
+# SubtitleConfig fields set by a flag with the same dest name.
+CONFIG_FLAG_FIELDS = (
+    "gap_ms",
+    "min_dur_ms",
+    "max_dur_ms",
+    "max_cps",
+    "max_cpl",
+    "max_lines",
+    "line_split_delimiters",
+    "segment_on_sentence",
+    "split_on_speaker",
+    "ellipses",
+)
 
 
 def build_parser() -> argparse.ArgumentParser:
@@ -36,13 +63,29 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--input",
-        default="response.json",
-        help="Path to the Soniox JSON transcript (default: response.json).",
+        nargs="+",
+        default=["response.json"],
+        help=(
+            "Path to the Soniox JSON transcript (default: response.json). "
+            "Several paths are converted in parallel worker processes."
+        ),
     )
     parser.add_argument(
         "--output",
-        default="subtitles.srt",
-        help="Path for the generated SRT file (default: subtitles.srt).",
+        help="Path for the generated SRT file with a single input (default: subtitles.srt).",
+    )
+    parser.add_argument(
+        "--output-dir",
+        help=(
+            "Write '<input stem>.srt' files into this directory instead of --output. "
+            "With several inputs and no --output-dir, each SRT is written next to its input."
+        ),
+    )
+    parser.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Worker processes for several inputs (default: number of CPUs).",
     )
     parser.add_argument(
         "--gap-ms",
@@ -124,7 +167,6 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--llm-model",
-        default=os.environ.get(LLM_MODEL_ENV) or os.environ.get(DEFAULT_MODEL_ENV),
         help=(
             "Model name for translation (default: environment variable "
             f"{LLM_MODEL_ENV}, then {DEFAULT_MODEL_ENV}, or gpt-4o-mini)."
@@ -132,7 +174,6 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--llm-base-url",
-        default=os.environ.get(LLM_BASE_URL_ENV),
         help=(
             "Override the translation LLM base URL (default: environment variable "
             f"{LLM_BASE_URL_ENV})."
@@ -140,15 +181,63 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--llm-api-key",
-        default=os.environ.get(LLM_API_KEY_ENV),
         help=(
             "API key for the translation LLM (default: environment variable "
             f"{LLM_API_KEY_ENV} or .env)."
         ),
     )
+    parser.add_argument(
+        "--llm-concurrency",
+        type=int,
+        default=1,
+        help=(
+            "Number of translation chunk requests to send in parallel "
+            f"(default: 1; {DEFAULT_TRANSLATION_CONCURRENCY} suits most providers)."
+        ),
+    )
+    parser.add_argument(
+        "--full-context",
+        action="store_true",
+        help=(
+            "Send the surrounding transcript with every single-pass translation request "
+            "for extra context (uses more prompt tokens)."
+        ),
+    )
+    parser.add_argument(
+        "--llm-batch-api",
+        action="store_true",
+        help=(
+            "Submit the translation through the OpenAI Batch API (lower cost, results may take "
+            "hours). Only supported with --translation-passes 1."
+        ),
+    )
+    parser.add_argument(
+        "--cache-tokens",
+        action="store_true",
+        help=(
+            f"Keep the extracted tokens under {DEFAULT_TOKEN_CACHE_DIR}, keyed by the input's "
+            "content, and reuse them on re-runs instead of parsing the JSON again."
+        ),
+    )
     return parser
 
 
+@lru_cache(maxsize=1)
+def _cached_parser() -> argparse.ArgumentParser:
+    # argparse parsers are reusable across parse_args calls; environment-based
+    # defaults are filled in by _apply_env_defaults after parsing instead.
+    return build_parser()
+
+
+def _apply_env_defaults(args: argparse.Namespace) -> None:
+    if args.llm_model is None:
+        args.llm_model = os.environ.get(LLM_MODEL_ENV) or os.environ.get(DEFAULT_MODEL_ENV)
+    if args.llm_base_url is None:
+        args.llm_base_url = os.environ.get(LLM_BASE_URL_ENV)
+    if args.llm_api_key is None:
+        args.llm_api_key = os.environ.get(LLM_API_KEY_ENV)
+
+
 def _configure_logging() -> None:
     root = logging.getLogger()
     if not root.handlers:
@@ -157,75 +246,172 @@ def _configure_logging() -> None:
         root.setLevel(logging.INFO)
 
 
-def main(argv: Optional[Sequence[str]] = None) -> int:
-    parser = build_parser()
-    _configure_logging()
-    args = parser.parse_args(argv)
+def _token_cache_path(input_path: Path) -> Path:
+    digest = hashlib.sha256()
+    with input_path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            digest.update(block)
+    return DEFAULT_TOKEN_CACHE_DIR / (digest.hexdigest() + TOKEN_CACHE_SUFFIX)
+
 
-    input_path = Path(args.input)
-    if not input_path.exists():
-        parser.error(f"Input file not found: {input_path}")
+def _load_tokens(input_path: Path, *, use_cache: bool) -> List[dict]:
+    """Load transcript tokens, reusing the cached copy for identical input bytes.
 
+    Tokens are plain dicts of JSON scalars, so they are stored with marshal,
+    which cannot run code on load. Any unreadable cache entry is a miss.
+    """
+    if not use_cache:
+        return load_tokens(input_path)
+
+    cache_path = _token_cache_path(input_path)
     try:
-        transcript = json.loads(input_path.read_text(encoding="utf-8"))
-        tokens = extract_tokens(transcript)
-    except (OSError, json.JSONDecodeError, ValueError) as exc:
-        print(exc, file=sys.stderr)
-        return 1
+        cached = marshal.loads(cache_path.read_bytes())
+        if isinstance(cached, list):
+            return cached
+    except Exception:  # Missing, truncated or foreign: parse the input instead.
+        pass
 
-    line_split_delimiters = tuple(
-        ch for ch in args.line_split_delimiters if not ch.isspace()
-    )
+    tokens = load_tokens(input_path)
+    try:
+        write_atomic(cache_path, marshal.dumps(tokens))
+    except (OSError, ValueError):  # pragma: no cover - caching is best effort
+        pass
+    return tokens
 
-    config = SubtitleConfig(
-        gap_ms=args.gap_ms,
-        min_dur_ms=args.min_dur_ms,
-        max_dur_ms=args.max_dur_ms,
-        max_cps=args.max_cps,
-        max_cpl=args.max_cpl,
-        max_lines=args.max_lines,
-        line_split_delimiters=line_split_delimiters,
-        segment_on_sentence=args.segment_on_sentence,
-        split_on_speaker=args.split_on_speaker,
-        ellipses=args.ellipses,
-    )
+
+def _convert(
+    input_path: Path, output_path: Path, args: argparse.Namespace, config: SubtitleConfig
+) -> int:
+    """Convert one transcript to SRT; returns the exit status for that file."""
+    try:
+        tokens = _load_tokens(input_path, use_cache=args.cache_tokens)
+    except (OSError, _json.JSONDecodeError, ValueError) as exc:
+        print(exc, file=sys.stderr)
+        return 1
 
     segments = tokens_to_subtitle_segments(tokens, config)
     if not segments:
         print("No subtitle segments were produced from the tokens.", file=sys.stderr)
         return 1
 
+    if not args.translate_to:
+        # Nothing needs the whole list: render and write one entry at a time.
+        count = write_srt_file(iter_render_segments(segments, config), output_path)
+        print(f"Wrote {count} subtitles to {output_path}")
+        return 0
+
     entries = render_segments(segments, config)
 
-    if args.translate_to:
-        try:
-            stats = TranslationStats()
-            translate_fn = (
-                translate_entries_with_review
-                if args.translation_passes == 3
-                else translate_entries
-            )
-            entries = translate_fn(
-                entries,
-                target_language=args.translate_to,
-                config=config,
-                model=args.llm_model,
-                base_url=args.llm_base_url,
-                api_key=args.llm_api_key,
-                stats=stats,
-            )
-            print(
-                f"LLM usage: prompts={stats.prompt_tokens} completion={stats.completion_tokens}"
-                f" total={stats.total_tokens} tokens across {stats.calls} calls"
+    try:
+        stats = TranslationStats()
+        translate_kwargs = dict(
+            target_language=args.translate_to,
+            config=config,
+            model=args.llm_model,
+            base_url=args.llm_base_url,
+            api_key=args.llm_api_key,
+            stats=stats,
+        )
+        if args.llm_concurrency > 1:
+            translate_kwargs["max_concurrency"] = args.llm_concurrency
+        if args.translation_passes == 1:
+            if args.llm_batch_api:
+                translate_kwargs["batch_api"] = True
+            if args.full_context:
+                translate_kwargs["full_context"] = True
+        translate_fn = (
+            translate_entries_with_review
+            if args.translation_passes == 3
+            else translate_entries
+        )
+        entries = translate_fn(entries, **translate_kwargs)
+        print(
+            f"LLM usage: prompts={stats.prompt_tokens} completion={stats.completion_tokens}"
+            f" total={stats.total_tokens} tokens across {stats.calls} calls"
+            + (f" ({stats.cache_hits} served from cache)" if stats.cache_hits else "")
+            + (
+                f"; embeddings={stats.embedding_tokens} tokens across"
+                f" {stats.embedding_calls} calls"
+                if stats.embedding_calls
+                else ""
             )
-        except Exception as exc:  # pragma: no cover - safeguard for CLI usage
-            print(f"Translation failed: {exc}", file=sys.stderr)
-            return 1
+        )
+    except Exception as exc:  # pragma: no cover - safeguard for CLI usage
+        print(f"Translation failed: {exc}", file=sys.stderr)
+        return 1
 
-    write_srt_file(entries, Path(args.output))
-    print(f"Wrote {len(entries)} subtitles to {args.output}")
+    write_srt_file(entries, output_path)
+    print(f"Wrote {len(entries)} subtitles to {output_path}")
     return 0
 
 
+def _config_from_args(args: argparse.Namespace) -> SubtitleConfig:
+    """Return DEFAULT_CONFIG itself unless a flag overrides one of its fields."""
+    values = {name: getattr(args, name) for name in CONFIG_FLAG_FIELDS}
+    # str.split() drops every Unicode whitespace character in one C-level pass.
+    values["line_split_delimiters"] = tuple("".join(args.line_split_delimiters.split()))
+    overrides = {
+        name: value
+        for name, value in values.items()
+        if value != getattr(DEFAULT_CONFIG, name)
+    }
+    return replace(DEFAULT_CONFIG, **overrides) if overrides else DEFAULT_CONFIG
+
+
+def _output_paths(
+    parser: argparse.ArgumentParser, args: argparse.Namespace, inputs: List[Path]
+) -> List[Path]:
+    if args.output is not None and (args.output_dir is not None or len(inputs) > 1):
+        parser.error("--output takes a single input; use --output-dir for several inputs.")
+    if args.output_dir is None and len(inputs) == 1:
+        return [Path(args.output or DEFAULT_OUTPUT)]
+    outputs = [
+        (Path(args.output_dir) if args.output_dir is not None else path.parent)
+        / f"{path.stem}.srt"
+        for path in inputs
+    ]
+    if len(set(outputs)) != len(outputs):
+        parser.error("Several inputs would write the same output file; use distinct names.")
+    return outputs
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = _cached_parser()
+    _configure_logging()
+    args = parser.parse_args(argv)
+    _apply_env_defaults(args)
+
+    if args.llm_batch_api and args.translation_passes != 1:
+        parser.error("--llm-batch-api requires --translation-passes 1")
+
+    inputs = [Path(path) for path in args.input]
+    for input_path in inputs:
+        if not input_path.exists():
+            parser.error(f"Input file not found: {input_path}")
+    outputs = _output_paths(parser, args, inputs)
+    if args.output_dir is not None:
+        Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+
+    config = _config_from_args(args)
+
+    if len(inputs) == 1:
+        return _convert(inputs[0], outputs[0], args, config)
+
+    # Files are independent, so each one runs the whole pipeline in its own
+    # process; the per-file exit statuses are folded into one.
+    workers = max(1, min(args.jobs or os.cpu_count() or 1, len(inputs)))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        statuses = list(
+            executor.map(
+                _convert,
+                inputs,
+                outputs,
+                [args] * len(inputs),
+                [config] * len(inputs),
+            )
+        )
+    return max(statuses)
+
+
 if __name__ == "__main__":  # pragma: no cover
     sys.exit(main())
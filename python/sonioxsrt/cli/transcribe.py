@@ -5,6 +5,7 @@ from __future__ import annotations
 import argparse
 import logging
 import sys
+from functools import lru_cache
 from pathlib import Path
 from typing import Optional, Sequence
 
@@ -45,8 +46,8 @@ def build_parser() -> argparse.ArgumentParser:
         type=float,
         default=DEFAULT_POLL_INTERVAL,
         help=(
-            f"Seconds between status polls (default: {DEFAULT_POLL_INTERVAL}). "
-            "Lower values poll more frequently."
+            f"Initial seconds between status polls (default: {DEFAULT_POLL_INTERVAL}). "
+            "The delay doubles while the job is unchanged, up to 30 seconds."
         ),
     )
     parser.add_argument(
@@ -57,6 +58,12 @@ def build_parser() -> argparse.ArgumentParser:
     return parser
 
 
+@lru_cache(maxsize=1)
+def _cached_parser() -> argparse.ArgumentParser:
+    # argparse parsers are reusable across parse_args calls.
+    return build_parser()
+
+
 def _configure_logging() -> None:
     root = logging.getLogger()
     if not root.handlers:
@@ -66,7 +73,7 @@ def _configure_logging() -> None:
 
 
 def main(argv: Optional[Sequence[str]] = None) -> int:
-    parser = build_parser()
+    parser = _cached_parser()
     _configure_logging()
     args = parser.parse_args(argv)
 
@@ -2,23 +2,45 @@
 
 from __future__ import annotations
 
-import json
-import threading
+import asyncio
+import sys
 import time
-from dataclasses import dataclass, field
+from functools import lru_cache
+from itertools import groupby
+from dataclasses import dataclass, field, replace
 from pathlib import Path
-from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Sequence,
+    Tuple,
+)
 
+from . import _json
 from .api import require_api_key
 
 try:  # Optional dependency that is only required for realtime streaming.
     from websockets import ConnectionClosedError, ConnectionClosedOK  # type: ignore
-    from websockets.sync.client import ClientConnection, connect  # type: ignore
+
+    try:
+        from websockets.asyncio.client import connect  # type: ignore
+    except ModuleNotFoundError:  # pragma: no cover - websockets < 13
+        from websockets.client import connect  # type: ignore
 except ModuleNotFoundError:  # pragma: no cover - handled at runtime in helpers.
     ConnectionClosedError = ConnectionClosedOK = None  # type: ignore
-    ClientConnection = None  # type: ignore
     connect = None  # type: ignore
 
+try:  # Optional dependency for non-blocking audio file reads.
+    import aiofiles  # type: ignore
+except ModuleNotFoundError:  # pragma: no cover - falls back to blocking reads
+    aiofiles = None  # type: ignore
+
 SONIOX_REALTIME_URL = "wss://stt-rt.soniox.com/transcribe-websocket"
 DEFAULT_REALTIME_MODEL = "stt-rt-preview"
 SUPPORTED_REALTIME_MODELS = (
@@ -27,6 +49,9 @@ SUPPORTED_REALTIME_MODELS = (
 )
 DEFAULT_AUDIO_CHUNK_SIZE = 3840
 DEFAULT_AUDIO_SLEEP_SECONDS = 0.120
+ASAP_AUDIO_CHUNK_SIZE = 64 * 1024
+RealTimePace = Literal["realtime", "asap"]
+_API_KEY_PLACEHOLDER = "__SONIOX_API_KEY__"
 
 
 class RealTimeDependencyError(RuntimeError):
@@ -41,42 +66,72 @@ def _ensure_websockets_available() -> None:
         )
 
 
-def render_tokens(
-    final_tokens: Sequence[Dict[str, Any]],
-    non_final_tokens: Sequence[Dict[str, Any]],
-) -> str:
-    """Render a human-readable transcript from realtime tokens."""
-    text_parts: List[str] = []
+RENDER_SEPARATOR = "\n==============================="
+
+
+def _render_key(token: Dict[str, Any]) -> Tuple[Any, Any, bool]:
+    get = token.get
+    return (
+        get("speaker"),
+        get("language"),
+        get("translation_status") == "translation",
+    )
+
+
+@dataclass
+class _RenderState:
+    """Incremental renderer that remembers the speaker/language context."""
+
+    text: str = ""
     current_speaker: Optional[str] = None
     current_language: Optional[str] = None
 
-    for token in [*final_tokens, *non_final_tokens]:
-        text = token.get("text")
-        if not text:
-            continue
-        speaker = token.get("speaker")
-        language = token.get("language")
-        is_translation = token.get("translation_status") == "translation"
+    def render(self, tokens: Iterable[Dict[str, Any]]) -> str:
+        """Render ``tokens`` after the current context and advance it."""
+        text_parts: List[str] = []
+        for (speaker, language, is_translation), group in groupby(
+            (token for token in tokens if token.get("text")), key=_render_key
+        ):
+            texts = [token["text"] for token in group]
+
+            if speaker and speaker != self.current_speaker:
+                if self.current_speaker is not None:
+                    text_parts.append("\n\n")
+                self.current_speaker = speaker
+                self.current_language = None
+                text_parts.append(f"Speaker {self.current_speaker}:")
+
+            if language and language != self.current_language:
+                self.current_language = language
+                prefix = "[Translation] " if is_translation else ""
+                text_parts.append(f"\n{prefix}[{self.current_language}] ")
+                texts[0] = texts[0].lstrip()
 
-        if speaker and speaker != current_speaker:
-            if current_speaker is not None:
-                text_parts.append("\n\n")
-            current_speaker = speaker
-            current_language = None
-            text_parts.append(f"Speaker {current_speaker}:")
+            text_parts.append("".join(texts))
+        return "".join(text_parts)
 
-        if language and language != current_language:
-            current_language = language
-            prefix = "[Translation] " if is_translation else ""
-            text_parts.append(f"\n{prefix}[{current_language}] ")
-            text = text.lstrip()
+    def extend(self, tokens: Iterable[Dict[str, Any]]) -> None:
+        """Append newly-final tokens to the cached text."""
+        self.text += self.render(tokens)
 
-        text_parts.append(text)
+    def preview(self, non_final_tokens: Iterable[Dict[str, Any]]) -> str:
+        """Render the cached text plus ``non_final_tokens`` without keeping them."""
+        suffix = replace(self).render(non_final_tokens)
+        return _finish_rendered(self.text + suffix)
 
-    if text_parts:
-        text_parts.append("\n===============================")
 
-    return "".join(text_parts)
+def _finish_rendered(text: str) -> str:
+    return text + RENDER_SEPARATOR if text else text
+
+
+def render_tokens(
+    final_tokens: Sequence[Dict[str, Any]],
+    non_final_tokens: Sequence[Dict[str, Any]],
+) -> str:
+    """Render a human-readable transcript from realtime tokens."""
+    state = _RenderState()
+    state.extend(final_tokens)
+    return state.preview(non_final_tokens)
 
 
 def build_realtime_config(
@@ -135,28 +190,147 @@ def build_realtime_config(
     return config
 
 
-def _stream_audio(
+@lru_cache(maxsize=16)
+def _config_template(
+    model: str,
+    audio_format: str,
+    sample_rate: Optional[int],
+    num_channels: Optional[int],
+    language_hints: Optional[Tuple[str, ...]],
+    enable_language_identification: bool,
+    enable_speaker_diarization: bool,
+    context: Optional[str],
+    enable_endpoint_detection: Optional[bool],
+    translation_json: Optional[str],
+    extra_options_json: Optional[str],
+) -> str:
+    config = build_realtime_config(
+        api_key=_API_KEY_PLACEHOLDER,
+        model=model,
+        audio_format=audio_format,
+        sample_rate=sample_rate,
+        num_channels=num_channels,
+        language_hints=language_hints,
+        enable_language_identification=enable_language_identification,
+        enable_speaker_diarization=enable_speaker_diarization,
+        context=context,
+        enable_endpoint_detection=enable_endpoint_detection,
+        translation=_json.loads(translation_json) if translation_json else None,
+        extra_options=_json.loads(extra_options_json) if extra_options_json else None,
+    )
+    return _json.dumps(config)
+
+
+def _encode_realtime_config(
+    *,
+    api_key: str,
+    model: str,
+    audio_format: str,
+    sample_rate: Optional[int],
+    num_channels: Optional[int],
+    language_hints: Optional[Sequence[str]],
+    enable_language_identification: bool,
+    enable_speaker_diarization: bool,
+    context: Optional[str],
+    enable_endpoint_detection: Optional[bool],
+    translation: Optional[Dict[str, Any] | str],
+    extra_options: Optional[Dict[str, Any]],
+) -> str:
+    """Serialize the realtime config, reusing a cached template per option set.
+
+    Only the API key differs between sessions started with identical options,
+    so it is substituted into the cached JSON text.
+    """
+    template = _config_template(
+        model,
+        audio_format,
+        sample_rate,
+        num_channels,
+        tuple(language_hints) if language_hints else None,
+        enable_language_identification,
+        enable_speaker_diarization,
+        context,
+        enable_endpoint_detection,
+        _json.dumps(translation) if translation else None,
+        _json.dumps(extra_options) if extra_options else None,
+    )
+    return template.replace(
+        _json.dumps(_API_KEY_PLACEHOLDER), _json.dumps(api_key), 1
+    )
+
+
+async def _iter_audio_chunks(
+    audio_path: Path, chunk_size: int
+) -> AsyncIterator[memoryview]:
+    """Yield views into one reusable buffer; each view is valid until the next."""
+    buffer = bytearray(chunk_size)
+    view = memoryview(buffer)
+    if aiofiles is not None:
+        async with aiofiles.open(audio_path, "rb") as fh:
+            while True:
+                read = await fh.readinto(buffer)
+                if not read:
+                    return
+                yield view[:read]
+    # Small local reads return in microseconds, so blocking the loop briefly is
+    # cheaper than hopping to a worker thread for every chunk.
+    with audio_path.open("rb") as fh:
+        while True:
+            read = fh.readinto(buffer)
+            if not read:
+                return
+            yield view[:read]
+
+
+def _intern_keys(token: Dict[str, Any]) -> Dict[str, Any]:
+    # Each decoded frame carries fresh copies of the same few key strings;
+    # interning them lets every retained final token share one copy.
+    return {sys.intern(key): value for key, value in token.items()}
+
+
+def _resolve_pacing(
+    pace: RealTimePace, chunk_size: int, chunk_sleep: float
+) -> Tuple[int, float]:
+    if pace == "realtime":
+        return chunk_size, chunk_sleep
+    if pace == "asap":
+        return max(chunk_size, ASAP_AUDIO_CHUNK_SIZE), 0.0
+    raise ValueError("pace must be 'realtime' or 'asap'.")
+
+
+async def _stream_audio(
     audio_path: Path,
-    ws: ClientConnection,
+    ws: Any,
     *,
     chunk_size: int,
     sleep_seconds: float,
 ) -> None:
     """Send audio bytes over the websocket, simulating realtime pacing."""
-    with audio_path.open("rb") as fh:
-        while True:
-            chunk = fh.read(chunk_size)
-            if not chunk:
-                break
-            ws.send(chunk)
+    # send() frames (and masks) the data before returning, so the shared
+    # read buffer can be refilled as soon as it completes.
+    try:
+        async for chunk in _iter_audio_chunks(audio_path, chunk_size):
+            await ws.send(chunk)
             if sleep_seconds > 0:
-                time.sleep(sleep_seconds)
-    ws.send("")  # Empty string signals end-of-audio.
+                await asyncio.sleep(sleep_seconds)
+        # Soniox expects an empty frame as end-of-audio. Closing the socket
+        # instead would drop the final tokens the server still has to send;
+        # the receive loop ends on the ``finished`` response.
+        await ws.send("")
+    except (ConnectionClosedOK, ConnectionClosedError):
+        # The server ended the session (e.g. after an error); the receive
+        # loop reports why, so there is nothing left to send.
+        return
 
 
 @dataclass
 class RealTimeUpdate:
-    """Represents a single realtime response update."""
+    """Represents a single realtime response update.
+
+    ``final_tokens`` is the session's live list of final tokens unless the
+    session was started with ``snapshot_finals=True``; copy it if you need
+    to keep the state as of this update.
+    """
 
     text: str
     final_tokens: List[Dict[str, Any]]
@@ -186,7 +360,7 @@ class RealTimeResult:
         }
 
 
-def run_realtime_session(
+async def arun_realtime_session(
     audio_path: Path | str,
     *,
     api_key: Optional[str] = None,
@@ -205,9 +379,25 @@ def run_realtime_session(
     chunk_size: int = DEFAULT_AUDIO_CHUNK_SIZE,
     chunk_sleep: float = DEFAULT_AUDIO_SLEEP_SECONDS,
     on_update: Optional[Callable[[RealTimeUpdate], None]] = None,
+    snapshot_finals: bool = False,
+    pace: RealTimePace = "realtime",
+    on_update_min_interval: float = 0.0,
+    collect_responses: bool = True,
 ) -> RealTimeResult:
-    """Stream audio to the realtime API and return the aggregated result."""
+    """Stream audio to the realtime API on the running event loop.
+
+    Several sessions can run concurrently on one loop (e.g. via
+    ``asyncio.gather``) without a thread per session. With ``pace="asap"``
+    a pre-recorded file is sent in large chunks without sleeping, trading
+    server-side backpressure for much shorter wall time.
+
+    ``on_update_min_interval`` coalesces updates: ``on_update`` is called at
+    most once per that many seconds, plus once for the final response.
+    Pass ``collect_responses=False`` to skip retaining every raw response in
+    ``RealTimeResult.responses`` when only the tokens are needed.
+    """
     _ensure_websockets_available()
+    chunk_size, chunk_sleep = _resolve_pacing(pace, chunk_size, chunk_sleep)
 
     if not isinstance(audio_path, Path):
         audio_path = Path(audio_path)
@@ -217,7 +407,7 @@ def run_realtime_session(
     if api_key is None:
         api_key = require_api_key()
 
-    config = build_realtime_config(
+    config_text = _encode_realtime_config(
         api_key=api_key,
         model=model,
         audio_format=audio_format,
@@ -234,70 +424,138 @@ def run_realtime_session(
 
     final_tokens: List[Dict[str, Any]] = []
     responses: List[Dict[str, Any]] = []
-
-    with connect(websocket_url) as ws:  # type: ignore[arg-type]
-        ws.send(json.dumps(config))
-        streamer = threading.Thread(
-            target=_stream_audio,
-            args=(audio_path, ws),
-            kwargs={"chunk_size": chunk_size, "sleep_seconds": chunk_sleep},
-            daemon=True,
+    render_state = _RenderState()
+    last_emit = float("-inf")
+
+    async with connect(websocket_url) as ws:  # type: ignore[misc]
+        await ws.send(config_text)
+        streamer = asyncio.create_task(
+            _stream_audio(
+                audio_path, ws, chunk_size=chunk_size, sleep_seconds=chunk_sleep
+            )
         )
-        streamer.start()
 
         try:
-            while True:
-                message = ws.recv()
+            async for message in ws:
                 if not isinstance(message, (bytes, str)):
                     continue
-                payload = json.loads(message)
-                responses.append(payload)
+                payload = _json.loads(message)
+                if collect_responses:
+                    responses.append(payload)
 
                 error_code = payload.get("error_code")
                 if error_code is not None:
                     error_message = payload.get("error_message", "unknown error")
                     raise RuntimeError(f"Realtime session error {error_code}: {error_message}")
 
+                new_final_tokens: List[Dict[str, Any]] = []
                 non_final_tokens: List[Dict[str, Any]] = []
-                for token in payload.get("tokens", []):
-                    text = token.get("text")
-                    if not text:
+                add_final = new_final_tokens.append
+                add_non_final = non_final_tokens.append
+                tokens = payload.get("tokens") or []
+                for position, token in enumerate(tokens):
+                    get = token.get
+                    if not get("text"):
                         continue
-                    if token.get("is_final"):
-                        final_tokens.append(token)
+                    if get("is_final"):
+                        # Store the interned copy back so ``responses`` and
+                        # ``final_tokens`` keep sharing one dict per token.
+                        token = tokens[position] = _intern_keys(token)
+                        add_final(token)
                     else:
-                        non_final_tokens.append(token)
-
-                update_text = render_tokens(final_tokens, non_final_tokens)
-                if on_update:
+                        add_non_final(token)
+                final_tokens.extend(new_final_tokens)
+                render_state.extend(new_final_tokens)
+
+                finished = bool(payload.get("finished"))
+                now = time.monotonic()
+                if on_update and (finished or now - last_emit >= on_update_min_interval):
+                    last_emit = now
                     on_update(
                         RealTimeUpdate(
-                            text=update_text,
-                            final_tokens=list(final_tokens),
+                            text=render_state.preview(non_final_tokens),
+                            final_tokens=(
+                                list(final_tokens) if snapshot_finals else final_tokens
+                            ),
                             non_final_tokens=non_final_tokens,
                             raw=payload,
                         )
                     )
 
-                if payload.get("finished"):
+                if finished:
                     break
         except (ConnectionClosedOK, ConnectionClosedError):
             # Expected when the server closes the socket after finished=True.
             pass
         finally:
-            streamer.join(timeout=1.0)
+            streamer.cancel()
+            await asyncio.gather(streamer, return_exceptions=True)
 
     return RealTimeResult(model=model, final_tokens=final_tokens, responses=responses)
 
 
+def run_realtime_session(
+    audio_path: Path | str,
+    *,
+    api_key: Optional[str] = None,
+    model: str = DEFAULT_REALTIME_MODEL,
+    audio_format: str = "auto",
+    sample_rate: Optional[int] = None,
+    num_channels: Optional[int] = None,
+    language_hints: Optional[Sequence[str]] = None,
+    enable_language_identification: bool = False,
+    enable_speaker_diarization: bool = False,
+    context: Optional[str] = None,
+    enable_endpoint_detection: Optional[bool] = True,
+    translation: Optional[Dict[str, Any] | str] = None,
+    extra_options: Optional[Dict[str, Any]] = None,
+    websocket_url: str = SONIOX_REALTIME_URL,
+    chunk_size: int = DEFAULT_AUDIO_CHUNK_SIZE,
+    chunk_sleep: float = DEFAULT_AUDIO_SLEEP_SECONDS,
+    on_update: Optional[Callable[[RealTimeUpdate], None]] = None,
+    snapshot_finals: bool = False,
+    pace: RealTimePace = "realtime",
+    on_update_min_interval: float = 0.0,
+    collect_responses: bool = True,
+) -> RealTimeResult:
+    """Stream audio to the realtime API and return the aggregated result."""
+    return asyncio.run(
+        arun_realtime_session(
+            audio_path,
+            api_key=api_key,
+            model=model,
+            audio_format=audio_format,
+            sample_rate=sample_rate,
+            num_channels=num_channels,
+            language_hints=language_hints,
+            enable_language_identification=enable_language_identification,
+            enable_speaker_diarization=enable_speaker_diarization,
+            context=context,
+            enable_endpoint_detection=enable_endpoint_detection,
+            translation=translation,
+            extra_options=extra_options,
+            websocket_url=websocket_url,
+            chunk_size=chunk_size,
+            chunk_sleep=chunk_sleep,
+            on_update=on_update,
+            snapshot_finals=snapshot_finals,
+            pace=pace,
+            on_update_min_interval=on_update_min_interval,
+            collect_responses=collect_responses,
+        )
+    )
+
+
 __all__ = [
     "DEFAULT_REALTIME_MODEL",
     "DEFAULT_AUDIO_CHUNK_SIZE",
     "DEFAULT_AUDIO_SLEEP_SECONDS",
+    "ASAP_AUDIO_CHUNK_SIZE",
     "RealTimeDependencyError",
     "RealTimeResult",
     "RealTimeUpdate",
     "SUPPORTED_REALTIME_MODELS",
+    "arun_realtime_session",
     "build_realtime_config",
     "render_tokens",
     "run_realtime_session",
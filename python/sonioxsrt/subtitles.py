@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
-import json
 import logging
+import re
 from dataclasses import dataclass
+from functools import lru_cache
+from itertools import accumulate
 from pathlib import Path
-from typing import Any, Iterable, List, Optional, Sequence, Tuple, Union
+from typing import Any, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+from . import _json
+
+try:  # Optional dependency for incremental transcript parsing
+    import ijson
+except ModuleNotFoundError:  # pragma: no cover - falls back to a full JSON load
+    ijson = None
 
 SENTENCE_ENDERS = {"。", "｡", ".", "．", "！", "!", "？", "?"}
 MINOR_BREAKERS = {",", "，", ";", "；", ":", "：", "、", "—", "–", "-", "･"}
@@ -14,23 +23,40 @@ DEFAULT_GAP_MS = 1200
 DEFAULT_MIN_DUR_MS = 1000
 DEFAULT_MAX_DUR_MS = 7000
 DEFAULT_MAX_CPS = 17.0
+SRT_WRITE_BUFFER = 1 << 20
 
 PUNCT = set(".,!?;:–—-…，；：｡．･")
 
+# Per-token boundary flags, computed once per word in ``tokens_to_words``.
+_STARTS_SPACE = 1
+_ENDS_SPACE = 2
+_ENDS_SENTENCE = 4
+_ENDS_MINOR = 8
+_BREAK_AFTER = _ENDS_SPACE | _ENDS_SENTENCE | _ENDS_MINOR
+
+# Single lookup table for punctuation classes; the class bits line up with the
+# ``_ENDS_*`` flags so a character's class can be or-ed straight into them.
+_CHAR_CLASS = {ch: _ENDS_SENTENCE for ch in SENTENCE_ENDERS}
+for _ch in MINOR_BREAKERS:
+    _CHAR_CLASS[_ch] = _CHAR_CLASS.get(_ch, 0) | _ENDS_MINOR
+del _ch
+_PUNCT_CHARS = "".join(sorted(PUNCT))
+
 LOGGER = logging.getLogger(__name__)
 
 
+_CJK_PATTERN = re.compile(
+    "["
+    "\u3040-\u30ff"  # Hiragana + Katakana
+    "\u3400-\u4dbf"  # CJK Extension A
+    "\u4e00-\u9fff"  # CJK Unified
+    "\uf900-\ufaff"  # CJK Compatibility
+    "]"
+)
+
+
 def _contains_cjk(text: str) -> bool:
-    for ch in text:
-        code = ord(ch)
-        if (
-            0x3040 <= code <= 0x30FF  # Hiragana + Katakana
-            or 0x3400 <= code <= 0x4DBF  # CJK Extension A
-            or 0x4E00 <= code <= 0x9FFF  # CJK Unified
-            or 0xF900 <= code <= 0xFAFF  # CJK Compatibility
-        ):
-            return True
-    return False
+    return _CJK_PATTERN.search(text) is not None
 
 
 @dataclass
@@ -49,6 +75,8 @@ class SubtitleConfig:
 
 @dataclass
 class SubtitleEntry:
+    __slots__ = ("index", "start_ms", "end_ms", "lines")
+
     index: int
     start_ms: int
     end_ms: int
@@ -56,20 +84,47 @@ class SubtitleEntry:
 
 
 def extract_tokens(transcript: dict) -> List[dict]:
+    """Return the transcript's tokens, without tokens that carry no text."""
     tokens = transcript.get("tokens")
-    if isinstance(tokens, list) and tokens:
-        return tokens
-
-    nested_tokens = _collect_nested_tokens(
-        transcript,
-        skip_immediate=True,
-    )
-    if nested_tokens:
-        return nested_tokens
+    if not (isinstance(tokens, list) and tokens):
+        tokens = _collect_nested_tokens(
+            transcript,
+            skip_immediate=True,
+        )
+    if tokens:
+        return _drop_empty_tokens(tokens)
 
     raise ValueError("No tokens found in transcript.")
 
 
+def load_tokens(path: Path | str) -> List[dict]:
+    """Read a transcript file's tokens, streaming the top-level list when possible.
+
+    With ``ijson`` installed, ``tokens`` items are decoded one at a time so
+    the whole document is never held in memory. Transcripts without a
+    top-level token list are loaded in full and passed to :func:`extract_tokens`.
+    """
+    path = Path(path)
+    if ijson is not None:
+        try:
+            with path.open("rb") as handle:
+                tokens = list(ijson.items(handle, "tokens.item", use_float=True))
+        except ijson.JSONError:
+            tokens = []  # Let the full parser below report the error.
+        if tokens:
+            return _drop_empty_tokens(tokens)
+    return extract_tokens(_json.load_file(path))
+
+
+def _drop_empty_tokens(tokens: List[dict]) -> List[dict]:
+    # Segmentation skips empty tokens anyway; filtering them here keeps them
+    # out of every later pass. The list is returned as-is when nothing is empty.
+    for token in tokens:
+        if not token.get("text"):
+            return [token for token in tokens if token.get("text")]
+    return tokens
+
+
 def _collect_nested_tokens(
     value: Union[dict, Iterable[Any], None],
     *,
@@ -118,8 +173,20 @@ def _collect_nested_tokens(
     return tokens
 
 
+_TWO_DIGITS = [f"{i:02}" for i in range(100)]
+_THREE_DIGITS = [f"{i:03}" for i in range(1000)]
+
+
 def format_timestamp(ms: int) -> str:
     ms = max(0, int(ms))
+    total_seconds = ms // 1000
+    if total_seconds < 360000:
+        return (
+            f"{_TWO_DIGITS[total_seconds // 3600]}:"
+            f"{_TWO_DIGITS[total_seconds // 60 % 60]}:"
+            f"{_TWO_DIGITS[total_seconds % 60]},"
+            f"{_THREE_DIGITS[ms % 1000]}"
+        )
     seconds, millis = divmod(ms, 1000)
     minutes, seconds = divmod(seconds, 60)
     hours, minutes = divmod(minutes, 60)
@@ -138,90 +205,137 @@ def first_non_empty(values: Iterable[Optional[str]]) -> Optional[str]:
 
 
 def _concat_text(ts: Sequence[dict]) -> str:
-    return "".join(t.get("text", "") for t in ts).strip()
+    # str.join materialises a generator into a list first; build it directly.
+    return "".join([t.get("text", "") for t in ts]).strip()
 
 
-def tokens_to_words(tokens: Sequence[dict]) -> List[dict]:
-    """Group subword tokens into word-like units to avoid mid-word splits."""
-    words: List[dict] = []
-    cur_tokens: List[dict] = []
-    cur_text_parts: List[str] = []
+def _text_flags(text: str) -> int:
+    if not text:
+        return 0
+    flags = 0
+    if text[0] == " ":
+        flags |= _STARTS_SPACE
+    last = text[-1]
+    if last == " ":
+        flags |= _ENDS_SPACE
+    return flags | _CHAR_CLASS.get(last, 0)
+
+
+def _annotate_word(word: dict) -> None:
+    text = word["text"]
+    word["_len"] = len(text)
+    word["_flags"] = _text_flags(text)
+
+
+def _token_arrays(tokens: Sequence[dict]) -> Tuple[List[str], List[int], List[int]]:
+    """Return parallel (texts, lengths, flags) lists, reusing cached word metadata."""
+    texts: List[str] = []
+    lens: List[int] = []
+    flags: List[int] = []
+    for tok in tokens:
+        text = tok.get("text", "")
+        cached = tok.get("_flags")
+        texts.append(text)
+        if cached is None:
+            lens.append(len(text))
+            flags.append(_text_flags(text))
+        else:
+            lens.append(tok["_len"])
+            flags.append(cached)
+    return texts, lens, flags
+
+
+def _iter_words(tokens: Iterable[dict]) -> Iterator[dict]:
+    """Yield word-like units from subword tokens as soon as each one closes."""
+    cur_parts: List[str] = []
+    cur_open = False
+    cur_cjk = False
+    cur_prefix = False
     cur_start: Optional[int] = None
     cur_end: Optional[int] = None
-
-    def flush() -> None:
-        nonlocal cur_tokens, cur_text_parts, cur_start, cur_end
-        if not cur_tokens:
-            return
-        prefix_space = bool(cur_tokens and cur_tokens[0].get("_prefix_space"))
-        text = (" " if prefix_space else "") + "".join(cur_text_parts)
-        words.append(
-            {
-                "text": text,
-                "start_ms": cur_start if cur_start is not None else 0,
-                "end_ms": cur_end if cur_end is not None else (cur_start or 0),
-                "_inner": cur_tokens,
-            }
-        )
-        cur_tokens = []
-        cur_text_parts = []
-        cur_start = None
-        cur_end = None
+    first = True
 
     for tok in tokens:
-        t = tok.get("text", "")
+        get = tok.get
+        t = get("text", "")
         if not t:
             continue
         starts_space = t[0].isspace()
         clean = t.lstrip()
-        is_punct = clean and all(ch in PUNCT for ch in clean)
-
-        t_start = tok.get("start_ms")
-        t_end = tok.get("end_ms")
-
-        def add_to_current(text_part: str) -> None:
-            nonlocal cur_start, cur_end
-            cur_tokens.append(tok)
-            cur_text_parts.append(text_part)
-            if t_start is not None:
-                cur_start = t_start if cur_start is None else min(cur_start, t_start)
-            if t_end is not None:
-                cur_end = t_end if cur_end is None else max(cur_end, t_end)
-
-        if starts_space:
-            flush()
-            add_to_current(clean)
-            cur_tokens[-1]["_prefix_space"] = True
-        else:
-            if cur_tokens:
-                if is_punct:
-                    add_to_current(clean)
-                elif _contains_cjk(clean) and _contains_cjk("".join(cur_text_parts)):
-                    flush()
-                    add_to_current(clean)
-                else:
-                    add_to_current(clean)
-            else:
-                add_to_current(clean)
+        clean_cjk = _contains_cjk(clean)
+
+        if cur_open and (
+            starts_space
+            or (
+                clean_cjk
+                and cur_cjk
+                and not (clean and not clean.strip(_PUNCT_CHARS))
+            )
+        ):
+            yield _make_word(cur_parts, cur_prefix, cur_start, cur_end, first)
+            first = False
+            cur_open = False
+
+        if not cur_open:
+            cur_open = True
+            cur_parts = []
+            cur_cjk = False
+            cur_start = None
+            cur_end = None
+            if starts_space:
+                tok["_prefix_space"] = True
+            cur_prefix = bool(get("_prefix_space"))
+
+        cur_parts.append(clean)
+        cur_cjk = cur_cjk or clean_cjk
+        t_start = get("start_ms")
+        if t_start is not None:
+            cur_start = t_start if cur_start is None else min(cur_start, t_start)
+        t_end = get("end_ms")
+        if t_end is not None:
+            cur_end = t_end if cur_end is None else max(cur_end, t_end)
 
         if clean and (
             _ends_with_sentence_break(clean)
-            or clean[-1] in MINOR_BREAKERS
-            or _contains_cjk(clean) and len(clean) == 1
+            or _CHAR_CLASS.get(clean[-1], 0) & _ENDS_MINOR
+            or clean_cjk and len(clean) == 1
         ):
-            flush()
+            yield _make_word(cur_parts, cur_prefix, cur_start, cur_end, first)
+            first = False
+            cur_open = False
+
+    if cur_open:
+        yield _make_word(cur_parts, cur_prefix, cur_start, cur_end, first)
+
+
+def _make_word(
+    parts: List[str],
+    prefix_space: bool,
+    start: Optional[int],
+    end: Optional[int],
+    first: bool,
+) -> dict:
+    text = "".join(parts)
+    if prefix_space and not first:
+        text = " " + text
+    elif first:
+        text = text.lstrip()
+    word = {
+        "text": text,
+        "start_ms": start if start is not None else 0,
+        "end_ms": end if end is not None else (start or 0),
+    }
+    _annotate_word(word)
+    return word
 
-    if cur_tokens:
-        flush()
 
-    if words and words[0]["text"].startswith(" "):
-        words[0]["text"] = words[0]["text"].lstrip()
-
-    return words
+def tokens_to_words(tokens: Sequence[dict]) -> List[dict]:
+    """Group subword tokens into word-like units to avoid mid-word splits."""
+    return list(_iter_words(tokens))
 
 
 def build_segments(
-    tokens: Sequence[dict],
+    tokens: Iterable[dict],
     gap_threshold: int,
     split_on_speaker: bool,
     segment_on_sentence: bool,
@@ -229,11 +343,14 @@ def build_segments(
     segments: List[dict] = []
     current: List[dict] = []
     current_start: Optional[int] = None
+    current_end = 0
     last_token_end: Optional[int] = None
     current_speaker: Optional[str] = None
+    # First non-empty speaker of the segment, as first_non_empty would report it.
+    segment_speaker: Optional[str] = None
 
     def close_segment(sentence_break: bool = False) -> None:
-        nonlocal current, current_start, last_token_end, current_speaker
+        nonlocal current, current_start, last_token_end, current_speaker, segment_speaker
         if not current:
             return
 
@@ -243,14 +360,12 @@ def build_segments(
             current_start = None
             last_token_end = None
             current_speaker = None
+            segment_speaker = None
             return
 
         start = current_start if current_start is not None else 0
-        end_candidates = [
-            token.get("end_ms") or token.get("start_ms") or start for token in current
-        ]
-        end = max(end_candidates) if end_candidates else start
-        speaker = first_non_empty(token.get("speaker") for token in current)
+        end = current_end
+        speaker = segment_speaker
 
         segments.append(
             {
@@ -259,6 +374,7 @@ def build_segments(
                 "speaker": speaker,
                 "tokens": current,
                 "sentence_break": sentence_break,
+                "_text": text,
             }
         )
 
@@ -266,26 +382,14 @@ def build_segments(
         current_start = None
         last_token_end = None
         current_speaker = None
-
-    def _safe_boundary(prev_text: str, next_text: str) -> bool:
-        if not next_text:
-            return True
-        return next_text.startswith(" ") or (
-            prev_text.endswith(" ")
-            or (
-                prev_text
-                and (
-                    prev_text[-1] in SENTENCE_ENDERS
-                    or prev_text[-1] in MINOR_BREAKERS
-                )
-            )
-        )
+        segment_speaker = None
 
     for token in tokens:
-        start = token.get("start_ms")
-        end = token.get("end_ms")
-        text = token.get("text", "")
-        speaker = token.get("speaker")
+        get = token.get
+        start = get("start_ms")
+        end = get("end_ms")
+        text = get("text", "")
+        speaker = get("speaker")
 
         if (
             split_on_speaker
@@ -299,19 +403,23 @@ def build_segments(
         if current and last_token_end is not None and start is not None:
             gap = start - last_token_end
             if gap_threshold > 0 and gap > gap_threshold:
-                prev_text = current[-1].get("text", "")
-                next_text = text
-                if _safe_boundary(prev_text, next_text):
+                if _safe_boundary(current[-1], token):
                     close_segment()
 
-        if not current and start is not None:
-            current_start = start
+        if not current:
+            if start is not None:
+                current_start = start
+            current_end = end or start or (current_start or 0)
+        else:
+            current_end = max(current_end, end or start or (current_start or 0))
 
         current.append(token)
         if end is not None:
             last_token_end = end
         if current_speaker is None and speaker is not None:
             current_speaker = speaker
+        if segment_speaker is None and speaker not in (None, ""):
+            segment_speaker = str(speaker)
 
         sentence_break = False
         if text:
@@ -327,6 +435,19 @@ def build_segments(
     return segments
 
 
+def _safe_boundary(prev: dict, nxt: dict) -> bool:
+    next_text = nxt.get("text", "")
+    if not next_text:
+        return True
+    next_flags = nxt.get("_flags")
+    if next_flags is None:
+        next_flags = _text_flags(next_text)
+    prev_flags = prev.get("_flags")
+    if prev_flags is None:
+        prev_flags = _text_flags(prev.get("text", ""))
+    return bool(next_flags & _STARTS_SPACE or prev_flags & _BREAK_AFTER)
+
+
 def _segment_time(seg: dict) -> Tuple[int, int]:
     start = seg["start"]
     end = seg["end"]
@@ -334,18 +455,46 @@ def _segment_time(seg: dict) -> Tuple[int, int]:
 
 
 def _segment_text(seg: dict) -> str:
-    return _concat_text(seg["tokens"]) if "tokens" in seg else seg.get("text", "")
+    text = seg.get("_text")
+    if text is None:
+        if "tokens" not in seg:
+            return seg.get("text", "")
+        text = seg["_text"] = _concat_text(seg["tokens"])
+    return text
 
 
 def _chars_for_cps(text: str) -> int:
-    return len(text.replace(" ", ""))
+    # Counting spaces avoids building a space-free copy of the text.
+    return len(text) - text.count(" ")
 
 
 def _ends_with_sentence_break(text: str) -> bool:
     stripped = text.rstrip()
     if not stripped:
         return False
-    return stripped[-1] in SENTENCE_ENDERS
+    return bool(_CHAR_CLASS.get(stripped[-1], 0) & _ENDS_SENTENCE)
+
+
+_CHUNK_SENTINEL = "\x1f"
+
+
+@lru_cache(maxsize=32)
+def _effective_delimiters(delimiters: Tuple[str, ...]) -> Tuple[str, ...]:
+    # Only single characters can ever match a position in the text.
+    return tuple(sorted({d for d in delimiters if len(d) == 1}))
+
+
+@lru_cache(maxsize=32)
+def _delimiter_table(delimiters: Tuple[str, ...]) -> dict:
+    # Each delimiter keeps its character and gains a sentinel after it, so a
+    # plain str.split marks chunk ends without losing the delimiter.
+    return str.maketrans({d: d + _CHUNK_SENTINEL for d in delimiters})
+
+
+@lru_cache(maxsize=32)
+def _delimiter_pattern(delimiters: Tuple[str, ...]) -> "re.Pattern[str]":
+    # One alternation scans the text once in C instead of one `in` per delimiter.
+    return re.compile("|".join(map(re.escape, delimiters)))
 
 
 def _split_text_by_delimiters(text: str, delimiters: Sequence[str]) -> List[str]:
@@ -353,25 +502,32 @@ def _split_text_by_delimiters(text: str, delimiters: Sequence[str]) -> List[str]
         return []
 
     cleaned = text.replace("\n", " ")
-    delim_set = {d for d in delimiters if d}
-    if not delim_set:
+    delims = _effective_delimiters(tuple(delimiters))
+    if not delims:
         stripped = cleaned.strip()
         return [stripped] if stripped else []
 
-    pieces: List[str] = []
-    current_chars: List[str] = []
-    for char in cleaned:
-        current_chars.append(char)
-        if char in delim_set:
-            chunk = "".join(current_chars).strip()
-            if chunk:
-                pieces.append(chunk)
-            current_chars = []
-
-    remainder = "".join(current_chars).strip()
-    if remainder:
-        pieces.append(remainder)
+    if len(delims) == 1:
+        delim = delims[0]
+        parts = cleaned.split(delim)
+        raw = [part + delim for part in parts[:-1]]
+        raw.append(parts[-1])
+    elif _CHUNK_SENTINEL not in cleaned:
+        raw = cleaned.translate(_delimiter_table(delims)).split(_CHUNK_SENTINEL)
+    else:
+        raw = []
+        start = 0
+        for index, char in enumerate(cleaned):
+            if char in delims:
+                raw.append(cleaned[start : index + 1])
+                start = index + 1
+        raw.append(cleaned[start:])
 
+    pieces: List[str] = []
+    for part in raw:
+        chunk = part.strip()
+        if chunk:
+            pieces.append(chunk)
     return pieces
 
 
@@ -383,23 +539,45 @@ def _partition_chunks(
     if not chunks:
         return []
 
-    def helper(start: int, remaining: int) -> Optional[List[str]]:
-        if start == len(chunks):
-            return []
-        if remaining == 0:
-            return None
-
-        line = ""
-        for end in range(start, len(chunks)):
-            line = f"{line} {chunks[end]}".strip() if line else chunks[end]
-            if len(line) > max_cpl:
+    # Chunks are stripped and non-empty, so the length of chunks[i:j] joined by
+    # single spaces is prefix[j] - prefix[i] - 1.
+    n = len(chunks)
+    prefix = [0] * (n + 1)
+    for i, chunk in enumerate(chunks):
+        prefix[i + 1] = prefix[i] + len(chunk) + 1
+
+    # min_lines[i]: fewest lines that cover chunks[i:], or None when impossible.
+    min_lines: List[Optional[int]] = [None] * (n + 1)
+    min_lines[n] = 0
+    for start in range(n - 1, -1, -1):
+        best = None
+        for end in range(start + 1, n + 1):
+            if prefix[end] - prefix[start] - 1 > max_cpl:
                 break
-            rest = helper(end + 1, remaining - 1)
-            if rest is not None:
-                return [line, *rest]
+            rest = min_lines[end]
+            if rest is not None and (best is None or rest + 1 < best):
+                best = rest + 1
+        min_lines[start] = best
+
+    first = min_lines[0]
+    if first is None or first > max_lines:
         return None
 
-    return helper(0, max_lines)
+    # Rebuild the partition preferring the shortest leading line that still
+    # leaves the remainder coverable.
+    lines: List[str] = []
+    start = 0
+    remaining = max_lines
+    while start < n:
+        for end in range(start + 1, n + 1):
+            rest = min_lines[end]
+            if rest is not None and rest <= remaining - 1:
+                if prefix[end] - prefix[start] - 1 <= max_cpl:
+                    break
+        lines.append(" ".join(chunks[start:end]))
+        start = end
+        remaining -= 1
+    return lines
 
 
 def _wrap_with_preferred_delimiters(
@@ -426,69 +604,34 @@ def _wrap_with_preferred_delimiters(
 
 
 def _find_split_index(tokens: Sequence[dict]) -> int:
+    """Return the safe split index whose left half is closest to half the text.
+
+    A split before token ``k`` is safe when token ``k`` starts with a space or
+    token ``k - 1`` ends with a space or break punctuation. Sentence enders are
+    break punctuation, so when no safe split exists there is nothing better
+    to fall back to than the middle token.
+    """
     n = len(tokens)
     if n <= 1:
         return 1
-    mid_chars = sum(len(t.get("text", "")) for t in tokens) // 2
-
-    cum = []
-    acc = 0
-    safe_after = []
-    for i, tok in enumerate(tokens):
-        txt = tok.get("text", "")
-        acc += len(txt)
-        cum.append(acc)
-        if i < n - 1:
-            nxt = tokens[i + 1].get("text", "")
-            if nxt.startswith(" ") or (
-                txt
-                and (
-                    txt.endswith(" ")
-                    or txt[-1] in SENTENCE_ENDERS
-                    or txt[-1] in MINOR_BREAKERS
-                )
-            ):
-                safe_after.append(i + 1)
-
-    def _is_safe_at(k: int) -> bool:
-        if k <= 0 or k >= n:
-            return True
-        left = tokens[k - 1].get("text", "")
-        right = tokens[k].get("text", "")
-        return right.startswith(" ") or (
-            left.endswith(" ")
-            or (
-                left
-                and (left[-1] in SENTENCE_ENDERS or left[-1] in MINOR_BREAKERS)
-            )
-        )
-
-    def _adjust_to_safe(k: int) -> int:
-        if _is_safe_at(k):
-            return k
-        for j in range(k + 1, n):
-            if _is_safe_at(j):
-                return j
-        for j in range(k - 1, 0, -1):
-            if _is_safe_at(j):
-                return j
-        return k
-
-    if safe_after:
-        best = min(safe_after, key=lambda k: abs(cum[k - 1] - mid_chars))
-        return _adjust_to_safe(best)
-
-    mid_tok = n // 2
-    for i in range(mid_tok, 0, -1):
-        t = tokens[i - 1].get("text", "")
-        if t and t[-1] in SENTENCE_ENDERS:
-            return _adjust_to_safe(i)
-    for i in range(mid_tok + 1, n):
-        t = tokens[i - 1].get("text", "")
-        if t and t[-1] in SENTENCE_ENDERS:
-            return _adjust_to_safe(i)
-
-    return _adjust_to_safe(mid_tok)
+    _, lens, flags = _token_arrays(tokens)
+    cum = list(accumulate(lens))
+    mid_chars = cum[-1] // 2
+
+    best = n // 2
+    best_delta = -1
+    for i in range(n - 1):
+        acc = cum[i]
+        # Prefix sums never decrease, so once past the midpoint by at least
+        # the best distance so far no later boundary can beat it.
+        if best_delta >= 0 and acc - mid_chars >= best_delta:
+            break
+        if flags[i + 1] & _STARTS_SPACE or flags[i] & _BREAK_AFTER:
+            delta = abs(acc - mid_chars)
+            if best_delta < 0 or delta < best_delta:
+                best_delta = delta
+                best = i + 1
+    return best
 
 
 def enforce_readability(
@@ -504,9 +647,10 @@ def enforce_readability(
     out: List[dict] = []
 
     for seg in segments:
-        queue = [seg]
-        while queue:
-            current = queue.pop(0)
+        # Depth-first: the left half is always processed before the right.
+        stack = [seg]
+        while stack:
+            current = stack.pop()
             text = _segment_text(current)
             start, end = _segment_time(current)
             dur = max(1, end - start)
@@ -535,39 +679,48 @@ def enforce_readability(
                 if use_ellipses:
                     left["suffix_ellipsis"] = True
                     right["prefix_ellipsis"] = True
-                queue.insert(0, right)
-                queue.insert(0, left)
+                stack.append(right)
+                stack.append(left)
             else:
                 out.append(current)
 
-    changed = True
+    # Merge short segments into their successor, one pairwise pass at a time,
+    # until a pass changes nothing. A segment that did not merge in one pass
+    # can only merge in the next if it or its successor was produced by that
+    # pass, so later passes skip every other segment without inspecting it.
     current_segments = out
-    while changed:
-        changed = False
+    fresh = [True] * len(current_segments)
+    while True in fresh:
         merged: List[dict] = []
+        merged_fresh: List[bool] = []
+        count = len(current_segments)
         i = 0
-        while i < len(current_segments):
+        while i < count:
             seg = current_segments[i]
-            start, end = _segment_time(seg)
-            dur = end - start
-            if dur < min_dur and i + 1 < len(current_segments):
-                if preserve_sentence_breaks and seg.get("sentence_break"):
-                    merged.append(seg)
-                    i += 1
-                    continue
-                nxt = current_segments[i + 1]
-                n_start, n_end = _segment_time(nxt)
-                if n_end - start <= max_dur:
-                    toks = seg["tokens"] + nxt["tokens"]
-                    merged_seg = {"tokens": toks, "start": start, "end": n_end}
-                    merged_seg["sentence_break"] = nxt.get("sentence_break", False)
-                    merged.append(merged_seg)
-                    i += 2
-                    changed = True
-                    continue
+            if i + 1 < count and (fresh[i] or fresh[i + 1]):
+                start = seg["start"]
+                if seg["end"] - start < min_dur and not (
+                    preserve_sentence_breaks and seg.get("sentence_break")
+                ):
+                    nxt = current_segments[i + 1]
+                    n_end = nxt["end"]
+                    if n_end - start <= max_dur:
+                        merged.append(
+                            {
+                                "tokens": seg["tokens"] + nxt["tokens"],
+                                "start": start,
+                                "end": n_end,
+                                "sentence_break": nxt.get("sentence_break", False),
+                            }
+                        )
+                        merged_fresh.append(True)
+                        i += 2
+                        continue
             merged.append(seg)
+            merged_fresh.append(False)
             i += 1
         current_segments = merged
+        fresh = merged_fresh
 
     return current_segments
 
@@ -583,7 +736,8 @@ def _wrap_two_lines_naive(
         return [txt]
 
     preferred = tuple(preferred_delimiters or ())
-    if preferred:
+    # Without a delimiter in the text there is only one chunk to place.
+    if preferred and _delimiter_pattern(preferred).search(txt):
         lines = _wrap_with_preferred_delimiters(txt, preferred, max_cpl, max_lines)
         if lines:
             return lines
@@ -592,19 +746,16 @@ def _wrap_two_lines_naive(
         return [txt]
 
     if " " in txt:
+        # Nearest space to the middle, preferring the left one on a tie.
         target = len(txt) // 2
-        break_pos = None
-        for delta in range(0, len(txt)):
-            left = target - delta
-            right = target + delta
-            if left > 0 and txt[left] == " ":
-                break_pos = left
-                break
-            if right < len(txt) and txt[right] == " ":
-                break_pos = right
-                break
-        if break_pos is None:
-            break_pos = min(len(txt), max_cpl)
+        left = txt.rfind(" ", 1, target + 1)
+        right = txt.find(" ", target)
+        if left == -1:
+            break_pos = right
+        elif right == -1 or target - left <= right - target:
+            break_pos = left
+        else:
+            break_pos = right
         line1 = txt[:break_pos].strip()
         line2 = txt[break_pos:].strip()
         if len(line1) > max_cpl:
@@ -630,7 +781,8 @@ def _wrap_two_lines_token_aware(
         return [stripped]
 
     preferred = tuple(preferred_delimiters or ())
-    if preferred:
+    # Without a delimiter in the text there is only one chunk to place.
+    if preferred and _delimiter_pattern(preferred).search(stripped):
         lines = _wrap_with_preferred_delimiters(stripped, preferred, max_cpl, max_lines)
         if lines:
             return lines
@@ -638,56 +790,52 @@ def _wrap_two_lines_token_aware(
     if len(stripped) <= max_cpl:
         return [stripped]
 
+    texts, lens, flags = _token_arrays(tokens)
+    n = len(tokens)
     safe_after = set()
-    for i in range(len(tokens) - 1):
-        cur = tokens[i].get("text", "")
-        nxt = tokens[i + 1].get("text", "")
-        if not nxt:
+    for i in range(n - 1):
+        if not texts[i + 1]:
             continue
-        if nxt.startswith(" ") or (
-            cur
-            and (
-                cur.endswith(" ")
-                or cur[-1] in SENTENCE_ENDERS
-                or cur[-1] in MINOR_BREAKERS
-            )
-        ):
+        if flags[i + 1] & _STARTS_SPACE or flags[i] & _BREAK_AFTER:
             safe_after.add(i)
 
-    char_len = 0
+    cum = list(accumulate(lens))
     last_safe = None
-    for i, tok in enumerate(tokens):
-        char_len += len(tok.get("text", ""))
+    for i in range(n):
         if i in safe_after:
             last_safe = i
-        if char_len > max_cpl:
-            if last_safe is not None:
-                candidate = last_safe
-                while candidate >= 0:
-                    if candidate in safe_after:
-                        left_text = _concat_text(tokens[: candidate + 1]).rstrip()
-                        if len(left_text) <= max_cpl:
-                            right_text = _concat_text(tokens[candidate + 1 :]).lstrip()
-                            if len(right_text) <= max_cpl:
-                                return [left_text, right_text]
-                    candidate -= 1
+        if cum[i] > max_cpl:
+            # Walk candidates right to left. The left side only shrinks and the
+            # right side only grows, so raw prefix lengths settle most checks
+            # and the first right side that overflows ends the search.
+            for candidate in range(last_safe if last_safe is not None else -1, -1, -1):
+                if candidate not in safe_after:
+                    continue
+                left_text = None
+                if cum[candidate] > max_cpl:
+                    left_text = "".join(texts[: candidate + 1]).strip()
+                    if len(left_text) > max_cpl:
+                        continue
+                right_text = "".join(texts[candidate + 1 :]).strip()
+                if len(right_text) > max_cpl:
+                    break
+                if left_text is None:
+                    left_text = "".join(texts[: candidate + 1]).strip()
+                return [left_text, right_text]
             break
 
-    total_chars = sum(len(t.get("text", "")) for t in tokens)
-    target = total_chars // 2
-    acc = 0
+    target = cum[-1] // 2 if cum else 0
     nearest = None
     best_delta = 10**9
-    for i in range(len(tokens) - 1):
-        acc += len(tokens[i].get("text", ""))
+    for i in range(n - 1):
         if i in safe_after:
-            delta = abs(acc - target)
+            delta = abs(cum[i] - target)
             if delta < best_delta:
                 best_delta = delta
                 nearest = i
     if nearest is not None:
-        left_text = _concat_text(tokens[: nearest + 1]).rstrip()
-        right_text = _concat_text(tokens[nearest + 1 :]).lstrip()
+        left_text = "".join(texts[: nearest + 1]).strip()
+        right_text = "".join(texts[nearest + 1 :]).strip()
         if len(left_text) <= max_cpl and len(right_text) <= max_cpl:
             return [left_text, right_text]
 
@@ -698,9 +846,8 @@ def tokens_to_subtitle_segments(
     tokens: Sequence[dict],
     config: SubtitleConfig,
 ) -> List[dict]:
-    words = tokens_to_words(tokens)
     segments = build_segments(
-        words,
+        _iter_words(tokens),
         config.gap_ms,
         config.split_on_speaker,
         config.segment_on_sentence,
@@ -723,7 +870,21 @@ def render_segments(
     segments: Sequence[dict],
     config: SubtitleConfig,
 ) -> List[SubtitleEntry]:
-    entries: List[SubtitleEntry] = []
+    return list(iter_render_segments(segments, config))
+
+
+def iter_render_segments(
+    segments: Iterable[dict],
+    config: SubtitleConfig,
+) -> Iterator[SubtitleEntry]:
+    """Yield rendered entries one at a time; see :func:`render_segments`.
+
+    Pair with :func:`write_srt_file` to write subtitles without holding every
+    entry in memory.
+    """
+    max_cpl = config.max_cpl
+    max_lines = config.max_lines
+    delimiters = _effective_delimiters(tuple(config.line_split_delimiters))
     for idx, seg in enumerate(segments, start=1):
         text = _segment_text(seg)
         if seg.get("prefix_ellipsis"):
@@ -736,39 +897,49 @@ def render_segments(
             lines = _wrap_two_lines_token_aware(
                 tokens,
                 text,
-                config.max_cpl,
-                config.max_lines,
-                config.line_split_delimiters,
+                max_cpl,
+                max_lines,
+                delimiters,
             )
         else:
             lines = _wrap_two_lines_naive(
                 text,
-                config.max_cpl,
-                config.max_lines,
-                config.line_split_delimiters,
-            )
-        entries.append(
-            SubtitleEntry(
-                index=idx,
-                start_ms=seg["start"],
-                end_ms=seg["end"],
-                lines=lines[: config.max_lines],
+                max_cpl,
+                max_lines,
+                delimiters,
             )
+        yield SubtitleEntry(
+            index=idx,
+            start_ms=seg["start"],
+            end_ms=seg["end"],
+            lines=lines[:max_lines],
         )
-    return entries
 
 
-def write_srt_file(entries: Sequence[SubtitleEntry], output_path: Path | str) -> None:
+def write_srt_file(entries: Iterable[SubtitleEntry], output_path: Path | str) -> int:
+    """Write ``entries`` as SRT and return how many were written.
+
+    ``entries`` may be any iterable, such as :func:`iter_render_segments`.
+    """
     path = Path(output_path)
-    with path.open("w", encoding="utf-8") as handle:
-        for entry in entries:
-            handle.write(f"{entry.index}\n")
-            handle.write(
+    count = 0
+    with path.open("w", encoding="utf-8", buffering=SRT_WRITE_BUFFER) as handle:
+        buf: List[str] = []
+        for count, entry in enumerate(entries, start=1):
+            buf.append(
+                f"{entry.index}\n"
                 f"{format_timestamp(entry.start_ms)} --> {format_timestamp(entry.end_ms)}\n"
             )
             for line in entry.lines:
-                handle.write(f"{line}\n")
-            handle.write("\n")
+                buf.append(line)
+                buf.append("\n")
+            buf.append("\n")
+            if len(buf) >= 4096:
+                handle.write("".join(buf))
+                buf.clear()
+        if buf:
+            handle.write("".join(buf))
+    return count
 
 
 def srt(
@@ -783,19 +954,17 @@ def srt(
     if isinstance(transcript, (str, Path)):
         path = Path(transcript)
         LOGGER.info("Loading transcript from %s", path)
-        data = json.loads(path.read_text(encoding="utf-8"))
+        tokens = load_tokens(path)
     else:
-        data = transcript
+        tokens = extract_tokens(transcript)
 
-    tokens = extract_tokens(data)
     segments = tokens_to_subtitle_segments(tokens, config)
     if not segments:
         raise ValueError("No subtitle segments produced from transcript.")
 
-    entries = render_segments(segments, config)
     output_path = Path(output_path)
-    LOGGER.info("Writing %d subtitles to %s", len(entries), output_path)
-    write_srt_file(entries, output_path)
+    LOGGER.info("Writing %d subtitles to %s", len(segments), output_path)
+    write_srt_file(iter_render_segments(segments, config), output_path)
     return output_path
 
 
@@ -803,6 +972,8 @@ __all__ = [
     "SubtitleConfig",
     "SubtitleEntry",
     "extract_tokens",
+    "iter_render_segments",
+    "load_tokens",
     "render_segments",
     "srt",
     "tokens_to_subtitle_segments",
@@ -2,13 +2,15 @@
 
 from __future__ import annotations
 
-import json
 import logging
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
 
+from . import _json
 from .api import (
     DEFAULT_BASE_URL,
+    DEFAULT_MAX_CONCURRENCY,
     DEFAULT_POLL_INTERVAL,
     SonioxClient,
     SonioxError,
@@ -41,6 +43,31 @@ def transcribe_audio(
     client: Optional[SonioxClient] = None,
     base_url: Optional[str] = None,
 ) -> Dict[str, Any]:
+    return _run_transcription(
+        audio_path=audio_path,
+        audio_url=audio_url,
+        model=model,
+        extra_options=extra_options,
+        poll_interval=poll_interval,
+        keep_remote=keep_remote,
+        client=client,
+        base_url=base_url,
+    )
+
+
+def _run_transcription(
+    *,
+    audio_path: Optional[Path | str],
+    audio_url: Optional[str],
+    model: str,
+    extra_options: Optional[Dict[str, Any]],
+    poll_interval: float,
+    keep_remote: bool,
+    client: Optional[SonioxClient],
+    base_url: Optional[str],
+    on_transcript: Optional[Callable[[Dict[str, Any]], None]] = None,
+) -> Dict[str, Any]:
+    """Run a transcription job; ``on_transcript`` fires before remote cleanup."""
     if not audio_path and not audio_url:
         raise ValueError("Specify either audio_path or audio_url.")
 
@@ -77,6 +104,8 @@ def transcribe_audio(
         )
         LOGGER.info("Fetching transcript %s", transcription_id)
         transcript = soniox_client.fetch_transcript(transcription_id)
+        if on_transcript is not None:
+            on_transcript(transcript)
         return transcript
     finally:
         if not keep_remote:
@@ -150,28 +179,133 @@ def transcribe_to_file(
     client: Optional[SonioxClient] = None,
     base_url: Optional[str] = None,
 ) -> Dict[str, Any]:
-    transcript = transcribe_audio(
-        audio_path=audio_path,
-        audio_url=audio_url,
+    output = Path(output_path)
+    pending: List[Future] = []
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+
+        def write_transcript(transcript: Dict[str, Any]) -> None:
+            # Serialise and write while the remote file and job are deleted.
+            LOGGER.info("Writing transcript JSON to %s", output)
+            pending.append(executor.submit(_write_transcript, output, transcript))
+
+        transcript = _run_transcription(
+            audio_path=audio_path,
+            audio_url=audio_url,
+            model=model,
+            extra_options=extra_options,
+            poll_interval=poll_interval,
+            keep_remote=keep_remote,
+            client=client,
+            base_url=base_url,
+            on_transcript=write_transcript,
+        )
+        for future in pending:
+            future.result()
+    return transcript
+
+
+def transcribe_many(
+    audio_paths: Sequence[Path | str],
+    *,
+    model: str = "stt-async-preview",
+    extra_options: Optional[Dict[str, Any]] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    keep_remote: bool = False,
+    client: Optional[SonioxClient] = None,
+    base_url: Optional[str] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    on_transcript: Optional[Callable[[Path, Dict[str, Any]], None]] = None,
+) -> List[Dict[str, Any]]:
+    """Transcribe several local files concurrently over one client.
+
+    Every job shares a single session, so connections are reused across
+    uploads and polls. A file listed more than once is transcribed once.
+    ``on_transcript`` receives each resolved path and its transcript before
+    remote cleanup. Transcripts are returned in the order of ``audio_paths``;
+    the first failure is re-raised once all submitted jobs have finished.
+    """
+    if not audio_paths:
+        return []
+    resolved = [Path(audio_path).resolve() for audio_path in audio_paths]
+    unique = list(dict.fromkeys(resolved))
+
+    soniox_client, owns_client = _ensure_client(client, base_url=base_url)
+
+    def run(audio_path: Path) -> Dict[str, Any]:
+        return _run_transcription(
+            audio_path=audio_path,
+            audio_url=None,
+            model=model,
+            extra_options=extra_options,
+            poll_interval=poll_interval,
+            keep_remote=keep_remote,
+            client=soniox_client,
+            base_url=base_url,
+            on_transcript=(
+                (lambda transcript: on_transcript(audio_path, transcript))
+                if on_transcript is not None
+                else None
+            ),
+        )
+
+    try:
+        workers = max(1, min(int(max_concurrency), len(unique)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {audio_path: executor.submit(run, audio_path) for audio_path in unique}
+            return [futures[audio_path].result() for audio_path in resolved]
+    finally:
+        if owns_client:
+            soniox_client.close()
+
+
+def transcribe_many_to_files(
+    jobs: Sequence[Tuple[Path | str, Path | str]],
+    *,
+    model: str = "stt-async-preview",
+    extra_options: Optional[Dict[str, Any]] = None,
+    poll_interval: float = DEFAULT_POLL_INTERVAL,
+    keep_remote: bool = False,
+    client: Optional[SonioxClient] = None,
+    base_url: Optional[str] = None,
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+) -> List[Dict[str, Any]]:
+    """Transcribe ``(audio_path, output_path)`` jobs with :func:`transcribe_many`.
+
+    A file listed more than once is transcribed once and written to each of
+    its outputs. Transcripts are returned in job order.
+    """
+    outputs: Dict[Path, List[Path]] = {}
+    for audio_path, output_path in jobs:
+        outputs.setdefault(Path(audio_path).resolve(), []).append(Path(output_path))
+
+    def write_transcript(audio_path: Path, transcript: Dict[str, Any]) -> None:
+        for output in outputs[audio_path]:
+            LOGGER.info("Writing transcript JSON to %s", output)
+            _write_transcript(output, transcript)
+
+    return transcribe_many(
+        [audio_path for audio_path, _ in jobs],
         model=model,
         extra_options=extra_options,
         poll_interval=poll_interval,
         keep_remote=keep_remote,
         client=client,
         base_url=base_url,
+        max_concurrency=max_concurrency,
+        on_transcript=write_transcript,
     )
-    output = Path(output_path)
-    LOGGER.info("Writing transcript JSON to %s", output)
-    output.write_text(
-        json.dumps(transcript, ensure_ascii=False, indent=2),
-        encoding="utf-8",
-    )
-    return transcript
+
+
+def _write_transcript(output: Path, transcript: Dict[str, Any]) -> None:
+    output.write_bytes(_json.dumps_indented(transcript))
 
 
 __all__ = [
     "transcribe_audio",
     "transcribe_audio_file",
     "transcribe_audio_url",
+    "transcribe_many",
+    "transcribe_many_to_files",
     "transcribe_to_file",
 ]
@@ -5,11 +5,18 @@ from __future__ import annotations
 import os
 import re
 import logging
-import xml.etree.ElementTree as ET
+import threading
+import time
+from collections import Counter
 from dataclasses import dataclass, field
+from functools import lru_cache
+from types import SimpleNamespace
 from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
-from xml.sax.saxutils import escape
 
+from . import _json
+from ._llm_cache import CachingCompletions, cache_from_env
+from ._retry import retry_call
+from ._semantic_cache import SemanticCachingCompletions, semantic_cache_from_env
 from .api import require_api_key
 from .subtitles import SubtitleConfig, SubtitleEntry
 
@@ -19,9 +26,70 @@ LLM_MODEL_ENV = "LLM_MODEL"
 DEFAULT_MODEL_ENV = "DEFAULT_MODEL"
 LLM_BASE_URL_ENV = "LLM_BASE_URL"
 
+# Kept for callers that imported it; parsing goes through _parse_numbered_line.
 _LINE_PATTERN = re.compile(r"^(?P<index>\d+)[\s\.:\-)]+(?P<text>.*)$")
+_NUMBER_SEPARATORS = frozenset(".:-)")
+_ASCII_DIGITS = "0123456789"
+# ".:-)" plus every character str.isspace() (and so regex \s) accepts.
+_SEPARATOR_CHARS = (
+    ".:-)\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680"
+    "\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007\u2008\u2009\u200a"
+    "\u2028\u2029\u202f\u205f\u3000"
+)
 DEFAULT_CHUNK_SIZE = 200
+DEFAULT_TRANSLATION_CONCURRENCY = 4
 MAX_TRANSLATION_RETRIES = 2
+LLM_MAX_ATTEMPTS = 5
+LLM_BACKOFF_INITIAL = 1.0
+LLM_BACKOFF_MAX = 30.0
+BATCH_POLL_INTERVAL = 15.0
+_BATCH_ENDPOINT = "/v1/chat/completions"
+_BATCH_FAILED_STATUSES = frozenset({"failed", "expired", "cancelled"})
+# Batch file and status calls are not wrapped in _create_with_retry, so they
+# keep the SDK's own retries (its default count) on the shared client.
+_BATCH_SDK_MAX_RETRIES = 2
+FULL_CONTEXT_MAX_CHARS = 60_000
+FULL_CONTEXT_WINDOW_ENTRIES = 50
+
+_TRANSLATION_SYSTEM_PROMPT = (
+    "You are a senior audiovisual (AVT) subtitle localizer. Produce fluent,"
+    " idiomatic, speakable dialogue in the requested target language, preserving"
+    " tone, register, sarcasm, humor, and intensity (including slang/profanity)."
+    " Prefer natural phrasing over literal calques. Keep character voice"
+    " consistent within this batch. Preserve proper names, brands, acronyms,"
+    " and in-universe terms (transliterate only if widely conventional). Keep"
+    " numbers/units; adapt punctuation to target-language norms. Be concise and"
+    " oral: favor contractions and colloquial syntax where natural; avoid"
+    " bookish phrasing. Output policy (strict): one line per input line, exactly"
+    " '<number> <translated text>'. Keep the exact input numbering; do not"
+    " renumber, insert, merge, or reorder lines. No extra lines or code fences."
+)
+# Shared by every request without transcript context; treat as read-only.
+_TRANSLATION_SYSTEM_MESSAGE = {"role": "system", "content": _TRANSLATION_SYSTEM_PROMPT}
+
+_PROMPT_CONSTRAINTS = (
+    "Constraints:\n"
+    "- Keep the exact numbering from input; do not renumber or insert new numbers.\n"
+    "- Output must be valid XML in the following form: <subtitles><line index=\"N\">text</line>...</subtitles>.\n"
+    "- Provide exactly one <line> element per input line.\n"
+    "- Keep it concise, idiomatic, and speakable; preserve tone, register, slang, and intensity.\n"
+    "- Do not add commentary, explanations, or metadata.\n\n"
+    "Example output:\n"
+    "<subtitles>\n  <line index=\"123\">Texto</line>\n  <line index=\"124\">Mais texto</line>\n</subtitles>\n\n"
+)
+
+_REFINE_NOTES = (
+    "\n\nYou are refining an existing translation. Apply the review notes to fix issues"
+    " while preserving lines that already sound natural. Ensure the final XML obeys the"
+    " <subtitles><line index=\"...\">...</line></subtitles> structure."
+)
+
+_RETRY_REASONS = {
+    "count_mismatch": "the number of returned lines did not match the input",
+    "numbering_mismatch": "some line numbers did not align with the input",
+    "missing_text": "one or more lines were empty",
+}
+_DEFAULT_RETRY_REASON = "the required format was not respected"
 
 
 LOGGER = logging.getLogger(__name__)
@@ -33,7 +101,13 @@ class TranslationStats:
     completion_tokens: int = 0
     total_tokens: int = 0
     calls: int = 0
-    per_stage: Dict[str, int] = field(default_factory=dict)
+    cache_hits: int = 0
+    embedding_tokens: int = 0
+    embedding_calls: int = 0
+    per_stage: Counter = field(default_factory=Counter)
+    _lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def record(self, stage: str, usage: Optional[object]) -> None:
         if not usage:
@@ -43,36 +117,99 @@ class TranslationStats:
         total = getattr(usage, "total_tokens", None)
         if prompt is None and completion is None and total is None:
             return
-        if prompt is not None:
-            self.prompt_tokens += int(prompt)
-        if completion is not None:
-            self.completion_tokens += int(completion)
-        if total is not None:
-            self.total_tokens += int(total)
-        else:
-            self.total_tokens += int(prompt or 0) + int(completion or 0)
-        self.calls += 1
-        self.per_stage[stage] = self.per_stage.get(stage, 0) + 1
+        prompt_count = int(prompt or 0)
+        completion_count = int(completion or 0)
+        total_count = int(total) if total is not None else prompt_count + completion_count
+        # Chunks may be translated concurrently, so every update happens under
+        # the lock; the usage conversion above stays outside it.
+        with self._lock:
+            self.prompt_tokens += prompt_count
+            self.completion_tokens += completion_count
+            self.total_tokens += total_count
+            self.calls += 1
+            self.per_stage[stage] += 1
+
+    def record_cache_hit(self, stage: str) -> None:
+        with self._lock:
+            self.cache_hits += 1
+            self.per_stage[f"{stage}:cached"] += 1
+
+    def record_embedding(self, usage: Optional[object]) -> None:
+        total = getattr(usage, "total_tokens", None)
+        if total is None:
+            total = getattr(usage, "prompt_tokens", None)
+        with self._lock:
+            self.embedding_calls += 1
+            self.embedding_tokens += int(total or 0)
+
+
+def _parse_numbered_line(line: str) -> Optional[Tuple[int, str]]:
+    """Split ``"12. text"`` into ``(12, "text")``, accepting what ``_LINE_PATTERN`` does.
+
+    Returns ``None`` when the line does not start with a number followed by at
+    least one separator (whitespace or one of ``.:-)``).
+    """
+    # str.lstrip walks the ASCII digits and the separators in C; only lines
+    # numbered with other Unicode decimal digits take the per-character scan.
+    rest = line.lstrip(_ASCII_DIGITS)
+    if rest[:1].isdecimal():
+        return _scan_numbered_line(line)
+    digits = len(line) - len(rest)
+    if not digits:
+        return None
+    text = rest.lstrip(_SEPARATOR_CHARS)
+    if len(text) == len(rest):
+        return None
+    return int(line[:digits]), text.strip()
 
 
-def _format_entries(entries: Sequence[SubtitleEntry]) -> str:
-    lines: List[str] = []
-    for entry in entries:
-        text = " ".join(line.strip() for line in entry.lines if line.strip()).strip()
-        if not text:
-            continue
-        lines.append(f"{entry.index} {text}")
-    return "\n".join(lines)
+def _scan_numbered_line(line: str) -> Optional[Tuple[int, str]]:
+    length = len(line)
+    pos = 0
+    while pos < length and line[pos].isdecimal():
+        pos += 1
+    if pos == 0:
+        return None
+    end = pos
+    separators = _NUMBER_SEPARATORS
+    while end < length and (line[end] in separators or line[end].isspace()):
+        end += 1
+    if end == pos:
+        return None
+    return int(line[:pos]), line[end:].strip()
+
 
+def _escape(text: str) -> str:
+    # Same replacements as xml.sax.saxutils.escape, without importing xml.sax.
+    return text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
 
-def _format_entries_xml(entries: Sequence[SubtitleEntry]) -> str:
-    parts: List[str] = ["<subtitles>"]
-    for entry in entries:
-        text = " ".join(line.strip() for line in entry.lines if line.strip()).strip()
-        escaped_text = escape(text)
-        parts.append(f"  <line index=\"{entry.index}\">{escaped_text}</line>")
-    parts.append("</subtitles>")
-    return "\n".join(parts)
+
+def _joined_text(entry: SubtitleEntry) -> str:
+    return " ".join(filter(None, [line.strip() for line in entry.lines]))
+
+
+def _format_entries(
+    entries: Sequence[SubtitleEntry], texts: Optional[Sequence[str]] = None
+) -> str:
+    if texts is None:
+        return "\n".join(
+            f"{entry.index} {text}" for entry in entries if (text := _joined_text(entry))
+        )
+    return "\n".join(
+        f"{entry.index} {text}" for entry, text in zip(entries, texts) if text
+    )
+
+
+def _format_entries_xml(
+    entries: Sequence[SubtitleEntry], texts: Optional[Sequence[str]] = None
+) -> str:
+    if texts is None:
+        texts = map(_joined_text, entries)
+    body = "".join(
+        f"  <line index=\"{entry.index}\">{_escape(text)}</line>\n"
+        for entry, text in zip(entries, texts)
+    )
+    return f"<subtitles>\n{body}</subtitles>"
 
 
 def _parse_translated_lines(
@@ -90,10 +227,9 @@ def _parse_translated_lines(
         line = raw_line.strip()
         if not line:
             continue
-        match = _LINE_PATTERN.match(line)
-        if match:
-            current_index = int(match.group("index"))
-            text = match.group("text").strip()
+        parsed = _parse_numbered_line(line)
+        if parsed is not None:
+            current_index, text = parsed
             mapping[current_index] = text
             ordered_pairs.append((current_index, text))
         elif current_index is not None:
@@ -105,6 +241,12 @@ def _parse_translated_lines(
             )
 
     expected_list = list(expected_indices)
+    # Subtitle indices are unique, so equal sizes plus membership is set equality.
+    if len(mapping) == len(expected_list) and all(
+        index in mapping for index in expected_list
+    ):
+        return mapping
+
     expected_set = set(expected_list)
     if set(mapping) != expected_set:
         mapped_keys = [index for index, _ in ordered_pairs]
@@ -140,9 +282,9 @@ def _fallback_sequential_mapping(
 
     cleaned: List[str] = []
     for line in lines:
-        match = _LINE_PATTERN.match(line)
-        if match:
-            cleaned.append(match.group("text").strip())
+        parsed = _parse_numbered_line(line)
+        if parsed is not None:
+            cleaned.append(parsed[1])
         else:
             cleaned.append(line)
 
@@ -154,8 +296,12 @@ def _fallback_sequential_mapping(
 
 def _parse_xml_lines(translated: str) -> Optional[Dict[int, str]]:
     stripped = translated.strip()
-    if not stripped or "<" not in stripped or ">" not in stripped:
+    # A well-formed document has to open with markup, so numbered-text
+    # responses skip the parser (and its exception) entirely.
+    if not stripped.startswith("<") or not stripped.endswith(">"):
         return None
+    import xml.etree.ElementTree as ET  # Deferred: only XML responses need it.
+
     try:
         root = ET.fromstring(stripped)
     except ET.ParseError:
@@ -197,11 +343,68 @@ def _wrap_translated_text(text: str, config: SubtitleConfig) -> List[str]:
     )
 
 
+def _resolve_chunk_size(chunk_size: int, total: int) -> int:
+    if chunk_size <= 0:
+        return total
+    return max(1, int(chunk_size))
+
+
 def _chunks(entries: Sequence[SubtitleEntry], size: int) -> Iterator[Sequence[SubtitleEntry]]:
     for start in range(0, len(entries), size):
         yield entries[start : start + size]
 
 
+def _chunk_contexts(
+    entries: Sequence[SubtitleEntry],
+    chunk_size: int,
+    max_chars: int = FULL_CONTEXT_MAX_CHARS,
+) -> List[str]:
+    """Return the transcript context to send with each chunk.
+
+    Every chunk shares the whole transcript while it fits in ``max_chars``;
+    longer transcripts get a window of ``FULL_CONTEXT_WINDOW_ENTRIES`` entries
+    on either side of the chunk instead.
+    """
+    texts = [_joined_text(entry) for entry in entries]
+    starts = range(0, len(entries), chunk_size)
+    full = _format_entries_xml(entries, texts)
+    if len(full) <= max_chars:
+        return [full] * len(starts)
+    window = FULL_CONTEXT_WINDOW_ENTRIES
+    contexts: List[str] = []
+    for start in starts:
+        low = max(0, start - window)
+        high = min(len(entries), start + chunk_size + window)
+        contexts.append(_format_entries_xml(entries[low:high], texts[low:high]))
+    return contexts
+
+
+@lru_cache(maxsize=8)
+def _parse_xml_block(block: str) -> Optional[Tuple[Tuple[int, str], ...]]:
+    """Parse an XML subtitle block once into ordered ``(index, text)`` pairs.
+
+    The refine stage filters the same draft block for every chunk and retry;
+    caching the parse keeps that to a single ElementTree pass per block.
+    """
+    import xml.etree.ElementTree as ET  # Deferred: only XML responses need it.
+
+    try:
+        root = ET.fromstring(block)
+    except ET.ParseError:
+        return None
+    pairs: List[Tuple[int, str]] = []
+    for elem in root.findall(".//line"):
+        idx_text = elem.get("index") or elem.get("id")
+        if not idx_text:
+            continue
+        try:
+            idx = int(idx_text)
+        except ValueError:
+            continue
+        pairs.append((idx, (elem.text or "").strip()))
+    return tuple(pairs)
+
+
 def _filter_block_by_indices(
     block: Optional[str], indices: Sequence[int]
 ) -> Optional[str]:
@@ -211,44 +414,36 @@ def _filter_block_by_indices(
     filtered: List[str] = []
     stripped = block.strip()
     if stripped.startswith("<"):
-        try:
-            root = ET.fromstring(stripped)
-        except ET.ParseError:
+        pairs = _parse_xml_block(stripped)
+        if pairs is None:
             return block
-        new_root = ET.Element("subtitles")
-        for elem in root.findall(".//line"):
-            idx_text = elem.get("index") or elem.get("id")
-            if not idx_text:
-                continue
-            try:
-                idx = int(idx_text)
-            except ValueError:
-                continue
+        # Same serialisation ElementTree.tostring produces for these elements.
+        for idx, text in pairs:
             if idx in allowed:
-                new_elem = ET.SubElement(new_root, "line", index=str(idx))
-                new_elem.text = (elem.text or "").strip()
-        if not list(new_root):
+                if text:
+                    filtered.append(f'<line index="{idx}">{_escape(text)}</line>')
+                else:
+                    filtered.append(f'<line index="{idx}" />')
+        if not filtered:
             return None
-        return ET.tostring(new_root, encoding="unicode")
+        return "<subtitles>" + "".join(filtered) + "</subtitles>"
 
     for raw_line in stripped.splitlines():
         line = raw_line.strip()
         if not line:
             continue
-        match = _LINE_PATTERN.match(line)
-        if match and int(match.group("index")) in allowed:
+        parsed = _parse_numbered_line(line)
+        if parsed is not None and parsed[0] in allowed:
             filtered.append(line)
     if not filtered:
         return None
     return "\n".join(filtered)
 
 
-def _invoke_translation(
-    completions_api,
+def _translation_messages(
     *,
     target_language: str,
     numbered_block: str,
-    model: str,
     first_index: int,
     last_index: int,
     expected_count: int,
@@ -258,88 +453,156 @@ def _invoke_translation(
     draft_block: Optional[str] = None,
     review_notes: Optional[str] = None,
     full_context: Optional[str] = None,
-    stats: Optional[TranslationStats] = None,
-) -> str:
-    reminder = ""
+) -> List[Dict[str, str]]:
+    parts = [
+        f"Translate the numbered subtitle lines into {target_language}.\n",
+        _PROMPT_CONSTRAINTS,
+        f"Context: First input number = {first_index}; last input number = {last_index}.\n"
+        "Treat this batch as a contiguous excerpt; keep voice/register consistent across lines."
+        f"\nThe very first output line must start with '{first_index} '."
+        f" The final output line must start with '{last_index} '. Do NOT restart numbering at 1 or"
+        " omit any line numbers.",
+    ]
+    if stage == "refine":
+        parts.append(_REFINE_NOTES)
+    parts.append("\n\nInput numbered lines:\n")
+    parts.append(numbered_block)
     if attempt > 0:
-        if retry_reason == "count_mismatch":
-            reason = "the number of returned lines did not match the input"
-        elif retry_reason == "numbering_mismatch":
-            reason = "some line numbers did not align with the input"
-        elif retry_reason == "missing_text":
-            reason = "one or more lines were empty"
-        else:
-            reason = "the required format was not respected"
-        reminder = (
+        reason = _RETRY_REASONS.get(retry_reason, _DEFAULT_RETRY_REASON)
+        parts.append(
             f"\n\nReminder: You must output exactly {expected_count} lines."
             " Each line must start with the original number."
             f" The previous attempt failed because {reason}."
         )
+    if draft_block:
+        parts.append("\n\nExisting translation:\n")
+        parts.append(draft_block)
+    if review_notes:
+        parts.append("\n\nReview notes to address:\n")
+        parts.append(review_notes)
 
-    stage_notes = ""
-    if stage == "refine":
-        stage_notes = (
-            "\n\nYou are refining an existing translation. Apply the review notes to fix issues"
-            " while preserving lines that already sound natural. Ensure the final XML obeys the"
-            " <subtitles><line index=\"...\">...</line></subtitles> structure."
-        )
+    if full_context:
+        # Kept in the system message so every chunk request shares the same
+        # prefix, which lets providers with prompt caching reuse it.
+        system_message = {
+            "role": "system",
+            "content": _TRANSLATION_SYSTEM_PROMPT
+            + "\n\nFull transcript context (do not renumber; for reference only):\n"
+            + full_context,
+        }
+    else:
+        system_message = _TRANSLATION_SYSTEM_MESSAGE
+
+    return [system_message, {"role": "user", "content": "".join(parts)}]
+
+
+def _collect_stream(chunks: Iterable[object]) -> SimpleNamespace:
+    """Drain a streamed chat completion into the non-streaming response shape.
+
+    Content deltas are gathered as they arrive; the usage block comes with the
+    final chunk when ``stream_options={"include_usage": True}`` was requested.
+    """
+    parts: List[str] = []
+    append = parts.append
+    usage = None
+    for chunk in chunks:
+        choices = getattr(chunk, "choices", None)
+        if choices:
+            delta = getattr(choices[0], "delta", None)
+            content = getattr(delta, "content", None)
+            if content:
+                append(content)
+        chunk_usage = getattr(chunk, "usage", None)
+        if chunk_usage:
+            usage = chunk_usage
+    message = SimpleNamespace(content="".join(parts))
+    return SimpleNamespace(choices=[SimpleNamespace(message=message)], usage=usage)
+
+
+@lru_cache(maxsize=1)
+def _retryable_llm_errors() -> Tuple[type, ...]:
+    try:
+        import openai
+    except ModuleNotFoundError:  # pragma: no cover - custom clients raise their own errors
+        return ()
+    return (openai.RateLimitError, openai.APIConnectionError, openai.InternalServerError)
 
-    prompt = (
-        f"Translate the numbered subtitle lines into {target_language}.\n"
-        "Constraints:\n"
-        "- Keep the exact numbering from input; do not renumber or insert new numbers.\n"
-        "- Output must be valid XML in the following form: <subtitles><line index=\"N\">text</line>...</subtitles>.\n"
-        "- Provide exactly one <line> element per input line.\n"
-        "- Keep it concise, idiomatic, and speakable; preserve tone, register, slang, and intensity.\n"
-        "- Do not add commentary, explanations, or metadata.\n\n"
-        "Example output:\n"
-        "<subtitles>\n  <line index=\"123\">Texto</line>\n  <line index=\"124\">Mais texto</line>\n</subtitles>\n\n"
-        f"Context: First input number = {first_index}; last input number = {last_index}.\n"
-        "Treat this batch as a contiguous excerpt; keep voice/register consistent across lines."
-        f"\nThe very first output line must start with '{first_index} '."
-        f" The final output line must start with '{last_index} '. Do NOT restart numbering at 1 or"
-        " omit any line numbers."
-        f"{stage_notes}\n\n"
-        "Input numbered lines:\n"
-        f"{numbered_block}" + reminder
+
+def _retry_after_seconds(exc: BaseException) -> Optional[float]:
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return min(LLM_BACKOFF_MAX, max(0.0, float(headers.get("retry-after"))))
+    except (TypeError, ValueError):
+        return None
+
+
+def _create_with_retry(completions_api, **kwargs):
+    """Call ``completions_api.create`` and retry rate limits and transient failures.
+
+    Waits grow exponentially with random jitter, capped at ``LLM_BACKOFF_MAX``;
+    a server ``Retry-After`` header replaces the computed wait, under the same cap.
+    """
+    retryable = _retryable_llm_errors()
+    return retry_call(
+        lambda: completions_api.create(**kwargs),
+        should_retry=lambda exc: isinstance(exc, retryable),
+        attempts=LLM_MAX_ATTEMPTS,
+        initial=LLM_BACKOFF_INITIAL,
+        max_delay=LLM_BACKOFF_MAX,
+        delay_hint=_retry_after_seconds,
+        description="LLM request",
     )
 
-    if draft_block:
-        prompt += "\n\nExisting translation:\n" + draft_block
-    if review_notes:
-        prompt += "\n\nReview notes to address:\n" + review_notes
-    if full_context:
-        prompt += (
-            "\n\nFull transcript context (do not renumber; for reference only):\n"
-            f"{full_context}"
-        )
 
-    response = completions_api.create(
+def _invoke_translation(
+    completions_api,
+    *,
+    target_language: str,
+    numbered_block: str,
+    model: str,
+    first_index: int,
+    last_index: int,
+    expected_count: int,
+    attempt: int = 0,
+    retry_reason: Optional[str] = None,
+    stage: str = "draft",
+    draft_block: Optional[str] = None,
+    review_notes: Optional[str] = None,
+    full_context: Optional[str] = None,
+    stats: Optional[TranslationStats] = None,
+    stream: bool = False,
+) -> str:
+    stream_kwargs = (
+        {"stream": True, "stream_options": {"include_usage": True}} if stream else {}
+    )
+    response = _create_with_retry(
+        completions_api,
         model=model,
         temperature=0.0,
-        messages=[
-            {
-                "role": "system",
-                "content": (
-                    "You are a senior audiovisual (AVT) subtitle localizer. Produce fluent,"
-                    " idiomatic, speakable dialogue in the requested target language, preserving"
-                    " tone, register, sarcasm, humor, and intensity (including slang/profanity)."
-                    " Prefer natural phrasing over literal calques. Keep character voice"
-                    " consistent within this batch. Preserve proper names, brands, acronyms,"
-                    " and in-universe terms (transliterate only if widely conventional). Keep"
-                    " numbers/units; adapt punctuation to target-language norms. Be concise and"
-                    " oral: favor contractions and colloquial syntax where natural; avoid"
-                    " bookish phrasing. Output policy (strict): one line per input line, exactly"
-                    " '<number> <translated text>'. Keep the exact input numbering; do not"
-                    " renumber, insert, merge, or reorder lines. No extra lines or code fences."
-                ),
-            },
-            {"role": "user", "content": prompt},
-        ],
+        **stream_kwargs,
+        messages=_translation_messages(
+            target_language=target_language,
+            numbered_block=numbered_block,
+            first_index=first_index,
+            last_index=last_index,
+            expected_count=expected_count,
+            attempt=attempt,
+            retry_reason=retry_reason,
+            stage=stage,
+            draft_block=draft_block,
+            review_notes=review_notes,
+            full_context=full_context,
+        ),
     )
+    if stream and not hasattr(response, "choices"):
+        response = _collect_stream(response)
 
     if stats is not None:
         stats.record(stage, getattr(response, "usage", None))
+        if getattr(response, "cached", False):
+            stats.record_cache_hit(stage)
 
     try:
         return response.choices[0].message.content  # type: ignore[index]
@@ -347,7 +610,7 @@ def _invoke_translation(
         raise ValueError("Unexpected LLM response format") from exc
 
 
-def _translate_chunk(
+def _translate_chunk_once(
     chunk: Sequence[SubtitleEntry],
     *,
     completions_api,
@@ -361,12 +624,16 @@ def _translate_chunk(
     review_notes: Optional[str] = None,
     full_context: Optional[str] = None,
     stats: Optional[TranslationStats] = None,
-) -> List[SubtitleEntry]:
+    prefetched: Optional[str] = None,
+    stream: bool = False,
+) -> Optional[List[SubtitleEntry]]:
+    """Translate ``chunk`` with retries; ``None`` means it should be split."""
     numbered_block = _format_entries(chunk)
     if not numbered_block:
         return list(chunk)
 
     expected_indices = [entry.index for entry in chunk]
+    chunk_draft_block = _filter_block_by_indices(draft_block, expected_indices)
     attempt_count = attempt
     reason = retry_reason
 
@@ -379,22 +646,27 @@ def _translate_chunk(
             attempt_count + 1,
         )
 
-        translated_text = _invoke_translation(
-            completions_api,
-            target_language=target_language,
-            numbered_block=numbered_block,
-            model=model,
-            first_index=chunk[0].index,
-            last_index=chunk[-1].index,
-            expected_count=len(expected_indices),
-            attempt=attempt_count,
-            retry_reason=reason,
-            stage=stage,
-            draft_block=_filter_block_by_indices(draft_block, expected_indices),
-            review_notes=review_notes,
-            full_context=full_context,
-            stats=stats,
-        )
+        if prefetched is not None:
+            # First attempt already answered (e.g. by the Batch API).
+            translated_text, prefetched = prefetched, None
+        else:
+            translated_text = _invoke_translation(
+                completions_api,
+                target_language=target_language,
+                numbered_block=numbered_block,
+                model=model,
+                first_index=chunk[0].index,
+                last_index=chunk[-1].index,
+                expected_count=len(expected_indices),
+                attempt=attempt_count,
+                retry_reason=reason,
+                stage=stage,
+                draft_block=chunk_draft_block,
+                review_notes=review_notes,
+                full_context=full_context,
+                stats=stats,
+                stream=stream,
+            )
 
         mapping: Optional[Dict[int, str]]
         try:
@@ -487,36 +759,7 @@ def _translate_chunk(
                 expected_indices[-1],
                 reason or "format mismatch",
             )
-            mid = max(1, len(chunk) // 2)
-            left = _translate_chunk(
-                chunk[:mid],
-                completions_api=completions_api,
-                target_language=target_language,
-                config=config,
-                model=model,
-                attempt=0,
-                retry_reason=None,
-                stage=stage,
-                draft_block=draft_block,
-                review_notes=review_notes,
-                full_context=full_context,
-                stats=stats,
-            )
-            right = _translate_chunk(
-                chunk[mid:],
-                completions_api=completions_api,
-                target_language=target_language,
-                config=config,
-                model=model,
-                attempt=0,
-                retry_reason=None,
-                stage=stage,
-                draft_block=draft_block,
-                review_notes=review_notes,
-                full_context=full_context,
-                stats=stats,
-            )
-            return left + right
+            return None
 
         stripped = (translated_text or "").strip()
         if not stripped:
@@ -536,6 +779,167 @@ def _translate_chunk(
         ]
 
 
+def _translate_chunk(
+    chunk: Sequence[SubtitleEntry],
+    *,
+    attempt: int = 0,
+    retry_reason: Optional[str] = None,
+    prefetched: Optional[str] = None,
+    **kwargs,
+) -> List[SubtitleEntry]:
+    # Chunks that keep failing are halved until they succeed or are single
+    # lines. A LIFO worklist keeps the left-to-right order of requests and
+    # results without recursing once per split.
+    pending = [(chunk, attempt, retry_reason, prefetched)]
+    translated: List[SubtitleEntry] = []
+    while pending:
+        current, current_attempt, current_reason, current_prefetched = pending.pop()
+        result = _translate_chunk_once(
+            current,
+            attempt=current_attempt,
+            retry_reason=current_reason,
+            prefetched=current_prefetched,
+            **kwargs,
+        )
+        if result is None:
+            mid = max(1, len(current) // 2)
+            pending.append((current[mid:], 0, None, None))
+            pending.append((current[:mid], 0, None, None))
+        else:
+            translated.extend(result)
+    return translated
+
+
+def _translate_all_chunks(
+    entries: Sequence[SubtitleEntry],
+    chunk_size: int,
+    *,
+    max_concurrency: int = 1,
+    contexts: Optional[Sequence[Optional[str]]] = None,
+    **chunk_kwargs,
+) -> List[SubtitleEntry]:
+    """Translate every chunk of ``entries`` and return the results in order.
+
+    With ``max_concurrency`` above one the chunk requests are submitted to a
+    thread pool together and only then awaited, so they overlap on the network.
+    ``contexts``, when given, supplies each chunk's ``full_context``.
+    """
+    chunks = list(_chunks(entries, chunk_size))
+    if contexts is None:
+        per_chunk = [chunk_kwargs] * len(chunks)
+    else:
+        per_chunk = [{**chunk_kwargs, "full_context": context} for context in contexts]
+    workers = min(max(1, int(max_concurrency)), len(chunks))
+    if workers <= 1:
+        return [
+            entry
+            for chunk, kwargs in zip(chunks, per_chunk)
+            for entry in _translate_chunk(chunk, **kwargs)
+        ]
+
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = [
+            executor.submit(_translate_chunk, chunk, **kwargs)
+            for chunk, kwargs in zip(chunks, per_chunk)
+        ]
+        results = [future.result() for future in futures]
+    return [entry for chunk_entries in results for entry in chunk_entries]
+
+
+def _run_batch_drafts(
+    client,
+    chunks: Sequence[Sequence[SubtitleEntry]],
+    *,
+    target_language: str,
+    model: str,
+    contexts: Sequence[Optional[str]],
+    stats: TranslationStats,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+) -> List[Optional[str]]:
+    """Send the first draft attempt of every chunk through the OpenAI Batch API.
+
+    Returns the raw response text per chunk, or ``None`` where the batch gave
+    no usable answer so the caller can fall back to a regular request.
+    """
+    results: List[Optional[str]] = [None] * len(chunks)
+    request_lines: List[str] = []
+    for position, chunk in enumerate(chunks):
+        numbered_block = _format_entries(chunk)
+        if not numbered_block:
+            continue
+        body = {
+            "model": model,
+            "temperature": 0.0,
+            "messages": _translation_messages(
+                target_language=target_language,
+                numbered_block=numbered_block,
+                first_index=chunk[0].index,
+                last_index=chunk[-1].index,
+                expected_count=len(chunk),
+                full_context=contexts[position],
+            ),
+        }
+        request_lines.append(
+            _json.dumps(
+                {
+                    "custom_id": f"chunk-{position}",
+                    "method": "POST",
+                    "url": _BATCH_ENDPOINT,
+                    "body": body,
+                }
+            )
+        )
+    if not request_lines:
+        return results
+
+    with_options = getattr(client, "with_options", None)
+    if with_options is not None:
+        client = with_options(max_retries=_BATCH_SDK_MAX_RETRIES)
+    upload = client.files.create(
+        file=("requests.jsonl", "\n".join(request_lines).encode("utf-8")),
+        purpose="batch",
+    )
+    batch = client.batches.create(
+        input_file_id=upload.id,
+        endpoint=_BATCH_ENDPOINT,
+        completion_window="24h",
+    )
+    LOGGER.info("Submitted translation batch %s with %d requests", batch.id, len(request_lines))
+
+    last_status: Optional[str] = None
+    while batch.status != "completed":
+        if batch.status in _BATCH_FAILED_STATUSES:
+            raise RuntimeError(f"Translation batch {batch.id} ended with status {batch.status}")
+        if batch.status != last_status:
+            last_status = batch.status
+            LOGGER.info("Translation batch %s status: %s", batch.id, batch.status)
+        time.sleep(poll_interval)
+        batch = client.batches.retrieve(batch.id)
+
+    if not batch.output_file_id:
+        return results
+    output = client.files.content(batch.output_file_id).text
+    for raw_line in output.splitlines():
+        if not raw_line.strip():
+            continue
+        record = _json.loads(raw_line)
+        custom_id = record.get("custom_id") or ""
+        if not custom_id.startswith("chunk-"):
+            continue
+        body = (record.get("response") or {}).get("body") or {}
+        usage = body.get("usage")
+        if usage:
+            stats.record("draft", SimpleNamespace(**usage))
+        try:
+            content = body["choices"][0]["message"]["content"]
+        except (KeyError, IndexError, TypeError):
+            continue
+        results[int(custom_id[len("chunk-"):])] = content
+    return results
+
+
 def _invoke_review(
     completions_api,
     *,
@@ -575,7 +979,8 @@ def _invoke_review(
             f"{full_context}\n"
         )
 
-    response = completions_api.create(
+    response = _create_with_retry(
+        completions_api,
         model=model,
         temperature=0.0,
         messages=[
@@ -586,6 +991,8 @@ def _invoke_review(
 
     if stats is not None:
         stats.record("review", getattr(response, "usage", None))
+        if getattr(response, "cached", False):
+            stats.record_cache_hit("review")
 
     try:
         return response.choices[0].message.content or ""
@@ -593,11 +1000,40 @@ def _invoke_review(
         raise ValueError("Unexpected review response format") from exc
 
 
+@lru_cache(maxsize=8)
+def _cached_openai_client(base_url: Optional[str], api_key: str) -> object:
+    """Build one OpenAI client per endpoint and key and reuse it across calls.
+
+    The client owns a pooled ``httpx.Client`` sized for concurrent chunk
+    requests, so repeated translations keep their connections alive instead
+    of paying a new TLS handshake each time. The SDK's own retries are turned
+    off because :func:`_create_with_retry` already retries these requests.
+    """
+    try:
+        import httpx
+        from openai import DefaultHttpxClient, OpenAI
+    except ModuleNotFoundError as exc:  # pragma: no cover
+        raise SystemExit(
+            "Missing dependency: openai\nInstall it with 'pip install openai' and retry."
+        ) from exc
+
+    limits = httpx.Limits(max_connections=64, max_keepalive_connections=32)
+    client_kwargs = {
+        "api_key": api_key,
+        "http_client": DefaultHttpxClient(limits=limits),
+        "max_retries": 0,
+    }
+    if base_url:
+        client_kwargs["base_url"] = base_url
+    return OpenAI(**client_kwargs)
+
+
 def _prepare_client(
     model: Optional[str],
     base_url: Optional[str],
     api_key: Optional[str],
     client: Optional[object],
+    stats: Optional[TranslationStats] = None,
 ) -> Tuple[object, str, object]:
     resolved_model = (
         model
@@ -608,17 +1044,7 @@ def _prepare_client(
     resolved_api_key = api_key or require_api_key(env_var=LLM_API_KEY_ENV)
 
     if client is None:
-        try:
-            from openai import OpenAI
-        except ModuleNotFoundError as exc:  # pragma: no cover
-            raise SystemExit(
-                "Missing dependency: openai\nInstall it with 'pip install openai' and retry."
-            ) from exc
-
-        client_kwargs = {"api_key": resolved_api_key}
-        if resolved_base_url:
-            client_kwargs["base_url"] = resolved_base_url
-        client = OpenAI(**client_kwargs)
+        client = _cached_openai_client(resolved_base_url, resolved_api_key)
 
     chat_completions = getattr(client, "chat", None)
     if chat_completions is None or not hasattr(chat_completions, "completions"):
@@ -628,6 +1054,17 @@ def _prepare_client(
     if not hasattr(completions_api, "create"):
         raise TypeError("chat.completions object must provide a create() method")
 
+    # The exact-match cache wraps the similarity cache, so identical requests
+    # never pay for an embedding lookup.
+    semantic_cache = semantic_cache_from_env(
+        client, on_usage=stats.record_embedding if stats is not None else None
+    )
+    if semantic_cache is not None:
+        completions_api = SemanticCachingCompletions(completions_api, semantic_cache)
+    cache = cache_from_env()
+    if cache is not None:
+        completions_api = CachingCompletions(completions_api, cache)
+
     return completions_api, resolved_model, client
 
 
@@ -642,45 +1079,111 @@ def translate_entries(
     client: Optional[object] = None,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     stats: Optional[TranslationStats] = None,
+    max_concurrency: int = 1,
+    batch_api: bool = False,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+    stream: bool = False,
+    full_context: bool = False,
 ) -> List[SubtitleEntry]:
-    """Translate subtitle entries to a target language while preserving timings."""
+    """Translate subtitle entries to a target language while preserving timings.
+
+    Chunks are translated one after another unless ``max_concurrency`` allows
+    several requests in flight at once. With ``batch_api`` the first attempt
+    for every chunk is submitted as one OpenAI Batch job (cheaper, but it may
+    take hours); retries for rejected answers still use regular requests.
+    ``stream`` requests streamed completions so the response text is read
+    while the model is still generating it. ``full_context`` also sends the
+    surrounding transcript with every chunk (see :func:`_chunk_contexts`),
+    at the cost of extra prompt tokens per request.
+    """
 
     if not entries:
         return []
 
-    if chunk_size <= 0:
-        chunk_size = len(entries)
-    else:
-        chunk_size = max(1, int(chunk_size))
+    chunk_size = _resolve_chunk_size(chunk_size, len(entries))
 
-    completions_api, resolved_model, _ = _prepare_client(
+    stats = stats or TranslationStats()
+    completions_api, resolved_model, resolved_client = _prepare_client(
         model,
         base_url,
         api_key,
         client,
+        stats,
     )
 
-    stats = stats or TranslationStats()
-    full_context = _format_entries_xml(entries)
-    translated_entries: List[SubtitleEntry] = []
+    contexts = _chunk_contexts(entries, chunk_size) if full_context else None
+
+    if batch_api:
+        return _translate_entries_batch_api(
+            entries,
+            chunk_size,
+            client=resolved_client,
+            completions_api=completions_api,
+            target_language=target_language,
+            config=config,
+            model=resolved_model,
+            contexts=contexts,
+            stats=stats,
+            poll_interval=poll_interval,
+        )
 
-    for chunk in _chunks(entries, chunk_size):
+    return _translate_all_chunks(
+        entries,
+        chunk_size,
+        max_concurrency=max_concurrency,
+        contexts=contexts,
+        completions_api=completions_api,
+        target_language=target_language,
+        config=config,
+        model=resolved_model,
+        stats=stats,
+        stream=stream,
+    )
+
+
+def _translate_entries_batch_api(
+    entries: Sequence[SubtitleEntry],
+    chunk_size: int,
+    *,
+    client,
+    completions_api,
+    target_language: str,
+    config: SubtitleConfig,
+    model: str,
+    contexts: Optional[Sequence[Optional[str]]],
+    stats: TranslationStats,
+    poll_interval: float = BATCH_POLL_INTERVAL,
+) -> List[SubtitleEntry]:
+    chunks = list(_chunks(entries, chunk_size))
+    if contexts is None:
+        contexts = [None] * len(chunks)
+    responses = _run_batch_drafts(
+        client,
+        chunks,
+        target_language=target_language,
+        model=model,
+        contexts=contexts,
+        stats=stats,
+        poll_interval=poll_interval,
+    )
+    translated_entries: List[SubtitleEntry] = []
+    for chunk, context, response in zip(chunks, contexts, responses):
         translated_entries.extend(
             _translate_chunk(
                 chunk,
                 completions_api=completions_api,
                 target_language=target_language,
                 config=config,
-                model=resolved_model,
-                full_context=full_context,
+                model=model,
+                full_context=context,
                 stats=stats,
+                prefetched=response,
             )
         )
-
     return translated_entries
 
 
-def translate_entries_with_review(
+async def atranslate_entries(
     entries: Sequence[SubtitleEntry],
     *,
     target_language: str,
@@ -691,44 +1194,116 @@ def translate_entries_with_review(
     client: Optional[object] = None,
     chunk_size: int = DEFAULT_CHUNK_SIZE,
     stats: Optional[TranslationStats] = None,
+    max_concurrency: int = DEFAULT_TRANSLATION_CONCURRENCY,
+    stream: bool = False,
+    full_context: bool = False,
 ) -> List[SubtitleEntry]:
-    """Translate with a draft-review-refine workflow to improve quality."""
+    """Async variant of :func:`translate_entries` that sends chunks concurrently.
+
+    Up to ``max_concurrency`` chunk requests are in flight at once; each runs
+    the same retry and validation logic as the synchronous path on a worker
+    thread, and results are returned in the original order.
+    """
 
     if not entries:
         return []
 
-    if chunk_size <= 0:
-        chunk_size = len(entries)
-    else:
-        chunk_size = max(1, int(chunk_size))
+    chunk_size = _resolve_chunk_size(chunk_size, len(entries))
 
+    stats = stats or TranslationStats()
     completions_api, resolved_model, _ = _prepare_client(
         model,
         base_url,
         api_key,
         client,
+        stats,
     )
 
-    stats = stats or TranslationStats()
-    full_context_plain = _format_entries(entries)
-    full_context_xml = _format_entries_xml(entries)
+    import asyncio  # Deferred: the synchronous entry points never need it.
 
-    draft_entries: List[SubtitleEntry] = []
-    for chunk in _chunks(entries, chunk_size):
-        draft_entries.extend(
-            _translate_chunk(
+    chunks = list(_chunks(entries, chunk_size))
+    contexts = (
+        _chunk_contexts(entries, chunk_size) if full_context else [None] * len(chunks)
+    )
+    semaphore = asyncio.Semaphore(max(1, int(max_concurrency)))
+
+    async def translate(
+        chunk: Sequence[SubtitleEntry], context: Optional[str]
+    ) -> List[SubtitleEntry]:
+        async with semaphore:
+            return await asyncio.to_thread(
+                _translate_chunk,
                 chunk,
                 completions_api=completions_api,
                 target_language=target_language,
                 config=config,
                 model=resolved_model,
-                stage="draft",
-                full_context=full_context_xml,
+                full_context=context,
                 stats=stats,
+                stream=stream,
             )
-        )
-    draft_block_plain = _format_entries(draft_entries)
-    draft_block_xml = _format_entries_xml(draft_entries)
+
+    results = await asyncio.gather(
+        *(translate(chunk, context) for chunk, context in zip(chunks, contexts))
+    )
+    return [entry for chunk_entries in results for entry in chunk_entries]
+
+
+def translate_entries_with_review(
+    entries: Sequence[SubtitleEntry],
+    *,
+    target_language: str,
+    config: SubtitleConfig,
+    model: Optional[str] = None,
+    base_url: Optional[str] = None,
+    api_key: Optional[str] = None,
+    client: Optional[object] = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    stats: Optional[TranslationStats] = None,
+    max_concurrency: int = 1,
+    stream: bool = False,
+) -> List[SubtitleEntry]:
+    """Translate with a draft-review-refine workflow to improve quality.
+
+    ``max_concurrency`` bounds how many chunks the draft and refine passes
+    send at once; the single review call always sits between them.
+    """
+
+    if not entries:
+        return []
+
+    chunk_size = _resolve_chunk_size(chunk_size, len(entries))
+
+    stats = stats or TranslationStats()
+    completions_api, resolved_model, _ = _prepare_client(
+        model,
+        base_url,
+        api_key,
+        client,
+        stats,
+    )
+
+    # Both source renderings share one pass of line joining.
+    source_texts = [_joined_text(entry) for entry in entries]
+    full_context_plain = _format_entries(entries, source_texts)
+    full_context_xml = _format_entries_xml(entries, source_texts)
+
+    draft_entries = _translate_all_chunks(
+        entries,
+        chunk_size,
+        max_concurrency=max_concurrency,
+        completions_api=completions_api,
+        target_language=target_language,
+        config=config,
+        model=resolved_model,
+        stage="draft",
+        full_context=full_context_xml,
+        stats=stats,
+        stream=stream,
+    )
+    draft_texts = [_joined_text(entry) for entry in draft_entries]
+    draft_block_plain = _format_entries(draft_entries, draft_texts)
+    draft_block_xml = _format_entries_xml(draft_entries, draft_texts)
     first_index = entries[0].index
     last_index = entries[-1].index
 
@@ -751,30 +1326,29 @@ def translate_entries_with_review(
         last_index,
     )
 
-    refined_entries: List[SubtitleEntry] = []
-    for chunk in _chunks(entries, chunk_size):
-        refined_entries.extend(
-            _translate_chunk(
-                chunk,
-                completions_api=completions_api,
-                target_language=target_language,
-                config=config,
-                model=resolved_model,
-                stage="refine",
-                draft_block=draft_block_xml,
-                review_notes=review_notes,
-                full_context=full_context_xml,
-                stats=stats,
-            )
-        )
-
-    return refined_entries
+    return _translate_all_chunks(
+        entries,
+        chunk_size,
+        max_concurrency=max_concurrency,
+        completions_api=completions_api,
+        target_language=target_language,
+        config=config,
+        model=resolved_model,
+        stage="refine",
+        draft_block=draft_block_xml,
+        review_notes=review_notes,
+        full_context=full_context_xml,
+        stats=stats,
+        stream=stream,
+    )
 
 
 __all__ = [
+    "DEFAULT_TRANSLATION_CONCURRENCY",
     "LLM_API_KEY_ENV",
     "LLM_BASE_URL_ENV",
     "LLM_MODEL_ENV",
+    "atranslate_entries",
     "translate_entries",
     "translate_entries_with_review",
     "TranslationStats",
@@ -1,11 +1,12 @@
 from __future__ import annotations
 
-import json
 from pathlib import Path
 from typing import Dict, List
 
 import pytest
 
+from sonioxsrt import _json
+
 
 @pytest.fixture(scope="session")
 def project_root() -> Path:
@@ -18,9 +19,13 @@ def sample_transcript_path(project_root: Path) -> Path:
 
 
 @pytest.fixture(scope="session")
-def sample_transcript(sample_transcript_path: Path) -> Dict[str, object]:
-    with sample_transcript_path.open("r", encoding="utf-8") as handle:
-        return json.load(handle)
+def sample_transcript_bytes(sample_transcript_path: Path) -> bytes:
+    return sample_transcript_path.read_bytes()
+
+
+@pytest.fixture(scope="session")
+def sample_transcript(sample_transcript_bytes: bytes) -> Dict[str, object]:
+    return _json.loads(sample_transcript_bytes)
 
 
 @pytest.fixture(scope="session")
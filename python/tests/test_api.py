@@ -1,11 +1,14 @@
 from __future__ import annotations
 
+import gzip
+import json
 import os
 from pathlib import Path
 
 import pytest
 
-from sonioxsrt.api import require_api_key
+from sonioxsrt import api
+from sonioxsrt.api import SonioxClient, require_api_key
 
 
 def test_require_api_key_reads_env_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
@@ -19,3 +22,369 @@ def test_require_api_key_reads_env_file(tmp_path: Path, monkeypatch: pytest.Monk
     assert os.environ["SONIOX_API_KEY"] == "test-from-file"
 
     monkeypatch.delenv("SONIOX_API_KEY", raising=False)
+
+
+def test_require_api_key_parses_env_file_without_dotenv(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    env_file = tmp_path / ".env"
+    env_file.write_text(
+        "# comment\nSONIOX_API_KEY = 'quoted-key'\nNOT A PAIR\nSONIOXSRT_TEST_EMPTY=\n",
+        encoding="utf-8",
+    )
+    monkeypatch.setattr(api, "load_dotenv", None)
+    monkeypatch.delenv("SONIOX_API_KEY", raising=False)
+    monkeypatch.delenv("SONIOXSRT_TEST_EMPTY", raising=False)
+
+    assert require_api_key(search_paths=[env_file]) == "quoted-key"
+    assert os.environ["SONIOXSRT_TEST_EMPTY"] == ""
+    assert api._parse_env_file.cache_info().currsize >= 1
+
+    monkeypatch.delenv("SONIOX_API_KEY", raising=False)
+    monkeypatch.delenv("SONIOXSRT_TEST_EMPTY", raising=False)
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code: int = 200) -> None:
+        self._payload = payload
+        self.status_code = status_code
+        self.text = str(payload)
+
+    def json(self):
+        return self._payload
+
+
+class FakeSession:
+    def __init__(self, responses) -> None:
+        self.responses = list(responses)
+        self.headers = {}
+        self.calls = []
+
+    def get(self, url, **kwargs):
+        self.calls.append((url, kwargs))
+        return self.responses.pop(0)
+
+
+def test_wait_for_completion_backs_off(monkeypatch: pytest.MonkeyPatch):
+    session = FakeSession(
+        [
+            FakeResponse({"status": "queued"}),
+            FakeResponse({"status": "queued"}),
+            FakeResponse({"status": "queued"}),
+            FakeResponse({"status": "processing"}),
+            FakeResponse({"status": "completed"}),
+        ]
+    )
+    sleeps = []
+    monkeypatch.setattr(api.time, "sleep", sleeps.append)
+    monkeypatch.setattr(api.random, "random", lambda: 0.5)  # Jitter factor of exactly 1.
+    client = SonioxClient(api_key="key", session=session)
+
+    client.wait_for_completion("tx-1", poll_interval=1.0, max_interval=3.0)
+
+    assert sleeps == [1.0, 2.0, 3.0, 1.0]
+    assert session.calls[0][1] == {"params": None, "timeout": None}
+
+
+def test_wait_for_completion_jitters_delays(monkeypatch: pytest.MonkeyPatch):
+    session = FakeSession([FakeResponse({"status": "queued"})] * 2 + [FakeResponse({"status": "completed"})])
+    sleeps = []
+    monkeypatch.setattr(api.time, "sleep", sleeps.append)
+    monkeypatch.setattr(api.random, "random", lambda: 1.0)
+    client = SonioxClient(api_key="key", session=session)
+
+    client.wait_for_completion("tx-1", poll_interval=2.0, backoff_factor=3.0, jitter=0.25)
+
+    assert sleeps == [2.5, 7.5]
+
+
+def test_wait_for_completion_async_polls_until_done():
+    import asyncio
+
+    httpx = pytest.importorskip("httpx")
+    statuses = {"tx-1": ["queued", "completed"], "tx-2": ["processing", "processing", "completed"]}
+    seen = []
+
+    def handler(request):
+        transcription_id = request.url.path.rsplit("/", 1)[-1]
+        seen.append((transcription_id, request.headers["Authorization"]))
+        return httpx.Response(200, json={"status": statuses[transcription_id].pop(0)})
+
+    client = SonioxClient(api_key="key", session=FakeSession([]))
+
+    async def run():
+        async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http_client:
+            await asyncio.gather(
+                *(
+                    client.wait_for_completion_async(
+                        transcription_id, http_client=http_client, poll_interval=0, jitter=0
+                    )
+                    for transcription_id in statuses
+                )
+            )
+
+    asyncio.run(run())
+
+    assert statuses == {"tx-1": [], "tx-2": []}
+    assert len(seen) == 5
+    assert {auth for _, auth in seen} == {"Bearer key"}
+
+
+def test_wait_for_all_retries_transient_poll_failures(monkeypatch: pytest.MonkeyPatch):
+    import asyncio
+
+    httpx = pytest.importorskip("httpx")
+    monkeypatch.setattr(api, "backoff_delays", lambda: iter([0.0] * 4))
+    replies = {
+        "tx-1": [httpx.ConnectError("reset"), 503, "completed"],
+        "tx-2": [httpx.ReadTimeout("slow")] * 5 + ["processing", "completed"],
+    }
+
+    def handler(request):
+        reply = replies[request.url.path.rsplit("/", 1)[-1]].pop(0)
+        if isinstance(reply, Exception):
+            raise reply
+        if isinstance(reply, int):
+            return httpx.Response(reply, text="busy")
+        return httpx.Response(200, json={"status": reply})
+
+    client = SonioxClient(api_key="key", session=FakeSession([]))
+    http_client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    client.wait_for_all(list(replies), poll_interval=0, jitter=0, http_client=http_client)
+    asyncio.run(http_client.aclose())
+
+    assert replies == {"tx-1": [], "tx-2": []}
+
+
+def test_wait_for_completion_long_poll_params(monkeypatch: pytest.MonkeyPatch):
+    session = FakeSession([FakeResponse({"status": "completed"})])
+    client = SonioxClient(api_key="key", session=session)
+
+    client.wait_for_completion("tx-1", long_poll_seconds=30)
+
+    assert session.calls[0][1] == {"params": {"wait": 30}, "timeout": 35}
+
+
+def test_client_session_uses_pooled_adapter_with_retries():
+    client = SonioxClient(api_key="key")
+    try:
+        adapter = client.session.get_adapter("https://api.soniox.com")
+        assert adapter._pool_maxsize == api.POOL_MAXSIZE
+        assert adapter.max_retries.total == 5
+        assert 503 in adapter.max_retries.status_forcelist
+        assert client.session.headers["Connection"] == "keep-alive"
+    finally:
+        client.close()
+
+
+def test_upload_file_streams_multipart_body(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    audio_path = tmp_path / "clip.wav"
+    audio_path.write_bytes(b"RIFF" + b"\x00" * 5000 + b"WAVE")
+    monkeypatch.setattr(api, "MultipartEncoder", None)
+    captured = {}
+
+    class UploadSession(FakeSession):
+        def post(self, url, **kwargs):
+            body = kwargs["data"]
+            captured["length"] = len(body)
+            captured["body"] = b"".join(iter(lambda: body.read(1024), b""))
+            captured["content_type"] = kwargs["headers"]["Content-Type"]
+            return FakeResponse({"id": "file-1"}, status_code=201)
+
+    client = SonioxClient(api_key="key", session=UploadSession([]))
+
+    assert client.upload_file(str(audio_path)) == "file-1"
+    body = captured["body"]
+    boundary = captured["content_type"].split("boundary=", 1)[1]
+    assert captured["length"] == len(body)
+    assert body.startswith(f"--{boundary}\r\n".encode())
+    assert b'filename="clip.wav"' in body
+    assert audio_path.read_bytes() in body
+    assert body.endswith(f"\r\n--{boundary}--\r\n".encode())
+
+
+def test_fetch_transcript_uses_disk_cache(tmp_path: Path):
+    class TranscriptResponse(FakeResponse):
+        content = b'{"tokens": [{"text": "hi"}]}'
+
+    session = FakeSession([TranscriptResponse({"tokens": [{"text": "hi"}]})])
+    client = SonioxClient(api_key="key", session=session)
+
+    first = client.fetch_transcript("tx-1", cache_dir=tmp_path)
+    second = client.fetch_transcript("tx-1", cache_dir=tmp_path)
+
+    assert first == second == {"tokens": [{"text": "hi"}]}
+    assert len(session.calls) == 1
+    assert (tmp_path / "tx-1.json").read_bytes() == TranscriptResponse.content
+
+
+def test_fetch_transcript_use_cache_defaults_per_endpoint(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(api, "DEFAULT_TRANSCRIPT_CACHE_DIR", tmp_path)
+
+    class TranscriptResponse(FakeResponse):
+        content = b'{"tokens": []}'
+
+    session = FakeSession([TranscriptResponse({"tokens": []})])
+    client = SonioxClient(api_key="key", session=session)
+    other = SonioxClient(api_key="key", base_url="https://eu.example", session=FakeSession([]))
+
+    client.fetch_transcript("tx-1", use_cache=True)
+    assert client.fetch_transcript("tx-1", use_cache=True) == {"tokens": []}
+    assert len(session.calls) == 1
+    assert (client.default_cache_dir() / "tx-1.json").exists()
+    assert other.default_cache_dir() != client.default_cache_dir()
+
+
+def test_httpx_backend_streams_upload_and_maps_timeouts(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    httpx = pytest.importorskip("httpx")
+    audio_path = tmp_path / "clip.wav"
+    audio_path.write_bytes(b"RIFF" + b"\x01" * 200_000 + b"WAVE")
+    monkeypatch.setattr(api, "MultipartEncoder", None)
+    seen = {}
+
+    def handler(request):
+        if request.url.path == "/v1/files":
+            seen["length"] = request.headers["Content-Length"]
+            seen["body"] = request.read()
+            seen["auth"] = request.headers["Authorization"]
+            return httpx.Response(201, json={"id": "file-1"})
+        raise httpx.ReadTimeout("slow", request=request)
+
+    monkeypatch.setattr(api.time, "sleep", lambda _: None)
+    client = SonioxClient(api_key="key", backend="httpx")
+    client.session._client = httpx.Client(
+        transport=httpx.MockTransport(handler), headers=client.session.headers
+    )
+
+    assert client.upload_file(str(audio_path)) == "file-1"
+    assert int(seen["length"]) == len(seen["body"])
+    assert audio_path.read_bytes() in seen["body"]
+    assert seen["auth"] == "Bearer key"
+    with pytest.raises(api.requests.Timeout):
+        client.session.get("https://api.soniox.com/v1/transcriptions/tx")
+    client.close()
+
+
+def test_httpx_backend_retries_transient_failures_on_idempotent_requests(
+    monkeypatch: pytest.MonkeyPatch,
+):
+    httpx = pytest.importorskip("httpx")
+    sleeps = []
+    monkeypatch.setattr(api.time, "sleep", sleeps.append)
+    calls = []
+
+    def handler(request):
+        calls.append(request.method)
+        if request.method == "POST":
+            return httpx.Response(503)
+        if len(calls) == 1:
+            raise httpx.ConnectError("reset", request=request)
+        if len(calls) == 2:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"status": "completed"})
+
+    client = SonioxClient(api_key="key", backend="httpx")
+    client.session._client = httpx.Client(transport=httpx.MockTransport(handler))
+
+    response = client.session.get("https://api.soniox.com/v1/transcriptions/tx")
+    assert response.json() == {"status": "completed"}
+    assert calls == ["GET", "GET", "GET"]
+    assert len(sleeps) == 2
+    assert client.session.post("https://api.soniox.com/v1/transcriptions").status_code == 503
+    assert calls.count("POST") == 1
+    client.close()
+
+
+def test_create_transcription_gzips_large_bodies_when_enabled():
+    posts = []
+
+    class PostSession(FakeSession):
+        def post(self, url, **kwargs):
+            posts.append(kwargs)
+            return FakeResponse({"id": "tx-1"}, status_code=201)
+
+    client = SonioxClient(api_key="key", session=PostSession([]), compress_requests=True)
+    context = {"context": "term " * api.GZIP_MIN_REQUEST_BYTES}
+
+    assert client.create_transcription(model="m", file_id="f") == "tx-1"
+    assert client.create_transcription(model="m", file_id="f", extra_options=context) == "tx-1"
+
+    assert posts[0] == {"json": {"model": "m", "file_id": "f"}}
+    assert posts[1]["headers"]["Content-Encoding"] == "gzip"
+    assert json.loads(gzip.decompress(posts[1]["data"])) == {"model": "m", "file_id": "f", **context}
+
+
+def test_client_instances_use_slots():
+    client = SonioxClient(api_key="key", session=FakeSession([]))
+
+    assert not hasattr(client, "__dict__")
+    with pytest.raises(AttributeError):
+        client.unexpected = True
+
+
+def test_unknown_backend_rejected():
+    with pytest.raises(ValueError):
+        SonioxClient(api_key="key", backend="curl")
+
+
+def test_transcribe_many_preserves_order_and_cleans_up(tmp_path: Path):
+    deleted = []
+
+    class StubClient(SonioxClient):
+        def upload_file(self, audio_path):
+            return f"file-{Path(audio_path).name}"
+
+        def create_transcription(self, *, model, file_id=None, audio_url=None, extra_options=None):
+            return f"tx-{file_id}"
+
+        def wait_for_completion(self, transcription_id, *, poll_interval):
+            return None
+
+        def fetch_transcript(self, transcription_id):
+            return {"id": transcription_id}
+
+        def delete_transcription(self, transcription_id):
+            deleted.append(transcription_id)
+
+        def delete_file(self, file_id):
+            deleted.append(file_id)
+
+    client = StubClient(api_key="key", session=FakeSession([]))
+    audio_paths = []
+    for name in ("a.wav", "b.wav", "c.wav"):
+        audio_paths.append(tmp_path / name)
+        audio_paths[-1].write_bytes(b"RIFF....WAVE")
+
+    results = client.transcribe_many(audio_paths, max_concurrency=2)
+
+    assert [result["id"] for result in results] == [
+        "tx-file-a.wav",
+        "tx-file-b.wav",
+        "tx-file-c.wav",
+    ]
+    assert sorted(deleted) == sorted(
+        ["tx-file-a.wav", "file-a.wav", "tx-file-b.wav", "file-b.wav", "tx-file-c.wav", "file-c.wav"]
+    )
+
+
+def test_stream_transcript_tokens_parses_incrementally():
+    pytest.importorskip("ijson")
+    body = b'{"id": "tx-1", "tokens": [{"text": "Hi", "start_ms": 0}, {"text": " there", "confidence": 0.5}]}'
+
+    class StreamingResponse(FakeResponse):
+        closed = False
+
+        def iter_content(self, chunk_size):
+            return (body[i : i + 7] for i in range(0, len(body), 7))
+
+        def close(self):
+            StreamingResponse.closed = True
+
+    session = FakeSession([StreamingResponse({})])
+    client = SonioxClient(api_key="key", session=session)
+
+    with client.stream_transcript_tokens("tx-1") as tokens:
+        collected = list(tokens)
+
+    assert collected == [{"text": "Hi", "start_ms": 0}, {"text": " there", "confidence": 0.5}]
+    assert session.calls[0][1] == {"stream": True}
+    assert StreamingResponse.closed
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import List
 
 import pytest
 
@@ -8,6 +9,18 @@ from sonioxsrt.cli import to_srt as to_srt_cli
 from sonioxsrt.cli import transcribe as transcribe_cli
 
 
+@pytest.fixture()
+def preparsed_input(
+    monkeypatch: pytest.MonkeyPatch, sample_transcript_path: Path, sample_tokens: List[dict]
+) -> Path:
+    """The sample transcript path, with the CLI handed the session's parsed tokens.
+
+    For tests that exercise translation wiring rather than transcript parsing.
+    """
+    monkeypatch.setattr(to_srt_cli, "_load_tokens", lambda path, *, use_cache: sample_tokens)
+    return sample_transcript_path
+
+
 def test_to_srt_cli_main(tmp_path: Path, sample_transcript_path: Path) -> None:
     output_path = tmp_path / "subtitles.srt"
     exit_code = to_srt_cli.main(
@@ -32,6 +45,38 @@ def test_to_srt_cli_main(tmp_path: Path, sample_transcript_path: Path) -> None:
     assert content[6] == "Music, radio, podcasts."
 
 
+def test_to_srt_cli_converts_several_inputs(tmp_path: Path, sample_transcript_bytes: bytes) -> None:
+    inputs = []
+    for name in ("first", "second"):
+        path = tmp_path / f"{name}.json"
+        path.write_bytes(sample_transcript_bytes)
+        inputs.append(str(path))
+    output_dir = tmp_path / "srt"
+
+    exit_code = to_srt_cli.main(["--input", *inputs, "--output-dir", str(output_dir), "--jobs", "2"])
+
+    assert exit_code == 0
+    first = (output_dir / "first.srt").read_text(encoding="utf-8")
+    assert first.startswith("1\n")
+    assert (output_dir / "second.srt").read_text(encoding="utf-8") == first
+
+    with pytest.raises(SystemExit):
+        to_srt_cli.main(["--input", *inputs, "--output", str(tmp_path / "ignored.srt")])
+    assert not (tmp_path / "ignored.srt").exists()
+
+
+def test_to_srt_cli_reuses_default_config() -> None:
+    parser = to_srt_cli.build_parser()
+
+    assert to_srt_cli._config_from_args(parser.parse_args([])) is to_srt_cli.DEFAULT_CONFIG
+    config = to_srt_cli._config_from_args(
+        parser.parse_args(["--max-cpl", "30", "--line-split-delimiters", ". !"])
+    )
+    assert config.max_cpl == 30
+    assert config.line_split_delimiters == (".", "!")
+    assert config.gap_ms == to_srt_cli.DEFAULT_CONFIG.gap_ms
+
+
 def test_transcribe_cli_requires_audio_file(tmp_path: Path) -> None:
     missing_path = tmp_path / "missing.wav"
     with pytest.raises(SystemExit):
@@ -67,7 +112,7 @@ def test_transcribe_cli_invokes_helper(tmp_path: Path, monkeypatch: pytest.Monke
     assert called["model"] == "demo-model"
 
 
-def test_to_srt_cli_translation_hook(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, sample_transcript_path: Path) -> None:
+def test_to_srt_cli_translation_hook(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, preparsed_input: Path) -> None:
     output_path = tmp_path / "translated.srt"
     captured = {}
 
@@ -86,7 +131,7 @@ def test_to_srt_cli_translation_hook(monkeypatch: pytest.MonkeyPatch, tmp_path:
     exit_code = to_srt_cli.main(
         [
             "--input",
-            str(sample_transcript_path),
+            str(preparsed_input),
             "--output",
             str(output_path),
             "--translate-to",
@@ -110,7 +155,55 @@ def test_to_srt_cli_translation_hook(monkeypatch: pytest.MonkeyPatch, tmp_path:
     assert captured["stats_calls"] == 1
 
 
-def test_to_srt_cli_translation_three_passes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, sample_transcript_path: Path) -> None:
+def test_to_srt_cli_passes_translation_options(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, preparsed_input: Path) -> None:
+    captured = {}
+
+    def fake_translate_entries(entries, **kwargs):
+        captured.update(kwargs)
+        return entries
+
+    monkeypatch.setattr(to_srt_cli, "translate_entries", fake_translate_entries)
+
+    exit_code = to_srt_cli.main(
+        [
+            "--input",
+            str(preparsed_input),
+            "--output",
+            str(tmp_path / "translated.srt"),
+            "--translate-to",
+            "Spanish",
+            "--llm-api-key",
+            "secret",
+            "--llm-concurrency",
+            "4",
+            "--full-context",
+        ]
+    )
+
+    assert exit_code == 0
+    assert captured["max_concurrency"] == 4
+    assert captured["full_context"] is True
+    assert "batch_api" not in captured
+
+
+def test_to_srt_cli_reads_llm_env_per_call(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, preparsed_input: Path) -> None:
+    models = []
+
+    def fake_translate_entries(entries, **kwargs):
+        models.append(kwargs["model"])
+        return entries
+
+    monkeypatch.setattr(to_srt_cli, "translate_entries", fake_translate_entries)
+    argv = ["--input", str(preparsed_input), "--output", str(tmp_path / "out.srt"), "--translate-to", "Spanish"]
+    for model in ("first-model", "second-model"):
+        monkeypatch.setenv(to_srt_cli.LLM_MODEL_ENV, model)
+        assert to_srt_cli.main(argv) == 0
+
+    assert models == ["first-model", "second-model"]
+    assert to_srt_cli._cached_parser() is to_srt_cli._cached_parser()
+
+
+def test_to_srt_cli_translation_three_passes(monkeypatch: pytest.MonkeyPatch, tmp_path: Path, preparsed_input: Path) -> None:
     output_path = tmp_path / "translated.srt"
     captured = {}
 
@@ -137,7 +230,7 @@ def test_to_srt_cli_translation_three_passes(monkeypatch: pytest.MonkeyPatch, tm
     exit_code = to_srt_cli.main(
         [
             "--input",
-            str(sample_transcript_path),
+            str(preparsed_input),
             "--output",
             str(output_path),
             "--translate-to",
@@ -153,3 +246,29 @@ def test_to_srt_cli_translation_three_passes(monkeypatch: pytest.MonkeyPatch, tm
     assert captured["model"] is None
     assert captured["count"] > 0
     assert captured["stats_calls"] == 3
+
+
+def test_to_srt_cli_reuses_token_cache(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch, sample_transcript_bytes: bytes
+) -> None:
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(to_srt_cli, "DEFAULT_TOKEN_CACHE_DIR", cache_dir)
+    input_path = tmp_path / "response.json"
+    input_path.write_bytes(sample_transcript_bytes)
+    output_path = tmp_path / "subtitles.srt"
+    args = ["--input", str(input_path), "--output", str(output_path), "--cache-tokens"]
+
+    assert to_srt_cli.main(args) == 0
+    (cache_path,) = cache_dir.iterdir()
+    assert cache_path.suffix == to_srt_cli.TOKEN_CACHE_SUFFIX
+    assert not list(tmp_path.glob("response.json.*"))
+    first = output_path.read_text(encoding="utf-8")
+
+    cached_mtime = cache_path.stat().st_mtime_ns
+    assert to_srt_cli.main(args) == 0
+    assert cache_path.stat().st_mtime_ns == cached_mtime
+    assert output_path.read_text(encoding="utf-8") == first
+
+    cache_path.write_bytes(b"\x80\x04garbage")
+    assert to_srt_cli.main(args) == 0
+    assert output_path.read_text(encoding="utf-8") == first
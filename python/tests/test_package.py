@@ -0,0 +1,10 @@
+from __future__ import annotations
+
+import sonioxsrt
+
+
+def test_public_names_resolve_lazily():
+    assert set(sonioxsrt.__all__) <= set(dir(sonioxsrt))
+    for name in sonioxsrt.__all__:
+        assert getattr(sonioxsrt, name) is not None
+    assert sonioxsrt.render_realtime_tokens is sonioxsrt.realtime.render_tokens
@@ -1,9 +1,18 @@
 """Unit tests for realtime transcription helpers."""
 
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from sonioxsrt import realtime
 from sonioxsrt.realtime import (
     RealTimeResult,
+    _RenderState,
     build_realtime_config,
     render_tokens,
+    run_realtime_session,
 )
 
 
@@ -26,6 +35,30 @@ def test_build_realtime_config_accepts_preview_v2_model() -> None:
     assert "context" in config
 
 
+def test_encoded_config_matches_build_and_reuses_template() -> None:
+    options = dict(
+        model="stt-rt-preview-v2",
+        audio_format="pcm_s16le",
+        sample_rate=16000,
+        num_channels=1,
+        language_hints=["en"],
+        enable_language_identification=False,
+        enable_speaker_diarization=True,
+        context=None,
+        enable_endpoint_detection=True,
+        translation={"type": "one_way", "target_language": "es"},
+        extra_options={"client_reference_id": "abc"},
+    )
+    realtime._config_template.cache_clear()
+
+    first = realtime._encode_realtime_config(api_key='key-"1"', **options)
+    second = realtime._encode_realtime_config(api_key="key-2", **options)
+
+    assert json.loads(first) == build_realtime_config(api_key='key-"1"', **options)
+    assert json.loads(second)["api_key"] == "key-2"
+    assert realtime._config_template.cache_info().hits == 1
+
+
 def test_render_tokens_renders_speaker_and_language_tags() -> None:
     final_tokens = [
         {"text": "Hello", "is_final": True, "speaker": "A", "language": "en"},
@@ -62,3 +95,147 @@ def test_realtime_result_to_transcript() -> None:
     assert transcript["tokens"] == result.final_tokens
     assert transcript["responses"] == [{"sequence_id": 1}]
     assert transcript["text"].strip().startswith("Hello")
+
+
+def test_incremental_render_matches_full_render() -> None:
+    tokens = [
+        {"text": "Hello", "speaker": "A", "language": "en"},
+        {"text": " there", "speaker": "A", "language": "en"},
+        {"text": " Hola", "speaker": "B", "language": "es"},
+        {"text": " amigo", "speaker": "B", "language": "es"},
+    ]
+    state = _RenderState()
+    for split in range(1, len(tokens) + 1):
+        state.extend(tokens[split - 1 : split])
+        preview = state.preview(tokens[split:])
+        assert preview == render_tokens(tokens[:split], tokens[split:])
+    assert state.preview(()) == render_tokens(tokens, ())
+    assert render_tokens((), ()) == ""
+
+
+class FakeWebSocket:
+    """Async websocket stand-in that replies once the audio stream has ended."""
+
+    def __init__(self, messages):
+        self.sent = []
+        self._messages = [json.dumps(message) for message in messages]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    async def send(self, data):
+        self.sent.append(data if isinstance(data, str) else bytes(data))
+
+    def __aiter__(self):
+        return self._replies()
+
+    async def _replies(self):
+        while "" not in self.sent:
+            await asyncio.sleep(0)
+        for message in self._messages:
+            yield message
+
+
+def test_run_realtime_session_streams_audio_and_collects_tokens(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    audio_path = tmp_path / "clip.raw"
+    audio = bytes(range(256)) * 40
+    audio_path.write_bytes(audio)
+    ws = FakeWebSocket(
+        [
+            {"tokens": [{"text": "Hello", "is_final": True}, {"text": " wor", "is_final": False}]},
+            {"tokens": [{"text": " world", "is_final": True}], "finished": True},
+        ]
+    )
+    monkeypatch.setattr(realtime, "connect", lambda url: ws)
+    updates = []
+
+    result = run_realtime_session(
+        audio_path,
+        api_key="dummy",
+        chunk_size=4096,
+        chunk_sleep=0,
+        on_update=lambda update: updates.append(update.text),
+    )
+
+    assert json.loads(ws.sent[0])["api_key"] == "dummy"
+    assert b"".join(ws.sent[1:-1]) == audio
+    assert ws.sent[-1] == ""
+    assert [token["text"] for token in result.final_tokens] == ["Hello", " world"]
+    assert updates[0].startswith("Hello wor")
+    assert result.text.startswith("Hello world")
+
+
+def test_run_realtime_session_asap_pace_sends_large_chunks(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    audio_path = tmp_path / "clip.raw"
+    audio_path.write_bytes(b"\x01" * (realtime.ASAP_AUDIO_CHUNK_SIZE + 10))
+    ws = FakeWebSocket([{"tokens": [], "finished": True}])
+    monkeypatch.setattr(realtime, "connect", lambda url: ws)
+
+    sleeps = []
+    real_sleep = asyncio.sleep
+
+    async def recording_sleep(seconds):
+        if seconds:
+            sleeps.append(seconds)
+        await real_sleep(0)
+
+    monkeypatch.setattr(realtime.asyncio, "sleep", recording_sleep)
+    result = run_realtime_session(
+        audio_path, api_key="dummy", pace="asap", collect_responses=False
+    )
+
+    assert sleeps == []
+    assert result.responses == []
+    assert [len(chunk) for chunk in ws.sent[1:-1]] == [realtime.ASAP_AUDIO_CHUNK_SIZE, 10]
+
+
+def test_run_realtime_session_coalesces_updates(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    audio_path = tmp_path / "clip.raw"
+    audio_path.write_bytes(b"\x00" * 16)
+    ws = FakeWebSocket(
+        [
+            {"tokens": [{"text": "a", "is_final": False}]},
+            {"tokens": [{"text": "ab", "is_final": False}]},
+            {"tokens": [{"text": "abc", "is_final": True}], "finished": True},
+        ]
+    )
+    monkeypatch.setattr(realtime, "connect", lambda url: ws)
+    updates = []
+
+    run_realtime_session(
+        audio_path,
+        api_key="dummy",
+        chunk_sleep=0,
+        on_update=lambda update: updates.append(update.text),
+        on_update_min_interval=60.0,
+    )
+
+    assert [text.splitlines()[0] for text in updates] == ["a", "abc"]
+
+
+def test_stream_audio_stops_quietly_when_server_closes(tmp_path: Path) -> None:
+    from websockets.exceptions import ConnectionClosedOK
+    from websockets.frames import Close
+
+    audio_path = tmp_path / "clip.raw"
+    audio_path.write_bytes(b"\x00" * 10)
+
+    class ClosedWebSocket:
+        sent = 0
+
+        async def send(self, data):
+            self.sent += 1
+            raise ConnectionClosedOK(Close(1000, ""), None)
+
+    ws = ClosedWebSocket()
+    asyncio.run(realtime._stream_audio(audio_path, ws, chunk_size=4, sleep_seconds=0))
+    assert ws.sent == 1
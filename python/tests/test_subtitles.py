@@ -4,13 +4,17 @@ from pathlib import Path
 
 import pytest
 
+from sonioxsrt import _json
 from sonioxsrt.subtitles import (
     SubtitleConfig,
     extract_tokens,
+    iter_render_segments,
+    load_tokens,
     render_segments,
     srt,
     tokens_to_subtitle_segments,
     write_srt_file,
+    _partition_chunks,
     _segment_text,
 )
 
@@ -47,13 +51,17 @@ def test_render_segments_and_write_srt(tmp_path: Path, sample_tokens):
         )
 
     output = tmp_path / "output.srt"
-    write_srt_file(entries, output)
+    assert write_srt_file(entries, output) == len(entries)
     content = output.read_text(encoding="utf-8").strip().splitlines()
 
     assert content[0] == "1"
     assert "-->" in content[1], "SRT timestamps missing arrow."
     assert content[2], "Subtitle text should not be empty."
 
+    streamed = tmp_path / "streamed.srt"
+    assert write_srt_file(iter_render_segments(segments, config), streamed) == len(entries)
+    assert streamed.read_bytes() == output.read_bytes()
+
 
 def test_render_segments_prefer_sentence_split(sample_tokens):
     config = SubtitleConfig(
@@ -77,40 +85,51 @@ def test_render_segments_prefer_sentence_split(sample_tokens):
     assert third.lines == ["Oh wow, look at this."]
 
 
-def test_render_segments_handles_halfwidth_japanese_period():
-    tokens = [
-        {"text": "ただいま", "start_ms": 0, "end_ms": 400},
-        {"text": "｡", "start_ms": 400, "end_ms": 420},
-        {"text": " おかえり", "start_ms": 600, "end_ms": 900},
-        {"text": "｡", "start_ms": 900, "end_ms": 920},
-    ]
+@pytest.mark.parametrize(
+    ("tokens", "expected"),
+    [
+        pytest.param(
+            [
+                {"text": "ただいま", "start_ms": 0, "end_ms": 400},
+                {"text": "｡", "start_ms": 400, "end_ms": 420},
+                {"text": " おかえり", "start_ms": 600, "end_ms": 900},
+                {"text": "｡", "start_ms": 900, "end_ms": 920},
+            ],
+            ["ただいま｡", "おかえり｡"],
+            id="halfwidth-japanese-period",
+        ),
+        pytest.param(
+            [
+                {"text": "女体化する。", "start_ms": 0, "end_ms": 500},
+                {"text": "変化が", "start_ms": 600, "end_ms": 900},
+                {"text": "始まる。", "start_ms": 900, "end_ms": 1200},
+            ],
+            ["女体化する。", "変化が始まる。"],
+            id="punctuation-embedded-in-token",
+        ),
+    ],
+)
+def test_render_segments_splits_on_cjk_sentence_enders(tokens, expected):
     config = SubtitleConfig(segment_on_sentence=True)
     segments = tokens_to_subtitle_segments(tokens, config)
     entries = render_segments(segments, config)
 
-    assert [entry.lines[0] for entry in entries[:2]] == ["ただいま｡", "おかえり｡"]
+    assert [entry.lines[0] for entry in entries] == expected
 
 
-def test_render_segments_splits_when_punctuation_embedded():
-    tokens = [
-        {"text": "女体化する。", "start_ms": 0, "end_ms": 500},
-        {"text": "変化が", "start_ms": 600, "end_ms": 900},
-        {"text": "始まる。", "start_ms": 900, "end_ms": 1200},
-    ]
-    config = SubtitleConfig(segment_on_sentence=True)
-    segments = tokens_to_subtitle_segments(tokens, config)
-    entries = render_segments(segments, config)
+def test_partition_chunks_prefers_short_leading_line():
+    chunks = ["Well,", "I think so,", "but not today."]
 
-    assert [entry.lines[0] for entry in entries] == ["女体化する。", "変化が始まる。"]
+    assert _partition_chunks(chunks, 1, 40) == ["Well, I think so, but not today."]
+    assert _partition_chunks(chunks, 2, 26) == ["Well,", "I think so, but not today."]
+    assert _partition_chunks(chunks, 3, 14) == ["Well,", "I think so,", "but not today."]
+    assert _partition_chunks(chunks, 2, 14) is None
+    assert _partition_chunks(chunks * 30, 2, 42) is None
 
-def test_extract_tokens_rejects_missing_tokens(tmp_path: Path):
-    bad_json_path = tmp_path / "bad.json"
-    bad_json_path.write_text('{"text": "hi"}', encoding="utf-8")
-
-    import json
 
+def test_extract_tokens_rejects_missing_tokens():
     with pytest.raises(ValueError):
-        extract_tokens(json.loads(bad_json_path.read_text(encoding="utf-8")))
+        extract_tokens({"text": "hi"})
 
 
 def test_extract_tokens_from_nested_transcript():
@@ -140,6 +159,44 @@ def test_extract_tokens_from_nested_transcript():
     assert [token["text"] for token in tokens] == ["Hello", " world", "!"]
 
 
+def test_extract_tokens_drops_empty_tokens():
+    tokens = [
+        {"text": "Hello", "start_ms": 0, "end_ms": 400},
+        {"text": "", "start_ms": 400, "end_ms": 400},
+        {"start_ms": 400},
+        {"text": " world", "start_ms": 400, "end_ms": 800},
+    ]
+    transcript = {"tokens": tokens}
+
+    assert [token["text"] for token in extract_tokens(transcript)] == ["Hello", " world"]
+    clean = [tokens[0], tokens[3]]
+    assert extract_tokens({"tokens": clean}) is clean
+
+
+def test_load_tokens_matches_extract_tokens(tmp_path: Path, sample_transcript, sample_transcript_path: Path):
+    streamed = load_tokens(sample_transcript_path)
+    # Compare public fields only: segmentation caches private keys on shared tokens.
+    assert [(t["text"], t.get("start_ms"), t.get("end_ms")) for t in streamed] == [
+        (t["text"], t.get("start_ms"), t.get("end_ms")) for t in extract_tokens(sample_transcript)
+    ]
+
+    nested = tmp_path / "nested.json"
+    nested.write_text(
+        '{"segments": [{"tokens": [{"text": "Hi"}, {"text": ""}, {"text": "!"}]}]}',
+        encoding="utf-8",
+    )
+    assert [token["text"] for token in load_tokens(nested)] == ["Hi", "!"]
+
+
+def test_load_file_matches_for_any_mmap_threshold(
+    monkeypatch: pytest.MonkeyPatch, sample_transcript_bytes: bytes, sample_transcript_path: Path
+):
+    expected = _json.loads(sample_transcript_bytes)
+    assert _json.load_file(sample_transcript_path) == expected
+    monkeypatch.setattr(_json, "MMAP_MIN_BYTES", 0)
+    assert _json.load_file(sample_transcript_path) == expected
+
+
 def test_srt_from_dict(tmp_path: Path, sample_transcript):
     output = tmp_path / "from_dict.srt"
     result_path = srt(sample_transcript, output_path=output)
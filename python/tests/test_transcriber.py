@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import pytest
 
@@ -11,6 +11,7 @@ from sonioxsrt.transcriber import (
     transcribe_audio,
     transcribe_audio_file,
     transcribe_audio_url,
+    transcribe_many_to_files,
     transcribe_to_file,
 )
 
@@ -19,6 +20,7 @@ class DummyClient:
     def __init__(self, transcript: Dict[str, Any]) -> None:
         self.transcript = transcript
         self.uploaded_path: Optional[str] = None
+        self.uploaded_paths: List[str] = []
         self.transcription_id = "tx-1"
         self.closed = False
         self.deleted_transcription: Optional[str] = None
@@ -30,6 +32,7 @@ class DummyClient:
 
     def upload_file(self, audio_path: str) -> str:
         self.uploaded_path = audio_path
+        self.uploaded_paths.append(audio_path)
         return "file-1"
 
     def create_transcription(
@@ -62,23 +65,24 @@ class DummyClient:
 
 
 @pytest.fixture()
-def dummy_client(sample_transcript: Dict[str, Any]) -> DummyClient:
-    return DummyClient(sample_transcript)
+def dummy_client(
+    sample_transcript: Dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> DummyClient:
+    """A fresh :class:`DummyClient` that transcriber helpers receive instead of a real client."""
+    dummy = DummyClient(sample_transcript)
 
-
-def _patch_client(monkeypatch: pytest.MonkeyPatch, dummy: DummyClient, own_client: bool = True) -> None:
     def fake_ensure_client(client=None, *, base_url=None):
         if client is not None:
             return client, False
-        return dummy, own_client
+        return dummy, True
 
     monkeypatch.setattr(transcriber, "_ensure_client", fake_ensure_client)
+    return dummy
 
 
-def test_transcribe_audio_file(tmp_path: Path, dummy_client: DummyClient, monkeypatch: pytest.MonkeyPatch):
+def test_transcribe_audio_file(tmp_path: Path, dummy_client: DummyClient):
     audio_path = tmp_path / "clip.wav"
     audio_path.write_bytes(b"RIFF....WAVE")
-    _patch_client(monkeypatch, dummy_client)
 
     result = transcribe_audio_file(audio_path=audio_path, client=None)
 
@@ -90,8 +94,7 @@ def test_transcribe_audio_file(tmp_path: Path, dummy_client: DummyClient, monkey
     assert dummy_client.closed is True
 
 
-def test_transcribe_audio_url(monkeypatch: pytest.MonkeyPatch, dummy_client: DummyClient):
-    _patch_client(monkeypatch, dummy_client)
+def test_transcribe_audio_url(dummy_client: DummyClient):
     result = transcribe_audio_url(audio_url="https://example.com/audio.mp3", client=None, keep_remote=True)
 
     assert result == dummy_client.transcript
@@ -100,9 +103,8 @@ def test_transcribe_audio_url(monkeypatch: pytest.MonkeyPatch, dummy_client: Dum
     assert dummy_client.deleted_transcription is None, "Resources retained when keep_remote=True."
 
 
-def test_transcribe_to_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dummy_client: DummyClient):
+def test_transcribe_to_file(tmp_path: Path, dummy_client: DummyClient):
     output_path = tmp_path / "response.json"
-    _patch_client(monkeypatch, dummy_client)
 
     result = transcribe_to_file(audio_url="https://example.com/audio.mp3", output_path=output_path)
 
@@ -110,6 +112,24 @@ def test_transcribe_to_file(tmp_path: Path, monkeypatch: pytest.MonkeyPatch, dum
     assert result == dummy_client.transcript
 
 
-def test_transcribe_audio_requires_input(monkeypatch: pytest.MonkeyPatch):
+def test_transcribe_many_to_files_shares_client_and_dedups(tmp_path: Path, dummy_client: DummyClient):
+    first = tmp_path / "a.wav"
+    second = tmp_path / "b.wav"
+    first.write_bytes(b"RIFF....WAVE")
+    second.write_bytes(b"RIFF....WAVE")
+    outputs = [tmp_path / f"out-{i}.json" for i in range(3)]
+
+    results = transcribe_many_to_files(
+        [(first, outputs[0]), (second, outputs[1]), (first, outputs[2])]
+    )
+
+    assert results == [dummy_client.transcript] * 3
+    assert sorted(dummy_client.uploaded_paths) == sorted([str(first.resolve()), str(second.resolve())])
+    for output in outputs:
+        assert json.loads(output.read_text(encoding="utf-8")) == dummy_client.transcript
+    assert dummy_client.closed is True
+
+
+def test_transcribe_audio_requires_input():
     with pytest.raises(ValueError):
         transcribe_audio()
@@ -1,12 +1,20 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
 from types import SimpleNamespace
 from typing import Iterable, List
 
 import pytest
 
 from sonioxsrt.subtitles import SubtitleConfig, SubtitleEntry
-from sonioxsrt.translation import translate_entries, translate_entries_with_review
+from sonioxsrt.translation import (
+    TranslationStats,
+    atranslate_entries,
+    translate_entries,
+    translate_entries_with_review,
+)
 
 
 class StubCompletions:
@@ -31,6 +39,28 @@ class StubClient:
         self.chat = SimpleNamespace(completions=self.completions)
 
 
+class StreamingCompletions:
+    """Return each response as a stream of content deltas plus a final usage chunk."""
+
+    def __init__(self, pieces: List[str]):
+        self.pieces = pieces
+        self.calls: List[dict] = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        chunks = [
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=piece))], usage=None)
+            for piece in self.pieces
+        ]
+        chunks.append(
+            SimpleNamespace(
+                choices=[],
+                usage=SimpleNamespace(prompt_tokens=7, completion_tokens=3, total_tokens=10),
+            )
+        )
+        return iter(chunks)
+
+
 def test_translate_entries_rewraps_and_preserves_indices():
     entries = [
         SubtitleEntry(index=1, start_ms=0, end_ms=1000, lines=["Hello there."]),
@@ -193,3 +223,444 @@ def test_translate_entries_with_review_runs_three_passes():
 
     refine_call = stub_client.completions.calls[2]
     assert "Existing translation" in refine_call["messages"][1]["content"]
+
+
+@pytest.mark.parametrize("use_async", [True, False])
+def test_translation_runs_chunks_concurrently(use_async: bool):
+    entries = [
+        SubtitleEntry(index=i, start_ms=i * 1000, end_ms=i * 1000 + 900, lines=[f"Line {i}"])
+        for i in range(1, 5)
+    ]
+    barrier = threading.Barrier(2, timeout=5)
+
+    class ConcurrentCompletions:
+        def __init__(self):
+            self.calls: List[dict] = []
+
+        def create(self, **kwargs):
+            self.calls.append(kwargs)
+            barrier.wait()  # Both chunks must be in flight at the same time.
+            content = kwargs["messages"][1]["content"]
+            block = content.split("Input numbered lines:\n")[1].split("\n\n")[0]
+            indices = [int(line.split()[0]) for line in block.splitlines()]
+            body = "".join(f"<line index=\"{i}\">Linha {i}</line>" for i in indices)
+            return SimpleNamespace(
+                choices=[SimpleNamespace(message=SimpleNamespace(content=f"<subtitles>{body}</subtitles>"))]
+            )
+
+    completions = ConcurrentCompletions()
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    kwargs = dict(
+        target_language="Portuguese",
+        config=SubtitleConfig(),
+        model="demo",
+        api_key="dummy",
+        client=client,
+        chunk_size=2,
+        max_concurrency=2,
+    )
+    if use_async:
+        translated = asyncio.run(atranslate_entries(entries, **kwargs))
+    else:
+        translated = translate_entries(entries, **kwargs)
+
+    assert [entry.lines for entry in translated] == [[f"Linha {i}"] for i in range(1, 5)]
+    assert len(completions.calls) == 2
+
+
+def test_llm_cache_serves_repeated_requests(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SONIOXSRT_LLM_CACHE", str(tmp_path / "llm"))
+    entries = [SubtitleEntry(index=1, start_ms=0, end_ms=1000, lines=["Hello"])]
+    response = "<subtitles><line index=\"1\">Olá</line></subtitles>"
+
+    first_client = StubClient([response])
+    translate_entries(
+        entries,
+        target_language="Portuguese",
+        config=SubtitleConfig(),
+        model="demo",
+        api_key="dummy",
+        client=first_client,
+    )
+
+    second_client = StubClient(["<subtitles><line index=\"1\">Oi</line></subtitles>"])
+    stats = TranslationStats()
+    translated = translate_entries(
+        entries,
+        target_language="Portuguese",
+        config=SubtitleConfig(),
+        model="demo",
+        api_key="dummy",
+        client=second_client,
+        stats=stats,
+    )
+
+    assert len(first_client.completions.calls) == 1
+    assert second_client.completions.calls == []
+    assert translated[0].lines == ["Olá"]
+    assert stats.cache_hits == 1
+    assert len(list((tmp_path / "llm").glob("*.json"))) == 1
+
+
+def test_translate_entries_batch_api_uses_batch_results():
+    entries = [
+        SubtitleEntry(index=i, start_ms=i * 1000, end_ms=i * 1000 + 900, lines=[f"Line {i}"])
+        for i in range(1, 5)
+    ]
+
+    class BatchFiles:
+        def __init__(self):
+            self.uploaded = b""
+
+        def create(self, *, file, purpose):
+            assert purpose == "batch"
+            self.uploaded = file[1]
+            return SimpleNamespace(id="file-in")
+
+        def content(self, file_id):
+            assert file_id == "file-out"
+            lines = []
+            for raw in self.uploaded.decode("utf-8").splitlines():
+                request = json.loads(raw)
+                content = request["body"]["messages"][1]["content"]
+                block = content.split("Input numbered lines:\n")[1].split("\n\n")[0]
+                body = "".join(
+                    f"<line index=\"{line.split()[0]}\">Linha {line.split()[0]}</line>"
+                    for line in block.splitlines()
+                )
+                lines.append(
+                    json.dumps(
+                        {
+                            "custom_id": request["custom_id"],
+                            "response": {
+                                "status_code": 200,
+                                "body": {
+                                    "choices": [
+                                        {"message": {"content": f"<subtitles>{body}</subtitles>"}}
+                                    ],
+                                    "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+                                },
+                            },
+                        }
+                    )
+                )
+            return SimpleNamespace(text="\n".join(lines))
+
+    class Batches:
+        def __init__(self):
+            self.polls = 0
+
+        def create(self, *, input_file_id, endpoint, completion_window):
+            assert input_file_id == "file-in"
+            return SimpleNamespace(id="batch-1", status="in_progress", output_file_id=None)
+
+        def retrieve(self, batch_id):
+            self.polls += 1
+            return SimpleNamespace(id=batch_id, status="completed", output_file_id="file-out")
+
+    completions = StubCompletions(["unused"])
+    client = SimpleNamespace(
+        chat=SimpleNamespace(completions=completions),
+        files=BatchFiles(),
+        batches=Batches(),
+    )
+    stats = TranslationStats()
+
+    translated = translate_entries(
+        entries,
+        target_language="Portuguese",
+        config=SubtitleConfig(),
+        model="demo",
+        api_key="dummy",
+        client=client,
+        chunk_size=2,
+        stats=stats,
+        batch_api=True,
+        poll_interval=0,
+    )
+
+    assert [entry.lines for entry in translated] == [[f"Linha {i}"] for i in range(1, 5)]
+    assert completions.calls == []
+    assert client.batches.polls == 1
+    assert stats.calls == 2 and stats.total_tokens == 30
+
+
+def test_translate_entries_streams_response():
+    entries = [SubtitleEntry(index=1, start_ms=0, end_ms=1000, lines=["Hello there"])]
+    pieces = ["<subtitles><line index=", "\"1\">Olá ", "a todos</line></subtitles>"]
+
+    completions = StreamingCompletions(pieces)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    stats = TranslationStats()
+
+    translated = translate_entries(
+        entries,
+        target_language="Portuguese",
+        config=SubtitleConfig(),
+        model="demo",
+        api_key="dummy",
+        client=client,
+        stats=stats,
+        stream=True,
+    )
+
+    assert translated[0].lines == ["Olá a todos"]
+    assert completions.calls[0]["stream"] is True
+    assert stats.total_tokens == 10
+
+
+def test_llm_cache_stores_streamed_responses(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SONIOXSRT_LLM_CACHE", str(tmp_path / "llm"))
+    entries = [SubtitleEntry(index=1, start_ms=0, end_ms=1000, lines=["Hello there"])]
+    pieces = ["<subtitles><line index=\"1\">Olá ", "a todos</line></subtitles>"]
+
+    def run():
+        completions = StreamingCompletions(pieces)
+        stats = TranslationStats()
+        translated = translate_entries(
+            entries,
+            target_language="Portuguese",
+            config=SubtitleConfig(),
+            model="demo",
+            api_key="dummy",
+            client=SimpleNamespace(chat=SimpleNamespace(completions=completions)),
+            stats=stats,
+            stream=True,
+        )
+        assert translated[0].lines == ["Olá a todos"]
+        return completions, stats
+
+    first, first_stats = run()
+    assert len(first.calls) == 1
+    assert first_stats.total_tokens == 10
+
+    second, second_stats = run()
+    assert second.calls == []
+    assert second_stats.cache_hits == 1
+
+
+def test_translation_retries_rate_limited_requests(monkeypatch: pytest.MonkeyPatch):
+    httpx = pytest.importorskip("httpx")
+    openai = pytest.importorskip("openai")
+    from sonioxsrt import translation
+
+    sleeps: List[float] = []
+    monkeypatch.setattr(translation.time, "sleep", sleeps.append)
+    request = httpx.Request("POST", "https://llm.example/v1/chat/completions")
+    rate_limited = openai.RateLimitError(
+        "slow down",
+        response=httpx.Response(429, headers={"retry-after": "2"}, request=request),
+        body=None,
+    )
+
+    class FlakyCompletions(StubCompletions):
+        def create(self, **kwargs):
+            if not self.calls:
+                self.calls.append(kwargs)
+                raise rate_limited
+            return super().create(**kwargs)
+
+    completions = FlakyCompletions(["<subtitles><line index=\"1\">Olá</line></subtitles>"])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+
+    translated = translate_entries(
+        [SubtitleEntry(index=1, start_ms=0, end_ms=1000, lines=["Hello"])],
+        target_language="Portuguese",
+        config=SubtitleConfig(),
+        model="demo",
+        api_key="dummy",
+        client=client,
+    )
+
+    assert translated[0].lines == ["Olá"]
+    assert len(completions.calls) == 2
+    assert sleeps == [2.0]
+
+
+def test_llm_retries_are_not_stacked_or_unbounded():
+    httpx = pytest.importorskip("httpx")
+    openai = pytest.importorskip("openai")
+    from sonioxsrt import translation
+
+    request = httpx.Request("POST", "https://llm.example/v1/chat/completions")
+    rate_limited = openai.RateLimitError(
+        "slow down",
+        response=httpx.Response(429, headers={"retry-after": "3600"}, request=request),
+        body=None,
+    )
+    assert translation._retry_after_seconds(rate_limited) == translation.LLM_BACKOFF_MAX
+
+    client = translation._cached_openai_client("https://llm.example/v1", "dummy")
+    assert client.max_retries == 0
+
+
+def test_translate_entries_full_context_is_opt_in():
+    entries = [
+        SubtitleEntry(index=i, start_ms=i * 1000, end_ms=i * 1000 + 900, lines=[f"Line {i}"])
+        for i in range(1, 5)
+    ]
+    responses = [
+        "<subtitles><line index=\"1\">A</line><line index=\"2\">B</line></subtitles>",
+        "<subtitles><line index=\"3\">C</line><line index=\"4\">D</line></subtitles>",
+    ]
+
+    def run(**kwargs):
+        stub_client = StubClient(responses)
+        translate_entries(
+            entries,
+            target_language="Portuguese",
+            config=SubtitleConfig(),
+            model="demo",
+            api_key="dummy",
+            client=stub_client,
+            chunk_size=2,
+            **kwargs,
+        )
+        return [call["messages"][0]["content"] for call in stub_client.completions.calls]
+
+    plain = run()
+    assert all("Full transcript context" not in system for system in plain)
+
+    with_context = run(full_context=True)
+    assert "Line 4" in with_context[0]
+    assert with_context[0] == with_context[1]
+
+
+def test_semantic_cache_reuses_near_identical_chunks(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SONIOXSRT_SEMANTIC_CACHE", str(tmp_path / "semantic"))
+    response = "<subtitles><line index=\"1\">Olá</line></subtitles>"
+
+    class Embeddings:
+        def create(self, *, model, input):
+            # Near-identical lines map to almost the same vector.
+            vector = [1.0, 0.01 * input.count("!")]
+            return SimpleNamespace(data=[SimpleNamespace(embedding=vector)])
+
+    def run(text: str) -> StubClient:
+        stub_client = StubClient([response])
+        stub_client.embeddings = Embeddings()
+        translated = translate_entries(
+            [SubtitleEntry(index=1, start_ms=0, end_ms=1000, lines=[text])],
+            target_language="Portuguese",
+            config=SubtitleConfig(),
+            model="demo",
+            api_key="dummy",
+            client=stub_client,
+        )
+        assert translated[0].lines == ["Olá"]
+        return stub_client
+
+    assert len(run("Hello").completions.calls) == 1
+    assert run("Hello!").completions.calls == []
+
+
+def test_semantic_cache_falls_back_when_embeddings_fail(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("SONIOXSRT_SEMANTIC_CACHE", "memory")
+    responses = [
+        "<subtitles><line index=\"1\">Olá</line></subtitles>",
+        "<subtitles><line index=\"2\">Tchau</line></subtitles>",
+    ]
+
+    class MissingEmbeddings:
+        def __init__(self):
+            self.calls = 0
+
+        def create(self, *, model, input):
+            self.calls += 1
+            raise RuntimeError("404 Not Found")
+
+    stub_client = StubClient(responses)
+    stub_client.embeddings = MissingEmbeddings()
+    entries = [
+        SubtitleEntry(index=1, start_ms=0, end_ms=1000, lines=["Hello"]),
+        SubtitleEntry(index=2, start_ms=1000, end_ms=2000, lines=["Bye"]),
+    ]
+    translated = translate_entries(
+        entries,
+        target_language="Portuguese",
+        config=SubtitleConfig(),
+        model="demo",
+        api_key="dummy",
+        client=stub_client,
+        chunk_size=1,
+    )
+
+    assert [entry.lines for entry in translated] == [["Olá"], ["Tchau"]]
+    assert len(stub_client.completions.calls) == 2
+    assert stub_client.embeddings.calls == 1
+
+
+def test_semantic_cache_embeds_once_per_request_across_retries(monkeypatch: pytest.MonkeyPatch):
+    httpx = pytest.importorskip("httpx")
+    openai = pytest.importorskip("openai")
+    from sonioxsrt import translation
+
+    monkeypatch.setenv("SONIOXSRT_SEMANTIC_CACHE", "memory")
+    monkeypatch.setattr(translation.time, "sleep", lambda _: None)
+    request = httpx.Request("POST", "https://llm.example/v1/chat/completions")
+    unavailable = openai.InternalServerError(
+        "busy", response=httpx.Response(503, request=request), body=None
+    )
+
+    class FlakyCompletions(StubCompletions):
+        def create(self, **kwargs):
+            if not self.calls:
+                self.calls.append(kwargs)
+                raise unavailable
+            return super().create(**kwargs)
+
+    class Embeddings:
+        def __init__(self):
+            self.calls = 0
+
+        def create(self, *, model, input):
+            self.calls += 1
+            return SimpleNamespace(
+                data=[SimpleNamespace(embedding=[1.0, 0.0])],
+                usage=SimpleNamespace(prompt_tokens=4, total_tokens=4),
+            )
+
+    completions = FlakyCompletions(["<subtitles><line index=\"1\">Olá</line></subtitles>"])
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions), embeddings=Embeddings())
+    stats = TranslationStats()
+    translate_entries(
+        [SubtitleEntry(index=1, start_ms=0, end_ms=1000, lines=["Hello"])],
+        target_language="Portuguese",
+        config=SubtitleConfig(),
+        model="demo",
+        api_key="dummy",
+        client=client,
+        stats=stats,
+    )
+
+    assert len(completions.calls) == 2
+    assert client.embeddings.calls == 1
+    assert (stats.embedding_calls, stats.embedding_tokens) == (1, 4)
+
+
+@pytest.mark.parametrize(
+    "line",
+    ["12. Olá", "7) texto", "3 - dois", "١٢ árabe", "4　全角", "5", "5x", "no number", "10:", ""],
+)
+def test_numbered_line_parsers_match_line_pattern(line: str):
+    from sonioxsrt.translation import _LINE_PATTERN, _parse_numbered_line, _scan_numbered_line
+
+    match = _LINE_PATTERN.match(line)
+    expected = (int(match.group("index")), match.group("text").strip()) if match else None
+    assert _parse_numbered_line(line) == expected
+    assert _scan_numbered_line(line) == expected
+
+
+def test_llm_cache_entries_expire_after_ttl(tmp_path, monkeypatch: pytest.MonkeyPatch):
+    from sonioxsrt import _llm_cache
+
+    now = [1000.0]
+    monkeypatch.setattr(_llm_cache.time, "time", lambda: now[0])
+    cache = _llm_cache.LLMCache(ttl=60)
+    cache.set("key", {"content": "Olá"})
+
+    now[0] += 30
+    assert cache.get("key") == {"content": "Olá"}
+    now[0] += 31
+    assert cache.get("key") is None